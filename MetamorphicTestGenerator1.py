@@ -1,6 +1,11 @@
 import random
 import math
-from typing import List
+from typing import List, Sequence
+
+from sequence_views import ConcatView, MappedView, SequenceView, scaled
+
+# 恒等 / 拼接 / 缩放类的变换返回只读视图（sequence_views），不复制输入；
+# 需要原地修改的变换（MR1 打乱、MR9 排序、MR11 替换、MR20 微调）仍然返回新的 list
 
 
 class MetamorphicTestGenerator1:
@@ -8,7 +13,7 @@ class MetamorphicTestGenerator1:
     # MR1: 数组元置换（打乱顺序）
     @staticmethod
     def applyMR1(input: List[int]) -> List[int]:
-        transformed = input.copy()
+        transformed = list(input)
         random.shuffle(transformed)
         return transformed
 
@@ -20,15 +25,13 @@ class MetamorphicTestGenerator1:
 
     # MR3_1: 加入单位元不变性（加法的单位元0）
     @staticmethod
-    def applyMR3_1(input: List[int]) -> List[int]:
-        transformed = input.copy() + [0]
-        return transformed
+    def applyMR3_1(input: List[int]) -> Sequence[int]:
+        return ConcatView(input, (0,))
 
     # MR3_2: 加入单位元不变性（乘法的单位元1）
     @staticmethod
-    def applyMR3_2(input: List[int]) -> List[int]:
-        transformed = input.copy() + [1]
-        return transformed
+    def applyMR3_2(input: List[int]) -> Sequence[int]:
+        return ConcatView(input, (1,))
 
     # MR4: 数组元素取倒数
     @staticmethod
@@ -38,9 +41,8 @@ class MetamorphicTestGenerator1:
 
     # MR5: 数组缩放变换
     @staticmethod
-    def applyMR5(input: List[int], constant: int) -> List[int]:
-        transformed = [x * constant for x in input]
-        return transformed
+    def applyMR5(input: List[int], constant: int) -> Sequence[int]:
+        return scaled(input, constant)
 
     # MR6: 数组反转变换
     @staticmethod
@@ -50,21 +52,18 @@ class MetamorphicTestGenerator1:
 
     # MR7_1: 所有元素乘以1
     @staticmethod
-    def applyMR7_1(input: List[int]) -> List[int]:
-        transformed = [x * 1 for x in input]
-        return transformed
+    def applyMR7_1(input: List[int]) -> Sequence[int]:
+        return MappedView(input, lambda x: x * 1)
 
     # MR7_2: 所有元素加0
     @staticmethod
-    def applyMR7_2(input: List[int]) -> List[int]:
-        transformed = [x + 0 for x in input]
-        return transformed
+    def applyMR7_2(input: List[int]) -> Sequence[int]:
+        return MappedView(input, lambda x: x + 0)
 
     # MR8: 重复输入数组
     @staticmethod
-    def applyMR8(input: List[int]) -> List[int]:
-        transformed = input.copy() + input.copy()
-        return transformed
+    def applyMR8(input: List[int]) -> Sequence[int]:
+        return ConcatView(input, input)
 
     # MR9: 复合转换一致性（缩放后再排序）
     @staticmethod
@@ -86,7 +85,7 @@ class MetamorphicTestGenerator1:
     # MR11: 边界值替换 (把最大值替换成0)
     @staticmethod
     def applyMR11(input: List[int]) -> List[int]:
-        transformed = input.copy()
+        transformed = list(input)
         if not transformed:
             return transformed
         max_val = max(transformed)
@@ -123,19 +122,17 @@ class MetamorphicTestGenerator1:
 
     # MR16: 重复值稳健性（复制第一个元素）
     @staticmethod
-    def applyMR16(input: List[int]) -> List[int]:
+    def applyMR16(input: List[int]) -> Sequence[int]:
         if not input:
             return []
-        transformed = input.copy() + [input[0]]
-        return transformed
+        return ConcatView(input, (input[0],))
 
     # MR19: 输入重复（元素a重复多次插入）
     @staticmethod
-    def applyMR19(input: List[int], count: int) -> List[int]:
+    def applyMR19(input: List[int], count: int) -> Sequence[int]:
         if not input:
             return []
-        transformed = input.copy() + [input[0]] * count
-        return transformed
+        return ConcatView(input, (input[0],) * count)
 
     # MR20: 边界值灵敏度（给最小值增加一个极小值）
     @staticmethod
@@ -151,5 +148,5 @@ class MetamorphicTestGenerator1:
 
     # MR22: 应用恒等变换
     @staticmethod
-    def applyMR22(input: List[int]) -> List[int]:
-        return input.copy()
+    def applyMR22(input: List[int]) -> Sequence[int]:
+        return SequenceView(input)
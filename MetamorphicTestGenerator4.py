@@ -1,14 +1,19 @@
-import copy
 import random
 import math
 
+from sequence_views import ConcatView, MappedView, SequenceView, scaled
+
+# 恒等 / 拼接 / 缩放类的变换返回只读视图（sequence_views），不复制输入；
+# bi_SearchFromTo 只按下标读取，视图上的每次访问都是 O(1)（拼接视图为 O(log 片段数)）。
+# 需要原地修改的变换（MR1 打乱、MR9 排序、MR11 替换）仍然复制成 list
+
 
 class MetamorphicTestGenerator4:
 
     # MR1: 数组元素置换（打乱顺序）
     @staticmethod
     def applyMR1(input_list):
-        transformed = copy.deepcopy(input_list)
+        transformed = list(input_list)
         random.shuffle(transformed)
         return transformed
 
@@ -20,12 +25,12 @@ class MetamorphicTestGenerator4:
     # MR3_1: 加入单位元不变性（加法的单位元0）
     @staticmethod
     def applyMR3_1(input_list):
-        return input_list + [0.0]
+        return ConcatView(input_list, (0.0,))
 
     # MR3_2: 加入单位元不变性（乘法的单位元1）
     @staticmethod
     def applyMR3_2(input_list):
-        return input_list + [1.0]
+        return ConcatView(input_list, (1.0,))
 
     # MR4: 数组元素取倒数
     @staticmethod
@@ -41,7 +46,7 @@ class MetamorphicTestGenerator4:
     # MR5: 数组缩放变换
     @staticmethod
     def applyMR5(input_list, constant):
-        return [x * constant for x in input_list]
+        return scaled(input_list, constant)
 
     # MR6: 数组反转变换
     @staticmethod
@@ -51,17 +56,17 @@ class MetamorphicTestGenerator4:
     # MR7_1: 中立操作的恒等变换（所有元素乘以1）
     @staticmethod
     def applyMR7_1(input_list):
-        return [x * 1 for x in input_list]
+        return MappedView(input_list, lambda x: x * 1)
 
     # MR7_2: 中立操作的恒等变换（所有元素加上0）
     @staticmethod
     def applyMR7_2(input_list):
-        return [x + 0 for x in input_list]
+        return MappedView(input_list, lambda x: x + 0)
 
     # MR8: 重复输入数组
     @staticmethod
     def applyMR8(input_list):
-        return input_list + input_list
+        return ConcatView(input_list, input_list)
 
     # MR9: 复合转换一致性
     @staticmethod
@@ -83,7 +88,7 @@ class MetamorphicTestGenerator4:
     # MR11: 边界值替换（把最大值替换成0）
     @staticmethod
     def applyMR11(input_list):
-        transformed = copy.deepcopy(input_list)
+        transformed = list(input_list)
         max_index = transformed.index(max(transformed))
         transformed[max_index] = 0.0
         return transformed
@@ -112,21 +117,20 @@ class MetamorphicTestGenerator4:
     # MR16: 重复值稳健性（复制输入中的一个元素）
     @staticmethod
     def applyMR16(input_list):
-        return input_list + [input_list[0]]
+        return ConcatView(input_list, (input_list[0],))
 
     # MR19: 输入重复（元素复制）将元素a重复多次插入序列中
     @staticmethod
     def applyMR19(input_list, count):
-        return input_list + [input_list[0]] * count
+        return ConcatView(input_list, (input_list[0],) * count)
 
     # MR20: 边界值灵敏度（给最小值增加一个极小值）
     @staticmethod
     def applyMR20(input_list):
-        transformed = input_list[:]
-        min_val = min(transformed)
-        return [x + 1e-10 if x == min_val else x for x in transformed]
+        min_val = min(input_list)
+        return [x + 1e-10 if x == min_val else x for x in input_list]
 
     # MR22: 应用恒等变换
     @staticmethod
     def applyMR22(input_list):
-        return input_list[:]
+        return SequenceView(input_list)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+同一个有序数组反复做窗口查找：bi_SearchFromTo 逐个调用 vs. EytzingerIndex（预先构建的层序布局索引）。
+
+每个规模生成一个有序 int 数组和 QUERIES 个 key（约一半命中），窗口为整个数组，比较：
+- bi-loop        : 逐个 key 调用 bi_SearchFromTo(list, ...)
+- eytz-loop      : 逐个 key 调用 EytzingerIndex.search
+- eytz-dropin    : 逐个 key 调用 eytzinger_SearchFromTo(list, ...)（窗口索引第一次调用时构建并缓存，校验时已建好）
+- bi-batch       : bi_SearchFromTo_batch(NumPy 数组, keys, ...)（需要 NumPy）
+- eytz-batch     : EytzingerIndex.search_batch(keys, ...)（需要 NumPy）
+先校验各实现的结果（未命中时完全相同；命中时指向相等的元素），再计时；构建索引的时间单独列出。
+
+    python benchmarks/bench_eytzinger.py                 # 10^3 .. 10^6
+    python benchmarks/bench_eytzinger.py --max-exp 7 --queries 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_sut import measure
+from bi_SearchFromTo import bi_SearchFromTo, bi_SearchFromTo_batch
+from eytzinger_index import EytzingerIndex, eytzinger_SearchFromTo
+
+try:
+    import numpy as np
+except ImportError:  # 批量用例跳过
+    np = None
+
+QUERIES = 10000
+
+
+def make_input(n, queries, seed):
+    rng = random.Random(seed)
+    elements = sorted(rng.randrange(4 * n) for _ in range(n))
+    keys = [rng.choice(elements) if rng.random() < 0.5 else rng.randrange(-1, 4 * n + 1) for _ in range(queries)]
+    return elements, keys
+
+
+def check(elements, expected, got, name):
+    for want, res in zip(expected, got):
+        res = int(res)
+        if want < 0 and res != want or want >= 0 and (res < 0 or elements[res] != elements[want]):
+            raise AssertionError(f"{name}: expected {want}, got {res}")
+
+
+def bench_size(n, queries, seed, repeat, min_time):
+    elements, keys = make_input(n, queries, seed)
+    to = n - 1
+    t = time.perf_counter()
+    index = EytzingerIndex(elements)
+    build = time.perf_counter() - t
+    runs = {
+        "bi-loop": lambda: [bi_SearchFromTo(elements, k, 0, to) for k in keys],
+        "eytz-loop": lambda: [index.search(k, 0, to) for k in keys],
+        "eytz-dropin": lambda: [eytzinger_SearchFromTo(elements, k, 0, to) for k in keys],
+    }
+    if np is not None:
+        arr = np.asarray(elements, dtype=np.int64)
+        karr = np.asarray(keys, dtype=np.int64)
+        runs["bi-batch"] = lambda: bi_SearchFromTo_batch(arr, karr, 0, to)
+        runs["eytz-batch"] = lambda: index.search_batch(karr, 0, to)
+    expected = runs["bi-loop"]()
+    for name, run in runs.items():
+        check(elements, expected, run(), name)
+    timings = {name: measure(run, repeat, min_time) for name, run in runs.items()}
+    return build, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=6)
+    parser.add_argument("--queries", type=int, default=QUERIES, help=f"每次测量的查找次数（默认 {QUERIES}）")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if np is None:
+        print("NumPy 未安装，跳过 *-batch 用例")
+    print(f"{'n':>10} {'build':>10} {'case':<12} {'per query':>12} {'vs bi-loop':>10}")
+    for e in range(args.min_exp, args.max_exp + 1):
+        n = 10 ** e
+        build, timings = bench_size(n, args.queries, args.seed, args.repeat, args.min_time)
+        base = timings["bi-loop"]
+        for name, seconds in timings.items():
+            print(f"{n:>10} {build * 1e3:>8.1f}ms {name:<12} {seconds / args.queries * 1e9:>10.0f}ns "
+                  f"{base / seconds:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
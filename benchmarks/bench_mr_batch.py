@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+对比 MetamorphicTestGenerator1 逐列表推导式 与 MetamorphicBatchGenerator1 批量向量化 的变换耗时。
+
+MetamorphicTestGenerator1 的部分变换（MR5 / MR7_1 / MR7_2 / MR8）返回惰性视图（sequence_views），
+构建视图几乎不花时间，元素要到 SUT 迭代时才计算；"逐列表" 一列在计时区间内把视图展开成 list，
+与批量版本一样计入生成全部后续输入的耗时。
+
+用法：python benchmarks/bench_mr_batch.py [--inputs 10000] [--length 20] [--ragged] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import numpy as np
+from MetamorphicTestGenerator1 import MetamorphicTestGenerator1 as Single
+from MetamorphicBatchGenerator1 import MetamorphicBatchGenerator1 as Batch, to_ragged
+
+MRS = [
+    ("MR2", Single.applyMR2, Batch.applyMR2),
+    ("MR5", lambda x: Single.applyMR5(x, 2), lambda b, o=None: Batch.applyMR5(b, 2, o)),
+    ("MR6", Single.applyMR6, Batch.applyMR6),
+    ("MR7_1", Single.applyMR7_1, Batch.applyMR7_1),
+    ("MR7_2", Single.applyMR7_2, Batch.applyMR7_2),
+    ("MR8", Single.applyMR8, Batch.applyMR8),
+    ("MR9", lambda x: Single.applyMR9(x, 3), lambda b, o=None: Batch.applyMR9(b, 3, o)),
+    ("MR10", Single.applyMR10, Batch.applyMR10),
+    ("MR12", Single.applyMR12, Batch.applyMR12),
+    ("MR13", Single.applyMR13, Batch.applyMR13),
+    ("MR20", Single.applyMR20, Batch.applyMR20),
+]
+
+
+def materialize(transformed):
+    """视图展开成 list；本来就是 list 的结果原样返回，不额外复制"""
+    return transformed if type(transformed) is list else list(transformed)
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inputs", type=int, default=10000, help="输入个数")
+    parser.add_argument("--length", type=int, default=20, help="每个输入的长度（--ragged 时为最大长度）")
+    parser.add_argument("--ragged", action="store_true", help="使用不等长批量 (values, offsets)")
+    parser.add_argument("--repeat", type=int, default=3, help="每项取 N 次中的最好成绩")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    if args.ragged:
+        inputs = [[rng.randint(-100, 100) for _ in range(rng.randint(0, args.length))] for _ in range(args.inputs)]
+        batch_args = to_ragged(inputs)
+    else:
+        inputs = [[rng.randint(-100, 100) for _ in range(args.length)] for _ in range(args.inputs)]
+        batch_args = (np.array(inputs, dtype=np.int64),)
+
+    print(f"{args.inputs} 个输入，{'最大' if args.ragged else ''}长度 {args.length}，"
+          f"{'不等长' if args.ragged else '二维'}批量，best of {args.repeat}")
+    print(f"{'MR':<6} {'逐列表(ms)':>12} {'批量(ms)':>12} {'加速比':>8}")
+    for name, single, batched in MRS:
+        t_single = best_of(args.repeat, lambda: [materialize(single(x)) for x in inputs])
+        t_batch = best_of(args.repeat, lambda: batched(*batch_args))
+        print(f"{name:<6} {t_single * 1e3:>12.2f} {t_batch * 1e3:>12.2f} {t_single / t_batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
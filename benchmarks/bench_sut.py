@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+add_values / bi_SearchFromTo 的大输入压力测试与基准。
+
+扫描：
+- 输入规模 10^min-exp .. 10^max-exp（默认 10 .. 10^6；--max-exp 8 可到 10^8，list 形式约需数 GB 内存）
+- 元素容器：int / float 的 list、array.array（'q' / 'd'）、memoryview、NumPy 数组（未安装 NumPy 时跳过）
+- bi_SearchFromTo：查找窗口（全部 / 一半 / 64 个元素）× 命中率（1.0 / 0.5 / 0.0），每次测量 QUERIES 个 key
+每个用例先校验结果（add_values 与参考求和比较，二分查找校验命中下标 / 插入点），再计时：
+自动确定循环次数使单次测量不短于 --min-time，取 --repeat 次中的最好成绩。
+
+基准文件（JSON）：
+    python benchmarks/bench_sut.py --save                        # 写入 benchmarks/baselines/bench_sut.json
+    python benchmarks/bench_sut.py --compare                     # 与基准比较，变慢超过 --threshold 时退出码为 1
+    python benchmarks/bench_sut.py --quick --compare --threshold 0.5
+基准与机器有关，不入库；换机器后先 --save 一次。
+"""
+import argparse
+import array
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from add_values import add_values
+from bi_SearchFromTo import bi_SearchFromTo
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 用例跳过
+    np = None
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "bench_sut.json")
+# 每次测量的查找次数
+QUERIES = 1000
+# 比基准慢不到这么多秒（每次调用）的差异视为噪声，不算回归（规模很小的用例只有几微秒）
+NOISE_FLOOR_S = 2e-6
+WINDOWS = ("full", "half", "w64")
+HIT_RATIOS = (1.0, 0.5, 0.0)
+
+
+# ---------------- 输入 ----------------
+def _containers():
+    """{容器名: (元素类型, 由 list 构造容器的函数)}"""
+    kinds = {
+        "int-list": ("int", lambda xs: xs),
+        "float-list": ("float", lambda xs: xs),
+        "array-q": ("int", lambda xs: array.array("q", xs)),
+        "array-d": ("float", lambda xs: array.array("d", xs)),
+        "memoryview-q": ("int", lambda xs: memoryview(array.array("q", xs))),
+    }
+    if np is not None:
+        kinds["numpy-int64"] = ("int", lambda xs: np.array(xs, dtype=np.int64))
+        kinds["numpy-float64"] = ("float", lambda xs: np.array(xs, dtype=np.float64))
+    return kinds
+
+
+def sum_values(n, elem, seed=0):
+    rng = random.Random(seed)
+    if elem == "int":
+        return [rng.randint(-1000, 1000) for _ in range(n)]
+    return [rng.uniform(-1000.0, 1000.0) for _ in range(n)]
+
+
+def sorted_values(n, elem):
+    """偶数 0, 2, 4, ...：偶数 key 命中，奇数 key 不命中"""
+    if elem == "int":
+        return list(range(0, 2 * n, 2))
+    return [float(x) for x in range(0, 2 * n, 2)]
+
+
+def window(n, kind, rng):
+    if kind == "full":
+        return 0, n - 1
+    if kind == "half":
+        return n // 4, (n // 4 + n // 2 - 1 if n > 1 else 0)
+    width = min(64, n)
+    lo = rng.randint(0, n - width)
+    return lo, lo + width - 1
+
+
+def search_keys(n, froom, to, hit_ratio, elem, rng, count=QUERIES):
+    """count 个 key，其中约 hit_ratio 的比例落在窗口内且存在，其余是窗口内的奇数（不存在）"""
+    cast = int if elem == "int" else float
+    keys = []
+    for _ in range(count):
+        i = rng.randint(froom, to)
+        keys.append(cast(2 * i if rng.random() < hit_ratio else 2 * i + 1))
+    return keys
+
+
+# ---------------- 校验 ----------------
+def check_sum(result, values, elem):
+    if elem == "int":
+        expected = sum(values)
+        ok = int(result) == expected
+    else:
+        expected = math.fsum(values)
+        ok = math.isclose(float(result), expected, rel_tol=1e-9, abs_tol=1e-6 * max(1, len(values)))
+    if not ok:
+        raise AssertionError(f"add_values returned {result!r}, expected {expected!r}")
+
+
+def check_search(elements, key, froom, to, result):
+    if result >= 0:
+        if not (froom <= result <= to and elements[result] == key):
+            raise AssertionError(f"bi_SearchFromTo({key!r}, {froom}, {to}) returned bad hit {result}")
+        return
+    point = -result - 1
+    if not froom <= point <= to + 1:
+        raise AssertionError(f"bi_SearchFromTo({key!r}, {froom}, {to}) returned bad insertion point {point}")
+    if (point > froom and not elements[point - 1] < key) or (point <= to and not elements[point] > key):
+        raise AssertionError(f"bi_SearchFromTo({key!r}, {froom}, {to}) insertion point {point} is not ordered")
+
+
+# ---------------- 计时 ----------------
+def measure(fn, repeat=3, min_time=0.05):
+    """每次调用的耗时（秒）：自动确定循环次数，取 repeat 次中的最好成绩；计时期间与 timeit 一样关闭 GC"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = 1
+        while True:
+            t = time.perf_counter()
+            for _ in range(number):
+                fn()
+            elapsed = time.perf_counter() - t
+            if elapsed >= min_time or number >= 1 << 20:
+                break
+            number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+        best = elapsed / number
+        for _ in range(repeat - 1):
+            t = time.perf_counter()
+            for _ in range(number):
+                fn()
+            best = min(best, (time.perf_counter() - t) / number)
+        return best
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def iter_cases(sizes, containers, suts=("add_values", "bi_SearchFromTo"), seed=0):
+    """(用例名, 准备函数)；准备函数返回 (校验函数, 计时函数, 每次调用处理的单位数)"""
+    for n in sizes:
+        for cname, (elem, build) in containers.items():
+            if "add_values" in suts:
+                def prepare(n=n, elem=elem, build=build):
+                    values = sum_values(n, elem, seed)
+                    data = build(values)
+                    return (lambda: check_sum(add_values(data), values, elem)), (lambda: add_values(data)), n
+                yield f"add_values/{cname}/n={n}", prepare
+            if "bi_SearchFromTo" in suts:
+                for wkind in WINDOWS:
+                    for hit in HIT_RATIOS:
+                        def prepare(n=n, elem=elem, build=build, wkind=wkind, hit=hit):
+                            rng = random.Random(seed)
+                            elements = build(sorted_values(n, elem))
+                            froom, to = window(n, wkind, rng)
+                            keys = search_keys(n, froom, to, hit, elem, rng)
+
+                            def verify():
+                                for key in keys:
+                                    check_search(elements, key, froom, to, bi_SearchFromTo(elements, key, froom, to))
+
+                            def run():
+                                for key in keys:
+                                    bi_SearchFromTo(elements, key, froom, to)
+
+                            return verify, run, len(keys)
+                        yield f"bi_SearchFromTo/{cname}/n={n}/{wkind}/hit={hit}", prepare
+
+
+# ---------------- 基准 ----------------
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "numpy": getattr(np, "__version__", None),
+    }
+
+
+def save_baseline(results, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"meta": machine_info(), "results": results}, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def load_baseline(path):
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(results, baseline, threshold, noise_floor=NOISE_FLOOR_S):
+    """
+    [(用例名, 基准秒, 当前秒, 比值)]：只列出变慢超过 threshold（0.25 = 慢 25%）的用例，
+    且绝对差值大于 noise_floor；只在一边出现的用例不比较
+    """
+    regressions = []
+    for case, entry in sorted(results.items()):
+        base = baseline.get(case)
+        if base is None:
+            continue
+        now, before = entry["seconds"], base["seconds"]
+        if before > 0 and now > before * (1 + threshold) and now - before > noise_floor:
+            regressions.append((case, before, now, now / before))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-exp", type=int, default=1, help="最小规模 10^N（默认 1）")
+    parser.add_argument("--max-exp", type=int, default=6, help="最大规模 10^N（默认 6，最大 8）")
+    parser.add_argument("--quick", action="store_true", help="只跑 10 .. 10^4，适合提交前检查")
+    parser.add_argument("--sut", choices=("add_values", "bi_SearchFromTo"), action="append",
+                        help="只跑某个被测函数（可重复）")
+    parser.add_argument("--container", action="append", help="只跑某种容器（可重复），例如 int-list")
+    parser.add_argument("--filter", default="", help="只跑名字包含该子串的用例")
+    parser.add_argument("--repeat", type=int, default=3, help="每项取 N 次中的最好成绩")
+    parser.add_argument("--min-time", type=float, default=0.05, help="单次测量的最短时间（秒）")
+    parser.add_argument("--no-check", action="store_true", help="不校验结果，只计时")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="把结果写入基准文件")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="与基准文件比较")
+    parser.add_argument("--threshold", type=float, default=0.25, help="变慢超过该比例即判为回归（默认 0.25）")
+    args = parser.parse_args(argv)
+
+    max_exp = min(args.max_exp, 4) if args.quick else args.max_exp
+    if not 0 <= args.min_exp <= max_exp <= 8:
+        parser.error("need 0 <= --min-exp <= --max-exp <= 8")
+    sizes = [10 ** e for e in range(args.min_exp, max_exp + 1)]
+    containers = _containers()
+    if args.container:
+        unknown = set(args.container) - set(containers)
+        if unknown:
+            parser.error(f"unknown container(s): {', '.join(sorted(unknown))}; available: {', '.join(containers)}")
+        containers = {k: v for k, v in containers.items() if k in args.container}
+    if np is None:
+        print("NumPy 未安装，跳过 numpy-* 用例")
+
+    results = {}
+    print(f"{'case':<52} {'per call':>12} {'per unit':>12}")
+    for case, prepare in iter_cases(sizes, containers, tuple(args.sut or ("add_values", "bi_SearchFromTo")), args.seed):
+        if args.filter not in case:
+            continue
+        verify, run, units = prepare()
+        if not args.no_check:
+            verify()
+        seconds = measure(run, args.repeat, args.min_time)
+        results[case] = {"seconds": seconds, "units": units}
+        print(f"{case:<52} {seconds * 1e6:>10.2f}us {seconds / units * 1e9:>10.2f}ns")
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\n基准已写入 {args.save}")
+
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except OSError:
+            print(f"\n没有基准文件 {args.compare}，先用 --save 生成")
+            return 1
+        regressions = compare(results, baseline["results"], args.threshold)
+        shared = len(set(results) & set(baseline["results"]))
+        if regressions:
+            print(f"\n❌ {len(regressions)}/{shared} 个用例比基准慢超过 {args.threshold:.0%}：")
+            for case, before, now, ratio in regressions:
+                print(f"  {case:<52} {before * 1e6:>10.2f}us -> {now * 1e6:>10.2f}us ({ratio:.2f}x)")
+            return 1
+        print(f"\n✅ {shared} 个用例均未超过基准的 {1 + args.threshold:.2f} 倍")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,124 +1,220 @@
 # conftest.py
-import os, json, re
+import os, json, re, time
 from pathlib import Path
 import pytest
 
+try:
+    from pytest_check import check_log as _check_log
+except ImportError:  # 没装 pytest_check 时只走 reprcrash / 文本解析
+    _check_log = None
+
+# tests/test_failure_log.py 用 pytester 在临时目录中运行带本 conftest 的会话
+pytest_plugins = ["pytester"]
+
 LOG_DIR = Path("pytest_mutant_logs")
 LOG_DIR.mkdir(exist_ok=True)
 
+# 每个 pytest 会话一个追加写入的 JSONL 文件，每行一条失败记录；
+# 常驻会话（run_mutants_inprocess.py）中所有 mutant 共用一个文件，按 mutant_id 区分
+_log_fd = None
+_log_path = None
+
+
 def _first_nonempty(lines):
     for l in lines:
         if l and l.strip():
             return l.strip()
     return None
 
-@pytest.hookimpl(hookwrapper=True)
+
+def _open_log():
+    global _log_fd, _log_path
+    if _log_fd is None:
+        name = f"failures_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.jsonl"
+        _log_path = LOG_DIR / name
+        _log_fd = os.open(_log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    return _log_fd
+
+
+def _write_record(record):
+    # 单次 os.write 写一整行（O_APPEND），多个进程写同一个文件也不会交错
+    try:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        os.write(_open_log(), line.encode("utf-8"))
+    except Exception:
+        pass
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mr-profile", default=None,
+        help="只运行 mr_profiles.json 中该档位的 MR（例如 fast）；等同于设置环境变量 MR_PROFILE",
+    )
+
+
+def pytest_configure(config):
+    # MREngine 通过 mr_subset.active_mrs() 读取环境变量，所以在收集之前写入
+    profile = config.getoption("--mr-profile")
+    if profile:
+        os.environ["MR_PROFILE"] = profile
+    if not config.pluginmanager.has_plugin("mr_failure_log_writer"):
+        config.pluginmanager.register(_FailureLogWriter(), "mr_failure_log_writer")
+
+
+def pytest_sessionfinish(session):
+    global _log_fd
+    if _log_fd is not None:
+        os.close(_log_fd)
+        _log_fd = None
+
+
+def pytest_terminal_summary(terminalreporter):
+    # MR 引擎的 SUT 记忆缓存命中情况（见 sut_memo.py）；没有经过引擎的会话不打印
+    from sut_memo import MEMO
+    stats = MEMO.stats()
+    if stats["hits"] or stats["misses"]:
+        terminalreporter.write_line(
+            f"SUT memo: {stats['hits']} hits / {stats['misses']} misses "
+            f"({stats['hit_rate']:.1%}), {stats['bypassed']} bypassed, {stats['evictions']} evicted"
+        )
+
+
+_check_line_re = re.compile(r'FAILURE:\s*(?:\x1b\[[0-9;]*m)?\s*(.*)')
+_mr_re = re.compile(r'(MR[0-9A-Za-z_\-]+(?:_\d+)?)\s*failed', re.IGNORECASE)
+
+
+def _split_check_failure(failure):
+    """
+    pytest_check 的一条失败（"FAILURE: check 15 == 0: MR2 failed\n<伪 traceback>"）
+    -> (断言表达式, MR 原因)
+    """
+    head = failure.split("\n", 1)[0]
+    m = _check_line_re.match(head)
+    body = m.group(1) if m else head
+    expr, _, msg = body.rpartition(": ")
+    if not expr:
+        expr, msg = body, ""
+    if expr.startswith("check "):
+        expr = expr[len("check "):]
+    mr = _mr_re.search(msg) or _mr_re.search(body)
+    return expr.strip(), (mr.group(0) if mr else msg.strip() or None)
+
+
+def _mr_name(reason):
+    """"MR2 failed" -> "MR2"；不是 MR 检查的失败返回 None"""
+    m = _mr_re.search(reason) if reason else None
+    return m.group(1) if m else None
+
+
+def _text_fields(longrepr_text, record):
+    """回退：只有 longrepr 文本时用正则补齐缺失的字段（原有的解析逻辑）"""
+    m_check = re.search(r'FAILURE:\s*(check\s+(.+?)\s*:\s*(MR[0-9A-Za-z_\-]+|.+))', longrepr_text, re.IGNORECASE)
+    if m_check:
+        record["assert_expr"] = record["assert_expr"] or m_check.group(2).strip()
+        mr = _mr_re.search(longrepr_text)
+        if mr:
+            record["failure_reason"] = record["failure_reason"] or mr.group(0)
+        record["exc_type"] = record["exc_type"] or "check"
+        record["exc_msg"] = record["exc_msg"] or m_check.group(2).strip()
+
+    lines = None
+    if not record["assert_expr"]:
+        lines = longrepr_text.splitlines()
+        for l in lines:
+            ls = l.strip()
+            if ls.startswith("E       assert") or ls.startswith("assert "):
+                record["assert_expr"] = re.sub(r'^E\s*', '', ls)
+                break
+
+    if not record["exc_type"]:
+        lines = lines if lines is not None else longrepr_text.splitlines()
+        last_nonempty = _first_nonempty(lines[-5:])
+        if last_nonempty:
+            m3 = re.search(r'([A-Za-z_0-9]+Error|Exception|AssertionError|Failure|FAILURE)(?:\:)?\s*(.*)', last_nonempty)
+            if m3:
+                record["exc_type"] = m3.group(1)
+                record["exc_msg"] = record["exc_msg"] or (m3.group(2).strip() if m3.group(2) else None)
+
+
+_record_key = pytest.StashKey()
+
+
+class _FailureLogWriter:
+    """
+    最外层的 makereport wrapper：pytest_check 把 check 失败拼进 longrepr 之后才写出记录，
+    longrepr 字段与原来逐文件写出时相同（完整的 longreprtext，换行转义成 \\n）
+    """
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        record = item.stash.get(_record_key, None)
+        if record is None:
+            return
+        del item.stash[_record_key]
+        rep = outcome.get_result()
+        longrepr_text = getattr(rep, "longreprtext", None) or str(getattr(rep, "longrepr", ""))
+        record["longrepr"] = longrepr_text.replace("\n", "\\n")
+        _write_record(record)
+
+
+# trylast 且在 pytest_check 之后注册：本 wrapper 位于 pytest_check 的 wrapper 之内，
+# 先于它拿到报告，此时 check 失败还在 check_log 里（尚未被拼进 longrepr 并清空）；
+# 字段提取完后交给 _FailureLogWriter 在最外层写出
+@pytest.hookimpl(hookwrapper=True, trylast=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
+    if rep.when != "call":
+        return
+    check_failures = _check_log.get_failures() if _check_log is not None else []
     # 只关注测试执行阶段的失败
-    if rep.when == "call" and rep.failed:
-        mutant_id = os.environ.get("MUTANT_ID", "unknown")
-        nodeid = item.nodeid
+    if not (rep.failed or check_failures):
+        return
+
+    # file / line 是测试用例自己的位置：MR 检查都在 mr_registry 的引擎里执行，
+    # traceback 的最后一帧对所有失败都相同，区分不了失败；哪条 MR 失败记在 mr 字段
+    path, lineno, _ = item.location
+    record = {
+        "mutant_id": os.environ.get("MUTANT_ID", "unknown"),
+        "nodeid": item.nodeid,
+        "file": path,
+        "line": lineno + 1 if lineno is not None else None,
+        "mr": None,
+        "assert_expr": None,
+        "failure_reason": None,
+        "exc_type": None,
+        "exc_msg": None,
+    }
+
+    # 1) 异常 / pytest.fail：直接取 reprcrash 的结构化字段
+    reprcrash = getattr(rep.longrepr, "reprcrash", None) if rep.failed else None
+    if reprcrash is not None:
+        if reprcrash.message:
+            record["exc_msg"] = reprcrash.message
+            if call.excinfo is not None:
+                # 异常类型直接取自 excinfo（裸 assert 的 reprcrash 消息里没有类型名）
+                record["exc_type"] = call.excinfo.typename
+            else:
+                exc_type, sep, _ = reprcrash.message.partition(":")
+                record["exc_type"] = exc_type.strip() if sep and exc_type.strip().isidentifier() else "Failed"
+            mr = _mr_re.search(reprcrash.message)
+            if mr:
+                record["failure_reason"] = mr.group(0)
+
+    # 2) pytest_check：每条失败的第一行就是 "check <表达式>: <消息>"
+    if check_failures:
+        checks = [_split_check_failure(f) for f in check_failures]
+        record["checks"] = [{"mr": _mr_name(r), "assert_expr": e, "failure_reason": r} for e, r in checks]
+        record["assert_expr"] = record["assert_expr"] or checks[0][0]
+        record["failure_reason"] = record["failure_reason"] or next((r for _, r in checks if r), None)
+        record["exc_type"] = record["exc_type"] or "check"
+        record["exc_msg"] = record["exc_msg"] or checks[0][0]
+
+    # 3) 只有在结构化字段不够时才回退到文本解析
+    if rep.failed and reprcrash is None and not check_failures:
         longrepr_text = getattr(rep, "longreprtext", None) or str(getattr(rep, "longrepr", ""))
+        _text_fields(longrepr_text, record)
 
-        # 默认字段
-        file = None
-        line = None
-        assert_expr = None
-        failure_reason = None
-        exc_type = None
-        exc_msg = None
-
-        # 1) 若 longrepr 是 pytest 对象，尝试用其属性抽取
-        lr_obj = getattr(rep, "longrepr", None)
-        try:
-            reprcrash = getattr(lr_obj, "reprcrash", None)
-            if reprcrash:
-                p = getattr(reprcrash, "path", None)
-                ln = getattr(reprcrash, "lineno", None)
-                if p:
-                    file = str(p)
-                if ln:
-                    try:
-                        line = int(ln)
-                    except Exception:
-                        pass
-                msg = getattr(reprcrash, "message", None)
-                if msg:
-                    exc_msg = str(msg)
-                    m = re.match(r'([A-Za-z_0-9]+)(?:\:)?\s*(.*)', exc_msg)
-                    if m:
-                        exc_type = m.group(1)
-        except Exception:
-            pass
-
-        # 2) 回退到文本解析：File "path", line N
-        if not file or not line:
-            m = re.search(r'File \"([^\"]+)\", line (\d+)', longrepr_text)
-            if m:
-                file = file or m.group(1)
-                try:
-                    line = line or int(m.group(2))
-                except Exception:
-                    pass
-
-        # 3) 回退到简短格式： path:lineno: ...
-        if not file or not line:
-            m2 = re.search(r'([^\s:][^:\n]+):(\d+)(?:[:\s]|$)', longrepr_text)
-            if m2:
-                file = file or m2.group(1)
-                try:
-                    line = line or int(m2.group(2))
-                except Exception:
-                    pass
-
-        # 4) 识别 check / 自定义输出 (例如 "FAILURE: check 15 == 0: MR2 failed")
-        m_check = re.search(r'FAILURE:\s*(check\s+(.+?)\s*:\s*(MR[0-9A-Za-z_\-]+|.+))', longrepr_text, re.IGNORECASE)
-        if m_check:
-            maybe_expr = m_check.group(2).strip()
-            assert_expr = maybe_expr
-            if re.search(r'MR[0-9A-Za-z_\-]+', longrepr_text, re.IGNORECASE):
-                mr = re.search(r'(MR[0-9A-Za-z_\-]+(?:_\d+)?)\s*failed', longrepr_text, re.IGNORECASE)
-                if mr:
-                    failure_reason = mr.group(0)
-            exc_type = exc_type or "check"
-            exc_msg = exc_msg or maybe_expr
-
-        # 5) 若没 extract 出断言，尝试寻找 assert 行或 "E       assert ..." 或 "assert "
-        if not assert_expr:
-            for l in longrepr_text.splitlines():
-                ls = l.strip()
-                if ls.startswith("E       assert") or ls.startswith("assert "):
-                    assert_expr = re.sub(r'^E\s*', '', ls)
-                    break
-
-        # 6) 若还没 exc_type, 尝试从最后几行解析异常类型
-        if not exc_type:
-            last_nonempty = _first_nonempty(longrepr_text.splitlines()[-5:])
-            if last_nonempty:
-                m3 = re.search(r'([A-Za-z_0-9]+Error|Exception|AssertionError|Failure|FAILURE)(?:\:)?\s*(.*)', last_nonempty)
-                if m3:
-                    exc_type = m3.group(1)
-                    if not exc_msg:
-                        exc_msg = m3.group(2).strip() if m3.group(2) else None
-
-        record = {
-            "mutant_id": mutant_id,
-            "nodeid": nodeid,
-            "file": file,
-            "line": line,
-            "assert_expr": assert_expr,
-            "failure_reason": failure_reason,
-            "exc_type": exc_type,
-            "exc_msg": exc_msg,
-            "longrepr": longrepr_text.replace("\n","\\n")
-        }
-
-        safe_node = nodeid.replace("/", "__").replace("::", "__").replace(":", "_")
-        out_path = LOG_DIR / f"{mutant_id}__{safe_node}.json"
-        try:
-            with open(out_path, "w", encoding="utf-8") as fh:
-                json.dump(record, fh, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+    record["mr"] = _mr_name(record["failure_reason"])
+    item.stash[_record_key] = record
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+逐条 MR 的耗时与杀死归属统计。
+
+设置环境变量 MR_METRICS=<jsonl 路径> 后，mr_registry.MREngine 每执行一条 MR 就通过
+record_time / record_check 记录（按 mutant、按 MR）：
+- 变换耗时：MR 的 transform 调用时间
+- SUT 耗时：对变换后输入调用被测函数的时间算在这条 MR 上，对原输入的调用算在 "original" 上
+- 通过 / 失败次数：输出关系的检查结果（完整模式与 kill 模式都记录）
+未设置 MR_METRICS 时 record_* 直接返回，引擎也不计时。
+
+mutant 名取自环境变量 MUTANT_ID（run_mutants_inprocess.py、run_one_mutant.sh、test_mutants_runner.py 都会设置）。
+统计在进程内累加，flush() 时每个 (mutant, MR) 追加一行 JSON；进程退出时自动 flush。
+
+报告：python mr_metrics.py <jsonl 路径>
+按 "独占杀死数 / 毫秒" 给 MR 排序——只有这条 MR 能杀死的 mutant 数除以它在全部 mutant 上的总耗时。
+kill 模式只检查到第一条违反的 MR，独占杀死数会偏高，做取舍时应使用完整模式的数据。
+"""
+import atexit
+import json
+import os
+import sys
+
+ORIGINAL = "original"
+
+
+def mutant_id():
+    return os.environ.get("MUTANT_ID", "")
+
+
+class MRMetrics:
+    def __init__(self, path=None):
+        self.path = path
+        self.stats = {}
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def _entry(self, mr):
+        key = (mutant_id(), mr)
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = {"transform_s": 0.0, "sut_s": 0.0, "sut_calls": 0, "passed": 0, "failed": 0}
+        return entry
+
+    # ---------------- 记录（由 mr_registry.MREngine 调用） ----------------
+    def record_check(self, mr, passed):
+        if not self.enabled:
+            return
+        entry = self._entry(mr)
+        entry["passed" if passed else "failed"] += 1
+
+    def record_time(self, mr, transform_s=0.0, sut_s=None):
+        """记录一次变换耗时与（可选的）一次 SUT 调用耗时"""
+        if not self.enabled:
+            return
+        entry = self._entry(mr)
+        entry["transform_s"] += transform_s
+        if sut_s is not None:
+            entry["sut_s"] += sut_s
+            entry["sut_calls"] += 1
+
+    # ---------------- 输出 ----------------
+    def flush(self):
+        """把累计的统计追加到 MR_METRICS 文件（每行一个 mutant × MR）并清空"""
+        if not self.enabled or not self.stats:
+            return
+        lines = "".join(
+            json.dumps(dict(entry, mutant=mutant, mr=mr), ensure_ascii=False) + "\n"
+            for (mutant, mr), entry in self.stats.items()
+        )
+        self.stats = {}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, lines.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+
+# 进程内共用一份；MR_METRICS 在导入时读取
+METRICS = MRMetrics(os.environ.get("MR_METRICS") or None)
+atexit.register(METRICS.flush)
+
+
+# ---------------- 报告 ----------------
+def load_metrics(path):
+    """合并 jsonl 中的全部行：{(mutant, mr): 统计}"""
+    merged = {}
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            key = (row.pop("mutant"), row.pop("mr"))
+            entry = merged.setdefault(key, {"transform_s": 0.0, "sut_s": 0.0, "sut_calls": 0, "passed": 0, "failed": 0})
+            for field, value in row.items():
+                entry[field] += value
+    return merged
+
+
+def rank_mrs(merged):
+    """
+    [(mr, 总耗时 ms, 杀死数, 独占杀死数, 独占杀死数/ms)]，按 独占杀死数/ms、杀死数/ms 降序。
+    原函数（名字以 __mutmut_orig 结尾）与 "original" 调用不计入。
+    """
+    killers = {}
+    cost = {}
+    for (mutant, mr), entry in merged.items():
+        if mr == ORIGINAL:
+            continue
+        cost[mr] = cost.get(mr, 0.0) + (entry["transform_s"] + entry["sut_s"]) * 1e3
+        if entry["failed"] and mutant and not mutant.endswith("__mutmut_orig"):
+            killers.setdefault(mutant, set()).add(mr)
+
+    kills = {mr: 0 for mr in cost}
+    unique = {mr: 0 for mr in cost}
+    for mrs in killers.values():
+        for mr in mrs:
+            kills[mr] += 1
+        if len(mrs) == 1:
+            unique[next(iter(mrs))] += 1
+
+    rows = []
+    for mr, ms in cost.items():
+        per_ms = unique[mr] / ms if ms > 0 else 0.0
+        rows.append((mr, ms, kills[mr], unique[mr], per_ms))
+    rows.sort(key=lambda r: (-r[4], -(r[2] / r[1] if r[1] > 0 else 0.0), r[0]))
+    return rows
+
+
+def print_report(rows):
+    print(f"{'MR':<8} {'cost(ms)':>10} {'kills':>6} {'unique':>7} {'unique/ms':>10}")
+    for mr, ms, kills, unique, per_ms in rows:
+        print(f"{mr:<8} {ms:>10.3f} {kills:>6} {unique:>7} {per_ms:>10.3f}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python mr_metrics.py <mr_metrics.jsonl>")
+        return 1
+    print_report(rank_mrs(load_metrics(argv[0])))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+MR 注册表 + 统一执行引擎。
+
+每条 MR 声明：
+- 输入变换 transform（作用于第一个参数，其余参数原样传给 SUT，例如 bi_SearchFromTo 的 key / from / to）
+- 输出关系 relation：EQUAL / LE / GE / scaled(k) / NEGATED / offset(f) / UNCHECKED
+  （LE 表示 原结果 <= 变换后结果，GE 相反；UNCHECKED 只调用不检查，SUT 抛异常同样会杀死 mutant）
+- 适用的被测函数 suts
+
+同名 MR 在不同被测函数上的含义可以不同（例如 MR10：求和单调递增，二分查找下标不增），分别注册即可。
+
+    ENGINE.run("add_values", add_values, (data,))
+    ENGINE.run("bi_SearchFromTo", bi_SearchFromTo, (elements, key, froom, to), fail_fast=True)
+
+选了档位（MR_PROFILE / --mr-profile）时 ENGINE.run 只执行档位中该 SUT 的 MR；档位中没有该 SUT 时执行全部。
+
+新增一条 MR 只需在文件末尾 REGISTRY.register 一行，测试文件不用改。
+
+失败信息保持 "MRx failed" 的格式，conftest / run_results / mr_metrics 按它归属到 MR。
+"""
+import os
+import time
+
+import pytest
+import pytest_check as check
+
+from MetamorphicTestGenerator1 import MetamorphicTestGenerator1 as MG1
+from MetamorphicTestGenerator4 import MetamorphicTestGenerator4 as MG4
+from mr_metrics import METRICS
+from mr_subset import PROFILES_PATH, active_mrs
+from sequence_views import stream_concat, stream_map
+from sut_memo import MEMO
+
+
+class Relation:
+    """
+    原结果与变换后结果之间的关系。
+    holds(原输入, 原结果, 变换后结果) -> bool；
+    assert_with(检查模块, ...) 用 pytest_check 记录一条带 "MRx failed" 消息的检查
+    """
+
+    def __init__(self, kind, holds, assert_with, checked=True):
+        self.kind = kind
+        self.holds = holds
+        self.assert_with = assert_with
+        self.checked = checked
+
+    def __repr__(self):
+        return f"Relation({self.kind})"
+
+
+def _expected(kind, expected):
+    return Relation(
+        kind,
+        lambda inp, res, t: expected(inp, res) == t,
+        lambda chk, msg, inp, res, t: chk.equal(expected(inp, res), t, msg),
+    )
+
+
+EQUAL = _expected("equal", lambda inp, res: res)
+NEGATED = _expected("negated", lambda inp, res: -res)
+LE = Relation("le", lambda inp, res, t: res <= t, lambda chk, msg, inp, res, t: chk.less_equal(res, t, msg))
+GE = Relation("ge", lambda inp, res, t: res >= t, lambda chk, msg, inp, res, t: chk.greater_equal(res, t, msg))
+UNCHECKED = Relation("unchecked", lambda inp, res, t: True, lambda chk, msg, inp, res, t: True, checked=False)
+
+
+def scaled(k):
+    """变换后结果 == 原结果 * k"""
+    return _expected(f"scaled({k})", lambda inp, res: res * k)
+
+
+def elementwise(relation):
+    """批量接口：结果是逐个 key 的序列，每个位置上都要满足 relation"""
+    def holds(inp, res, t):
+        return len(res) == len(t) and all(relation.holds(inp, r, x) for r, x in zip(res, t))
+
+    return Relation(
+        f"elementwise({relation.kind})",
+        holds,
+        lambda chk, msg, inp, res, t: chk.is_true(holds(inp, res, t), msg),
+        checked=relation.checked,
+    )
+
+
+def offset(delta):
+    """变换后结果 == 原结果 + delta(原输入)"""
+    return _expected("offset", lambda inp, res: res + delta(inp))
+
+
+def _ints(transform):
+    """变换结果逐个转成 int（add_values 的 MR4 / MR13 / MR20 是这样调用的）"""
+    return lambda inp: [int(x) for x in transform(inp)]
+
+
+class MR:
+    def __init__(self, name, transform, relation, suts):
+        self.name = name
+        self.transform = transform
+        self.relation = relation
+        self.suts = tuple(suts)
+
+    def __repr__(self):
+        return f"MR({self.name}, {self.relation.kind}, suts={self.suts})"
+
+
+class MRRegistry:
+    def __init__(self):
+        self._mrs = []
+
+    def register(self, name, transform, relation, suts):
+        for sut in suts:
+            if any(m.name == name and sut in m.suts for m in self._mrs):
+                raise ValueError(f"{name} is already registered for {sut}")
+        mr = MR(name, transform, relation, suts)
+        self._mrs.append(mr)
+        return mr
+
+    def for_sut(self, sut, selected=None):
+        """sut 适用的 MR（注册顺序）；selected 不为 None 时只取其中的 MR"""
+        return [m for m in self._mrs if sut in m.suts and (selected is None or m.name in selected)]
+
+    def names(self, sut):
+        return [m.name for m in self.for_sut(sut)]
+
+
+def kill_mode_enabled():
+    """MR_KILL_MODE=1：mutant 只要有一条 MR 不满足就算被杀死，遇到第一条违反的 MR 立即失败"""
+    return os.environ.get("MR_KILL_MODE") == "1"
+
+
+class MREngine:
+    """
+    对任意已注册的 SUT 执行适用的 MR：原输入调用一次，然后逐条 变换 -> 调用 -> 检查。
+    - fail_fast=True（kill 模式）：第一条不成立的 MR 立即 pytest.fail，不计算其余变换；UNCHECKED 的 MR 跳过
+    - 否则用 pytest_check 逐条记录，全部 MR 都会执行
+    SUT 在某条 MR 的变换后输入上抛异常时，以 "MRx failed: 异常" 失败（归属到这条 MR）。
+    MR_METRICS 打开时顺带记录每条 MR 的变换 / SUT 耗时与检查结果。
+    MR_MEMO=1 时 SUT 调用经过 memo（sut_memo.SUTMemo）：变换结果相同的 MR、重复的输入只真正调用一次；
+    默认关闭（命中时的开销与线性 SUT 本身相当）；MR_METRICS 打开时也不使用 memo，记录的 SUT 耗时都是真实调用的耗时
+    selected 为 None 时按当前档位（MR_PROFILE，见 mr_subset.py）选择 MR，对所有 SUT 都生效
+    """
+
+    def __init__(self, registry, checker=check, memo=MEMO, profiles_path=PROFILES_PATH):
+        self.registry = registry
+        self.checker = checker
+        self.memo = memo
+        self.profiles_path = profiles_path
+
+    def _call(self, func, args):
+        # 统计 MR 耗时时不走 memo：命中的调用耗时约为 0，会把恒等类 MR 的 "独占杀死数 / 毫秒" 算得虚高
+        if self.memo is None or METRICS.enabled:
+            return func(*args)
+        return self.memo.call(func, args)
+
+    def _call_mr(self, mr, func, args):
+        # 变换后输入上抛出的异常归属到这条 MR（"MRx failed"），mr_subset 才知道去掉这条 MR 后会少杀死这个 mutant；
+        # 原输入上的异常不归属任何 MR，每个档位都会执行原输入
+        try:
+            return self._call(func, args)
+        except Exception as exc:
+            METRICS.record_check(mr.name, False)
+            pytest.fail(f"{mr.name} failed: {type(exc).__name__}: {exc}", pytrace=False)
+
+    def run(self, sut, func, args, selected=None, fail_fast=False):
+        """返回原输入上的结果；selected 为要运行的 MR 名集合，缺省取当前档位"""
+        if selected is None:
+            selected = active_mrs(sut, self.profiles_path)
+        args = tuple(args)
+        first, rest = args[0], args[1:]
+        timed = METRICS.enabled
+        t = time.perf_counter() if timed else 0.0
+        original = self._call(func, args)
+        if timed:
+            METRICS.record_time("original", sut_s=time.perf_counter() - t)
+
+        for mr in self.registry.for_sut(sut, selected):
+            relation = mr.relation
+            if fail_fast and not relation.checked:
+                continue
+            if timed:
+                t0 = time.perf_counter()
+                transformed = mr.transform(first)
+                t1 = time.perf_counter()
+                result = self._call_mr(mr, func, (transformed, *rest))
+                METRICS.record_time(mr.name, transform_s=t1 - t0, sut_s=time.perf_counter() - t1)
+            else:
+                result = self._call_mr(mr, func, (mr.transform(first), *rest))
+            if not relation.checked:
+                continue
+
+            msg = f"{mr.name} failed"
+            if fail_fast:
+                holds = relation.holds(first, original, result)
+                METRICS.record_check(mr.name, holds)
+                if not holds:
+                    pytest.fail(f"{msg} (kill mode)", pytrace=False)
+            else:
+                METRICS.record_check(mr.name, relation.assert_with(self.checker, msg, first, original, result))
+        return original
+
+
+REGISTRY = MRRegistry()
+ENGINE = MREngine(REGISTRY)
+
+ADD_VALUES = "add_values"
+ADD_VALUES_STREAM = "add_values_stream"
+ADD_VALUES_SHARDED = "add_values_sharded"
+BI_SEARCH = "bi_SearchFromTo"
+BI_SEARCH_BATCH = "bi_SearchFromTo_batch"
+BI_SEARCH_EYTZINGER = "eytzinger_SearchFromTo"
+
+# ---------------- add_values ----------------
+REGISTRY.register("MR2", MG1.applyMR2, offset(lambda inp: len(inp) * 3), [ADD_VALUES])        # 每个元素加 3
+REGISTRY.register("MR3_1", MG1.applyMR3_1, EQUAL, [ADD_VALUES])                               # 加法单位元 0
+REGISTRY.register("MR3_2", MG1.applyMR3_2, offset(lambda inp: 1), [ADD_VALUES])               # 追加 1
+REGISTRY.register("MR4", _ints(MG1.applyMR4), GE, [ADD_VALUES])                               # 取倒数
+REGISTRY.register("MR5", lambda inp: MG1.applyMR5(inp, 2), scaled(2), [ADD_VALUES])          # 缩放
+REGISTRY.register("MR6", MG1.applyMR6, EQUAL, [ADD_VALUES])                                   # 反转
+REGISTRY.register("MR7_1", MG1.applyMR7_1, EQUAL, [ADD_VALUES])                               # 乘以 1
+REGISTRY.register("MR7_2", MG1.applyMR7_2, EQUAL, [ADD_VALUES])                               # 加 0
+REGISTRY.register("MR8", MG1.applyMR8, scaled(2), [ADD_VALUES])                               # 重复输入
+REGISTRY.register("MR9", lambda inp: MG1.applyMR9(inp, 3), scaled(3), [ADD_VALUES])          # 缩放后排序
+REGISTRY.register("MR10", MG1.applyMR10, LE, [ADD_VALUES])                                    # 单调性
+REGISTRY.register("MR11", MG1.applyMR11, GE, [ADD_VALUES])                                    # 最大值替换为 0
+REGISTRY.register("MR12", MG1.applyMR12, NEGATED, [ADD_VALUES])                               # 取反
+REGISTRY.register("MR13", _ints(MG1.applyMR13), LE, [ADD_VALUES])                             # 微小增量
+REGISTRY.register("MR14", MG1.applyMR14, GE, [ADD_VALUES])                                    # 移除最大值
+REGISTRY.register("MR16", MG1.applyMR16, UNCHECKED, [ADD_VALUES])                             # 重复值稳健性
+REGISTRY.register("MR20", _ints(MG1.applyMR20), UNCHECKED, [ADD_VALUES])                      # 边界值灵敏度
+REGISTRY.register("MR22", MG1.applyMR22, EQUAL, [ADD_VALUES])                                 # 恒等变换
+
+# ---------------- add_values_stream ----------------
+# 有流式形式的 MR：输入是可反复迭代的流（StreamView / 文件），变换后仍是流，不展开成列表。
+# 只适用于整数源：变换后的流按 list 分块求和，而浮点二进制源逐块 math.fsum 再累加，
+# 两种分块下浮点和的舍入不同（拼接两遍也不等于和的两倍），正确的实现也会被判为违反
+REGISTRY.register("MR3_1", lambda src: stream_concat(src, (0,)), EQUAL, [ADD_VALUES_STREAM])          # 追加 0
+REGISTRY.register("MR3_2", lambda src: stream_concat(src, (1,)), offset(lambda inp: 1), [ADD_VALUES_STREAM])
+REGISTRY.register("MR5", lambda src: stream_map(src, lambda x: x * 2), scaled(2), [ADD_VALUES_STREAM])
+REGISTRY.register("MR8", lambda src: stream_concat(src, src), scaled(2), [ADD_VALUES_STREAM])        # 拼接两遍
+
+# ---------------- add_values_sharded ----------------
+# 与分片数无关的 MR：整数精确、浮点用 compensated=True 时也精确（正确舍入与元素顺序、重复无关）
+REGISTRY.register("MR5", lambda inp: MG1.applyMR5(inp, 2), scaled(2), [ADD_VALUES_SHARDED])   # 缩放
+REGISTRY.register("MR6", MG1.applyMR6, EQUAL, [ADD_VALUES_SHARDED])                           # 反转
+REGISTRY.register("MR8", MG1.applyMR8, scaled(2), [ADD_VALUES_SHARDED])                       # 重复输入
+
+# ---------------- bi_SearchFromTo ----------------
+# 只变换数组，key / from / to 不变；窗口之外追加元素、恒等变换不影响结果
+REGISTRY.register("MR3_1", MG4.applyMR3_1, EQUAL, [BI_SEARCH])
+REGISTRY.register("MR3_2", MG4.applyMR3_2, EQUAL, [BI_SEARCH])
+REGISTRY.register("MR7_1", MG4.applyMR7_1, EQUAL, [BI_SEARCH])
+REGISTRY.register("MR7_2", MG4.applyMR7_2, EQUAL, [BI_SEARCH])
+REGISTRY.register("MR8", MG4.applyMR8, EQUAL, [BI_SEARCH])
+REGISTRY.register("MR10", MG4.applyMR10, GE, [BI_SEARCH])
+REGISTRY.register("MR13", MG4.applyMR13, GE, [BI_SEARCH])
+REGISTRY.register("MR22", MG4.applyMR22, EQUAL, [BI_SEARCH])
+
+# ---------------- bi_SearchFromTo_batch / eytzinger_SearchFromTo ----------------
+# 批量接口与 Eytzinger 索引沿用 bi_SearchFromTo 的全部 MR（批量接口逐个 key 比较）
+for _mr in REGISTRY.for_sut(BI_SEARCH):
+    REGISTRY.register(_mr.name, _mr.transform, elementwise(_mr.relation), [BI_SEARCH_BATCH])
+    REGISTRY.register(_mr.name, _mr.transform, _mr.relation, [BI_SEARCH_EYTZINGER])
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+由一次运行的 mutant × MR 杀死矩阵求最小 MR 子集（集合覆盖），生成 "fast" 档位。
+
+杀死矩阵的来源（任选其一，缺省取 logs/ 下最近一次运行的 results.*）：
+    --results logs/run_xxx/results.csv     run_results.py 写出的结构化结果（完整模式才有全部 MR）
+    --metrics logs/run_xxx/mr_metrics.jsonl mr_metrics.py 的统计
+只计入有 MR 归属的杀死。SUT 在某条 MR 的变换后输入上抛异常时，MREngine 把它报告为 "MRx failed"，
+归属到这条 MR；只有在原输入上就崩溃（如 TypeError）的 mutant 与 MR 无关，任何档位都会执行原输入、都能杀死。
+
+用法：
+    python mr_subset.py [--results PATH | --metrics PATH] [--sut add_values] [--profile fast] [--greedy]
+结果写入 mr_profiles.json：{"档位": {"被测函数": [MR, ...]}}。
+
+运行某个档位：
+    MR_PROFILE=fast pytest tests        或    pytest tests --mr-profile fast
+没有设置档位、或档位中没有该被测函数时，运行全部 MR（nightly 的完整档位）。
+"""
+import argparse
+import json
+import os
+import sys
+from itertools import combinations
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PROFILES_PATH = os.path.join(ROOT, "mr_profiles.json")
+# 精确求解只在 MR 数不多时使用（最坏要枚举 2^n 个子集）
+EXACT_LIMIT = 20
+
+_profile_cache = {}
+
+
+# ---------------- mr_registry.MREngine 使用 ----------------
+def load_profiles(path=PROFILES_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def active_mrs(sut, path=PROFILES_PATH):
+    """
+    当前档位（环境变量 MR_PROFILE）下 sut 要运行的 MR 集合；返回 None 表示运行全部 MR
+    """
+    profile = os.environ.get("MR_PROFILE")
+    if not profile or profile == "full":
+        return None
+    key = (profile, sut, path)
+    if key not in _profile_cache:
+        mrs = load_profiles(path).get(profile, {}).get(sut)
+        _profile_cache[key] = frozenset(mrs) if mrs is not None else None
+    return _profile_cache[key]
+
+
+# ---------------- 杀死矩阵 ----------------
+def _is_mutant(name):
+    return bool(name) and "__mutmut_" in name and not name.endswith("__mutmut_orig")
+
+
+def matrix_from_results(rows):
+    """run_results 的结果行 -> ({mutant: {被哪些 MR 杀死}}, 被杀死的 mutant 集合)"""
+    matrix = {}
+    killed = set()
+    for row in rows:
+        if not _is_mutant(row["mutant"]):
+            continue
+        if not row["nodeid"] and row["outcome"] == "killed":
+            killed.add(row["mutant"])
+        elif row["outcome"] == "failed" and row["mr"]:
+            matrix.setdefault(row["mutant"], set()).add(row["mr"])
+    return matrix, killed | set(matrix)
+
+
+def matrix_from_metrics(merged):
+    """mr_metrics.load_metrics 的结果 -> ({mutant: {MR}}, 被杀死的 mutant 集合)"""
+    matrix = {}
+    for (mutant, mr), entry in merged.items():
+        if _is_mutant(mutant) and entry["failed"]:
+            matrix.setdefault(mutant, set()).add(mr)
+    return matrix, set(matrix)
+
+
+# ---------------- 集合覆盖 ----------------
+def greedy_cover(matrix, order=None):
+    """贪心：每次选覆盖剩余 mutant 最多的 MR（相同时按 order 中的先后）"""
+    order = order or sorted({mr for mrs in matrix.values() for mr in mrs})
+    rank = {mr: i for i, mr in enumerate(order)}
+    remaining = {m for m, mrs in matrix.items() if mrs}
+    chosen = []
+    while remaining:
+        best = max(order, key=lambda mr: (sum(1 for m in remaining if mr in matrix[m]), -rank[mr]))
+        covered = {m for m in remaining if best in matrix[m]}
+        if not covered:
+            break
+        chosen.append(best)
+        remaining -= covered
+    return chosen
+
+
+def exact_cover(matrix, order=None):
+    """按子集大小从小到大枚举，返回第一个能覆盖全部 mutant 的 MR 组合"""
+    order = order or sorted({mr for mrs in matrix.values() for mr in mrs})
+    targets = [mrs for mrs in matrix.values() if mrs]
+    if not targets:
+        return []
+    for k in range(1, len(order) + 1):
+        for subset in combinations(order, k):
+            chosen = set(subset)
+            if all(chosen & mrs for mrs in targets):
+                return list(subset)
+    return list(order)
+
+
+def minimal_subset(matrix, order=None, greedy=False):
+    candidates = {mr for mrs in matrix.values() for mr in mrs}
+    if greedy or len(candidates) > EXACT_LIMIT:
+        return greedy_cover(matrix, order)
+    return exact_cover(matrix, order)
+
+
+def print_matrix(matrix, order):
+    if not matrix:
+        print("(kill matrix is empty)")
+        return
+    width = max(len(m) for m in matrix)
+    print(" " * width + " " + " ".join(f"{mr:>5}" for mr in order))
+    for mutant in sorted(matrix):
+        cells = " ".join(f"{'x' if mr in matrix[mutant] else '.':>5}" for mr in order)
+        print(f"{mutant:<{width}} {cells}")
+
+
+def _latest_results():
+    from run_results import iter_runs
+    runs = list(iter_runs(os.path.join(ROOT, "logs")))
+    return runs[-1][1] if runs else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="由 mutant × MR 杀死矩阵求最小 MR 子集，写入 mr_profiles.json")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--results", help="run_results.py 写出的 results.csv / results.parquet")
+    source.add_argument("--metrics", help="mr_metrics.py 写出的 mr_metrics.jsonl")
+    parser.add_argument("--sut", default="add_values", help="档位中对应的被测函数名（默认 add_values）")
+    parser.add_argument("--profile", default="fast", help="写入的档位名（默认 fast）")
+    parser.add_argument("--greedy", action="store_true", help=f"总是用贪心（MR 超过 {EXACT_LIMIT} 条时自动使用）")
+    parser.add_argument("--output", default=PROFILES_PATH, help="档位文件（默认 mr_profiles.json）")
+    parser.add_argument("--dry-run", action="store_true", help="只打印，不写档位文件")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        from mr_metrics import load_metrics
+        matrix, killed = matrix_from_metrics(load_metrics(args.metrics))
+        source_path = args.metrics
+    else:
+        from run_results import read_results
+        source_path = args.results or _latest_results()
+        if source_path is None:
+            print("No results found under logs/; run test_mutants_runner.py first or pass --results/--metrics")
+            return 1
+        matrix, killed = matrix_from_results(read_results(source_path))
+
+    order = sorted({mr for mrs in matrix.values() for mr in mrs}, key=lambda mr: (len(mr), mr))
+    print(f"kill matrix from {source_path}: {len(killed)} killed mutants, "
+          f"{len(matrix)} with MR attribution, {len(order)} relations")
+    print_matrix(matrix, order)
+
+    subset = minimal_subset(matrix, order, greedy=args.greedy)
+    covered = {m for m, mrs in matrix.items() if mrs & set(subset)}
+    if covered != {m for m, mrs in matrix.items() if mrs}:
+        print("error: subset does not preserve the mutation score; profile not written", file=sys.stderr)
+        return 1
+    print(f"\n{args.profile} profile for {args.sut}: {len(subset)}/{len(order)} relations -> {', '.join(subset)}")
+    print(f"mutation score preserved: {len(killed)} killed "
+          f"({len(killed) - len(matrix)} without MR attribution are killed by any profile)")
+
+    if not args.dry_run:
+        profiles = load_profiles(args.output)
+        profiles.setdefault(args.profile, {})[args.sut] = subset
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(profiles, fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
+        print(f"written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
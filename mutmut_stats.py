@@ -0,0 +1,89 @@
+import json
+import os
+
+# mutmut 生成的统计文件：记录每个被突变函数由哪些用例覆盖，以及每个用例的耗时
+DEFAULT_STATS_PATH = os.path.join(os.path.dirname(__file__), "mutants", "mutmut-stats.json")
+
+
+def load_mutmut_stats(path=DEFAULT_STATS_PATH):
+    """读取 mutmut-stats.json；文件不存在或无法解析时返回 None（调用方回退为运行全部用例）"""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def mangled_function_name(mutant_file, func_name):
+    """
+    由 mutant 文件名与函数名得到 mutmut 的 mangled 名：
+    ("add_values.py", "x_add_values__mutmut_3") -> "add_values.x_add_values"
+    """
+    module = os.path.splitext(os.path.basename(mutant_file))[0]
+    return f"{module}.{func_name.partition('__mutmut_')[0]}"
+
+
+# mutmut 把项目复制到 mutants/ 下；以仓库根为 rootdir 收集 mutants/tests 时 node ID 带这个前缀
+_MUTANTS_PREFIX = "mutants/"
+
+
+def selection_key(nodeid):
+    """
+    用例对齐键：(文件, 参数ID)。
+    mutmut 记录的是 tests/ 下的 node ID（如 tests/test_add_values.py::test_add_values[originalInput8]），
+    而 mutants/tests 中的同一批用例函数名不同（test_add_values_with_func[originalInput8]），
+    所以按 文件 + 参数ID 对齐；没有参数化的用例退回到函数名。
+    文件路径与 rootdir 无关：以仓库根为 rootdir 时是 mutants/tests/...，以 mutants/ 为 rootdir 时是 tests/...，
+    都对齐到 tests/...
+    """
+    path, _, rest = nodeid.partition("::")
+    if path.startswith(_MUTANTS_PREFIX):
+        path = path[len(_MUTANTS_PREFIX):]
+    bracket = rest.find("[")
+    return path, rest[bracket:] if bracket >= 0 else rest
+
+
+def covering_tests(stats, mangled_name):
+    """
+    返回覆盖 mangled_name 的 node ID 列表，按 duration_by_test 从快到慢排序；
+    stats 为空或没有该函数的记录时返回 None（表示不做筛选）
+    """
+    if not stats:
+        return None
+    nodeids = stats.get("tests_by_mangled_function_name", {}).get(mangled_name)
+    if nodeids is None:
+        return None
+    durations = stats.get("duration_by_test", {})
+    return sorted(nodeids, key=lambda n: (durations.get(n, float("inf")), n))
+
+
+def select_items(items, nodeids):
+    """
+    从已收集的 pytest items 中挑出 nodeids 覆盖的用例，并按 nodeids 的顺序（最快优先）排列。
+    nodeids 为 None 或一个都对不上时返回原 items，保证不会因为统计文件过期而漏测。
+    """
+    if nodeids is None:
+        return items
+    order = {}
+    for i, nodeid in enumerate(nodeids):
+        order.setdefault(selection_key(nodeid), i)
+    chosen = [item for item in items if selection_key(item.nodeid) in order]
+    if not chosen:
+        return items
+    return sorted(chosen, key=lambda item: order[selection_key(item.nodeid)])
+
+
+class SelectCoveringTests:
+    """pytest 插件：在收集阶段只保留覆盖当前 mutant 的用例（冷启动模式用）"""
+
+    def __init__(self, nodeids):
+        self.nodeids = nodeids
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        chosen = select_items(items, self.nodeids)
+        if chosen is not items:
+            kept = set(map(id, chosen))
+            deselected = [item for item in items if id(item) not in kept]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+            items[:] = chosen
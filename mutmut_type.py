@@ -1,62 +1,360 @@
 #!/usr/bin/env python3
+import argparse
+import ast
+import csv
+import difflib
+import hashlib
+import json
+import os
 import subprocess
 import re
+import time
 
-def get_mutant_type(mutant_name):
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MUTANTS_SRC = os.path.join(ROOT, "mutants", "src")
+# 持久化索引：mutant 名 -> 源码哈希 / diff 哈希 / 类型
+INDEX_PATH = os.path.join(ROOT, "mutants", "mutant_types.json")
+# 分类规则变化时递增，旧索引中的类型随之失效
+CLASSIFIER_VERSION = 2
+
+_mutant_def_re = re.compile(r'^(x_\w+?)__mutmut_(\w+)$')
+
+
+def _sha1(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def read_mutant_sources(mutants_src=MUTANTS_SRC):
     """
-    解析 mutmut show 输出，判断突变体类型
+    一次遍历 mutants/src：解析每个文件的 AST，取出原函数与每个 mutant 函数的源码，
+    返回 {mutmut 名: (原函数源码, mutant 源码)}，名字形如 "add_values.x_add_values__mutmut_3"
     """
+    sources = {}
+    for filename in sorted(os.listdir(mutants_src)):
+        if not filename.endswith(".py") or filename == "__init__.py":
+            continue
+        module = filename[:-3]
+        with open(os.path.join(mutants_src, filename), "r", encoding="utf-8") as fh:
+            text = fh.read()
+        funcs = {}
+        for node in ast.parse(text).body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                m = _mutant_def_re.match(node.name)
+                if m:
+                    funcs.setdefault(m.group(1), {})[m.group(2)] = ast.get_source_segment(text, node)
+        for base, variants in funcs.items():
+            orig = variants.pop("orig", None)
+            if orig is None:
+                continue
+            for suffix, src in variants.items():
+                sources[f"{module}.{base}__mutmut_{suffix}"] = (orig, src)
+    return sources
+
+
+def source_diff(mutant_name, orig_src, mutant_src):
+    """由源码生成与 mutmut show 等价的 unified diff（两边的 def 名都还原为原函数名）"""
+    module, _, func = mutant_name.partition(".")
+    base = func.partition("__mutmut_")[0]
+
+    def normalize(src):
+        return re.sub(r'def \w+\(', f"def {base}(", src, count=1).splitlines(keepends=True)
+
+    return "".join(difflib.unified_diff(
+        normalize(orig_src), normalize(mutant_src),
+        fromfile=f"src/{module}.py", tofile=f"src/{module}.py",
+    ))
+
+
+def load_index(index_path=INDEX_PATH):
     try:
-        diff_text = subprocess.check_output(["mutmut", "show", mutant_name], text=True)
-    except subprocess.CalledProcessError:
-        return "unknown"
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if index.get("classifier_version") != CLASSIFIER_VERSION:
+        return {}
+    return index.get("mutants", {})
 
-    code = diff_text.replace(" ", "").replace("\n", "")
 
-    # 1. None / Null assignment
-    if re.search(r'=(None)', code):
-        return "None Assignment"
+def save_index(entries, index_path=INDEX_PATH):
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump({"classifier_version": CLASSIFIER_VERSION, "mutants": entries}, fh, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, index_path)
 
-    # 2. Boundary change (循环边界修改或 low/high 增减)
-    if re.search(r'whilelow<high', code) or re.search(r'low\+=[0-9]+', code) or re.search(r'high-=[0-9]+', code):
-        return "Boundary Change"
 
-    # 3. Arithmetic Operator Replacement (AOR)
-    if re.search(r'return[+-]?\(low[+-][0-9]+\)', code) or re.search(r'[+\-*/%]', code):
-        return "Arithmetic Operator Replacement"
+def build_index(mutant_names=None, mutants_src=MUTANTS_SRC, index_path=INDEX_PATH):
+    """
+    一次性为 mutant_names（缺省为 mutants/src 中的全部 mutant）建立/更新类型索引：
+    - 源码直接从 mutants/src 读取，不调用 mutmut show
+    - 源码哈希未变化的条目直接复用上次的结果
+    - 只有在 mutants/src 中找不到的 mutant 才回退到 mutmut show
+    返回 (entries, stats)，entries: {名字: {"source_hash", "diff_hash", "type"}}，stats 含命中/未命中数
+    """
+    cached = load_index(index_path)
+    sources = read_mutant_sources(mutants_src)
+    names = list(sources) if mutant_names is None else list(mutant_names)
 
-    # 4. Division / Floor division change
-    if re.search(r'mid=\(low\+high\)/2', code):
-        return "Division Replacement"
-    if re.search(r'mid=\(low\+high\)//2', code):
-        return "Floor Division"
+    entries = {}
+    stats = {"hits": 0, "misses": 0, "subprocess": 0}
+    for name in names:
+        if name in sources:
+            source_hash = _sha1("\0".join(sources[name]))
+            entry = cached.get(name)
+            if entry is not None and entry.get("source_hash") == source_hash:
+                entries[name] = entry
+                stats["hits"] += 1
+                continue
+            diff_text = source_diff(name, *sources[name])
+            typ = classify_mutant(*sources[name])
+        else:
+            # 回退：mutants/src 里没有这个 mutant（例如名字来自别的 mutmut 工作目录）
+            stats["subprocess"] += 1
+            try:
+                diff_text = subprocess.check_output(["mutmut", "show", name], text=True)
+            except (OSError, subprocess.CalledProcessError):
+                entries[name] = {"source_hash": None, "diff_hash": None, "type": "unknown"}
+                continue
+            source_hash = None
+            typ = classify_diff(diff_text)
+        stats["misses"] += 1
+        entries[name] = {
+            "source_hash": source_hash,
+            "diff_hash": _sha1(diff_text),
+            "type": typ,
+        }
 
-    # 5. Comparison replacement
-    if re.search(r'midVal[<>]=key', code) or re.search(r'midVal[<>=!]=midVal', code):
-        return "Comparison Replacement"
+    merged = dict(cached)
+    merged.update(entries)
+    save_index(merged, index_path)
+    return entries, stats
+
+
+def get_mutant_type(mutant_name):
+    """
+    判断突变体类型（优先使用索引；只有 mutants/src 中找不到时才调用 mutmut show）
+    """
+    entries, _ = build_index([mutant_name])
+    return entries[mutant_name]["type"]
+
+
+# 比较两棵 AST 时忽略的字段：函数名（x_*__mutmut_orig / x_*__mutmut_N 必然不同）和位置信息
+_IGNORED_FIELDS = {"name", "type_comment"}
 
-    # 6. Boolean replacement
-    if "True" in diff_text or "False" in diff_text:
+
+def _first_difference(a, b, top=True):
+    """
+    同步遍历两棵 AST，返回第一处不同的节点对 (原节点, mutant 节点)；完全相同时返回 None。
+    只走一遍，遇到第一处差异即停止。
+    """
+    if type(a) is not type(b):
+        return a, b
+    for field in a._fields:
+        if top and field in _IGNORED_FIELDS:
+            continue
+        va, vb = getattr(a, field, None), getattr(b, field, None)
+        if isinstance(va, ast.AST) and isinstance(vb, ast.AST):
+            found = _first_difference(va, vb, top=False)
+            if found:
+                return found
+        elif isinstance(va, list) and isinstance(vb, list):
+            if len(va) != len(vb):
+                return a, b
+            for x, y in zip(va, vb):
+                if isinstance(x, ast.AST) and isinstance(y, ast.AST):
+                    found = _first_difference(x, y, top=False)
+                elif x != y:
+                    found = (a, b)
+                else:
+                    found = None
+                if found:
+                    return found
+        elif va != vb:
+            return a, b
+    return None
+
+
+_BOUNDARY_PAIRS = {
+    frozenset((ast.Lt, ast.LtE)), frozenset((ast.Gt, ast.GtE)),
+}
+
+
+def classify_nodes(orig, mutant):
+    """根据第一处不同的节点对给出突变类型"""
+    if isinstance(mutant, ast.Constant) and mutant.value is None and not (
+            isinstance(orig, ast.Constant) and orig.value is None):
+        return "None Assignment"
+    if isinstance(orig, ast.Constant) and isinstance(mutant, ast.Constant):
+        if isinstance(orig.value, bool) or isinstance(mutant.value, bool):
+            return "Boolean Replacement"
+        if isinstance(orig.value, (int, float, complex)) and isinstance(mutant.value, (int, float, complex)):
+            return "Number Replacement"
+        if isinstance(orig.value, (str, bytes)):
+            return "String Replacement"
+        return "Constant Replacement"
+    if isinstance(orig, ast.operator) and isinstance(mutant, ast.operator):
+        if isinstance(mutant, ast.Div):
+            return "Division Replacement"
+        if isinstance(mutant, ast.FloorDiv):
+            return "Floor Division"
+        return "Arithmetic Operator Replacement"
+    if isinstance(orig, ast.cmpop) and isinstance(mutant, ast.cmpop):
+        if frozenset((type(orig), type(mutant))) in _BOUNDARY_PAIRS:
+            return "Boundary Change"
+        return "Comparison Replacement"
+    if isinstance(orig, (ast.boolop, ast.unaryop)) or isinstance(mutant, (ast.boolop, ast.unaryop)):
         return "Boolean Replacement"
+    if isinstance(orig, (ast.Assign, ast.AugAssign, ast.AnnAssign)) and \
+            isinstance(mutant, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
+        return "Assignment Replacement"
+    if isinstance(orig, ast.Call) and isinstance(mutant, ast.Call):
+        return "Argument Change"
+    return "Line Change"
+
+
+def classify_mutant(orig_src, mutant_src):
+    """
+    解析原函数与 mutant 函数的 AST，按第一处不同节点的类型判断突变体类型
+    """
+    try:
+        found = _first_difference(ast.parse(orig_src).body[0], ast.parse(mutant_src).body[0])
+    except SyntaxError:
+        return "unknown"
+    if found is None:
+        return "Equivalent"
+    return classify_nodes(*found)
 
-    # fallback
+
+def classify_diff(diff_text):
+    """
+    只有 diff 文本（mutmut show 输出）时的回退分类：从 -/+ 行还原两段源码后交给 AST 分类器；
+    单独的行无法解析时只能判为 Line Change
+    """
+    removed, added = [], []
+    for line in diff_text.splitlines():
+        if line.startswith(("---", "+++")):
+            continue
+        if line.startswith("-"):
+            removed.append(line[1:].strip())
+        elif line.startswith("+"):
+            added.append(line[1:].strip())
+    if not removed and not added:
+        return "unknown"
+    orig_src, mutant_src = "\n".join(removed), "\n".join(added)
+    for wrap in (lambda src: src, lambda src: "if 1:\n " + src.replace("\n", "\n ") + "\n pass"):
+        try:
+            found = _first_difference(ast.parse(wrap(orig_src)), ast.parse(wrap(mutant_src)))
+        except SyntaxError:
+            continue
+        return "Equivalent" if found is None else classify_nodes(*found)
     return "Line Change"
 
 
-def main():
-    # 自动获取所有突变体名称
+# ---------------- 按突变类型统计杀死率 ----------------
+_killed_statuses = {"killed", "timeout", "segfault", "caught by type check"}
+_running_re = re.compile(r'^RUNNING (\S+)\.py :: (\S+)')
+_verdict_re = re.compile(r'^(✅|❌) (\S+) ')
+
+
+def statuses_from_mutmut_results(output):
+    """解析 `mutmut results` 的输出：{mutmut 名: 状态}"""
+    statuses = {}
+    for line in output.strip().splitlines():
+        name, sep, status = line.partition(":")
+        if sep:
+            statuses[name.strip()] = status.strip()
+    return statuses
+
+
+def statuses_from_runner_log(log_path):
+    """
+    解析 test_mutants_runner.py 的 run log（RUNNING <文件> :: <函数> 标记 + ✅/❌ 结论），
+    返回 {mutmut 名: "killed" / "survived"}；原函数 (_orig) 不计入
+    """
+    statuses = {}
+    module = None
+    with open(log_path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            m = _running_re.match(line)
+            if m:
+                module = m.group(1)
+                continue
+            m = _verdict_re.match(line)
+            if m and module and not m.group(2).endswith("__mutmut_orig"):
+                statuses[f"{module}.{m.group(2)}"] = "killed" if m.group(1) == "❌" else "survived"
+    return statuses
+
+
+def kill_rate_table(entries, statuses):
+    """
+    按突变类型汇总：[(类型, 总数, 杀死数, 杀死率)]，按总数降序；
+    没有状态的 mutant 不计入
+    """
+    totals, killed = {}, {}
+    for name, entry in entries.items():
+        status = statuses.get(name)
+        if status is None:
+            continue
+        typ = entry["type"]
+        totals[typ] = totals.get(typ, 0) + 1
+        if status in _killed_statuses:
+            killed[typ] = killed.get(typ, 0) + 1
+    rows = [(typ, n, killed.get(typ, 0), killed.get(typ, 0) / n) for typ, n in totals.items()]
+    rows.sort(key=lambda r: (-r[1], r[0]))
+    return rows
+
+
+def write_kill_rate_csv(rows, path):
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["type", "total", "killed", "kill_rate"])
+        for typ, total, n_killed, rate in rows:
+            writer.writerow([typ, total, n_killed, f"{rate:.4f}"])
+
+
+def print_kill_rate_table(rows):
+    print(f"{'type':<32} {'total':>6} {'killed':>7} {'rate':>7}")
+    for typ, total, n_killed, rate in rows:
+        print(f"{typ:<32} {total:>6} {n_killed:>7} {rate:>7.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="按 AST 给 mutant 分类，并输出各突变类型的杀死率")
+    parser.add_argument("--log", help="用 test_mutants_runner.py 的 run log 代替 `mutmut results` 作为杀死状态来源")
+    parser.add_argument("--csv", help="把杀死率表写入 CSV 文件")
+    args = parser.parse_args(argv)
+
+    # 自动获取所有突变体名称；没有 mutmut 可用时直接取 mutants/src 中的全部 mutant
+    statuses = {}
     try:
         output = subprocess.check_output(["mutmut", "results"], text=True)
-    except subprocess.CalledProcessError:
-        print("Error: cannot get mutmut results")
-        return
+        mutant_names = [line.split(":")[0].strip() for line in output.strip().splitlines() if line.strip()]
+        statuses = statuses_from_mutmut_results(output)
+    except (OSError, subprocess.CalledProcessError):
+        print("Warning: cannot get mutmut results, using mutants in mutants/src")
+        mutant_names = None
+    if args.log:
+        statuses = statuses_from_runner_log(args.log)
 
-    mutant_names = [line.split(":")[0].strip() for line in output.strip().splitlines() if line.strip()]
+    t = time.perf_counter()
+    entries, stats = build_index(mutant_names)
+    elapsed = (time.perf_counter() - t) * 1000
 
     # 输出每个突变体及类型
-    for mutant in mutant_names:
-        typ = get_mutant_type(mutant)
-        print(f"{mutant}: {typ}")
+    for mutant, entry in entries.items():
+        print(f"{mutant}: {entry['type']}")
+    print(f"classified {len(entries)} mutants in {elapsed:.1f} ms "
+          f"(cache hits {stats['hits']}, misses {stats['misses']}, mutmut show calls {stats['subprocess']})")
+
+    rows = kill_rate_table(entries, statuses)
+    if not rows:
+        print("No kill statuses available (run `mutmut run` or pass --log)")
+        return
+    print()
+    print_kill_rate_table(rows)
+    if args.csv:
+        write_kill_rate_csv(rows, args.csv)
+        print(f"kill-rate table written to {args.csv}")
 
 
 if __name__ == "__main__":
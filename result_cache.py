@@ -0,0 +1,131 @@
+import glob
+import hashlib
+import inspect
+import json
+import os
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# 增量运行的结果缓存：{mutant 函数名: {"key": ..., "rc": ...}}
+DEFAULT_CACHE_PATH = os.path.join(ROOT, "logs", "mutant_result_cache.json")
+DEFAULT_TESTS_DIR = os.path.join(ROOT, "mutants", "tests")
+# mutants/tests 实际使用的 MR 生成器（只有根目录这一份）、声明输出关系的 MR 注册表，
+# 以及决定 MR 怎样执行的代码：变换返回的视图、引擎的 SUT memo、conftest（kill 模式与失败记录）
+MR_GENERATOR_GLOBS = [
+    os.path.join(ROOT, "MetamorphicTestGenerator*.py"),
+    os.path.join(ROOT, "mr_registry.py"),
+    os.path.join(ROOT, "sequence_views.py"),
+    os.path.join(ROOT, "sut_memo.py"),
+    os.path.join(ROOT, "conftest.py"),
+]
+# MR 档位（MR_PROFILE）决定运行哪些 MR，档位文件也计入缓存键
+MR_PROFILES_PATH = os.path.join(ROOT, "mr_profiles.json")
+# 只有这些退出码代表确定的结论（0 = 存活，1 = 被杀死），其它（中断、收集错误……）不缓存
+CACHEABLE_RCS = (0, 1)
+
+
+def _sha1_bytes(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def file_hash(path):
+    try:
+        with open(path, "rb") as fh:
+            return _sha1_bytes(fh.read())
+    except OSError:
+        return None
+
+
+def function_source_hash(func):
+    """mutant 函数源码的哈希；拿不到源码时返回 None（该 mutant 不参与缓存）"""
+    try:
+        return _sha1_bytes(inspect.getsource(func).encode("utf-8"))
+    except (OSError, TypeError):
+        return None
+
+
+def covering_test_files(nodeids, tests_dir=DEFAULT_TESTS_DIR):
+    """
+    运行该 mutant 时会被收集的测试文件。
+    nodeids 记录的是 tests/ 下的路径，这里按文件名对应到 tests_dir；
+    nodeids 为 None（运行全部用例）或对应不上时，取 tests_dir 下全部 test_*.py
+    """
+    all_files = sorted(glob.glob(os.path.join(tests_dir, "test_*.py")))
+    if nodeids is None:
+        return all_files
+    wanted = {os.path.basename(n.partition("::")[0]) for n in nodeids}
+    files = [f for f in all_files if os.path.basename(f) in wanted]
+    return files or all_files
+
+
+def mr_generator_hash(patterns=MR_GENERATOR_GLOBS):
+    """全部 MR 生成器源码合在一起的哈希"""
+    h = hashlib.sha1()
+    for path in sorted(p for pattern in patterns for p in glob.glob(pattern)):
+        h.update(os.path.basename(path).encode("utf-8"))
+        h.update((file_hash(path) or "").encode("ascii"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    mutant 结论的增量缓存，键为 (mutant 函数源码哈希, 覆盖它的测试文件哈希, MR 生成器源码哈希, 选中的用例, MR 档位)。
+    这些都没变时上次的 killed / survived 结论仍然有效，可以跳过该 mutant。
+
+        cache = ResultCache()
+        key = cache.key(func, nodeids)
+        rc = cache.get(name, key)      # None 表示需要重新运行
+        cache.put(name, key, rc)
+        cache.save()
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, tests_dir=DEFAULT_TESTS_DIR):
+        self.path = path
+        self.tests_dir = tests_dir
+        self.hits = 0
+        self.misses = 0
+        self._generators = mr_generator_hash()
+        self._profiles = file_hash(MR_PROFILES_PATH)
+        self._file_hashes = {}
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                self.entries = json.load(fh)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _test_file_hash(self, path):
+        if path not in self._file_hashes:
+            self._file_hashes[path] = file_hash(path)
+        return self._file_hashes[path]
+
+    def key(self, func, nodeids=None):
+        """缓存键；mutant 源码不可得时返回 None"""
+        source = function_source_hash(func)
+        if source is None:
+            return None
+        tests = [
+            (os.path.basename(path), self._test_file_hash(path))
+            for path in covering_test_files(nodeids, self.tests_dir)
+        ]
+        profile = [os.environ.get("MR_PROFILE") or "full", self._profiles]
+        payload = [source, tests, self._generators, list(nodeids) if nodeids is not None else None, profile]
+        return _sha1_bytes(json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+    def get(self, name, key):
+        """上次的退出码；键不匹配或没有记录时返回 None，并计入未命中"""
+        entry = self.entries.get(name)
+        if key is not None and entry is not None and entry.get("key") == key:
+            self.hits += 1
+            return entry["rc"]
+        self.misses += 1
+        return None
+
+    def put(self, name, key, rc):
+        if key is not None and rc in CACHEABLE_RCS:
+            self.entries[name] = {"key": key, "rc": rc}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(self.entries, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
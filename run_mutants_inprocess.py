@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+run_one_mutant.sh 的单进程版本：不复制项目、不调用 mutmut show / patch、不每次冷启动 pytest。
+
+- mutants/src 中 mutmut 生成的模块（带 _mutmut_trampoline）只导入一次，并抢先放进 sys.modules，
+  tests/ 中的 `from add_values import add_values` 拿到的就是 trampoline 版本
+- 切换 mutant 只需改 os.environ["MUTANT_UNDER_TEST"]，trampoline 每次调用时读取它
+- tests/ 只收集一次（WarmMutantSession），每个 mutant 只重跑覆盖它的用例
+- 与 run_one_mutant.sh 一样：MUTANT_ID 设为 mutant 名，conftest 把失败记录逐行追加到
+  pytest_mutant_logs/failures_<时间>_<pid>.jsonl（整个会话一个文件，按 mutant_id 区分），
+  另在 pytest_mutant_logs/<mutant>.diff.txt 保存 diff（直接由源码生成）
+
+用法：
+    python run_mutants_inprocess.py                       # mutants/src 中的全部 mutant
+    python run_mutants_inprocess.py add_values.x_add_values__mutmut_3 [...]
+"""
+import argparse
+import difflib
+import importlib
+import inspect
+import os
+import re
+import sys
+
+from mutmut_stats import covering_tests, load_mutmut_stats, select_items
+from warm_session import WarmMutantSession
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MUTANTS_SRC = os.path.join(ROOT, "mutants", "src")
+TESTS_DIR = os.path.join(ROOT, "tests")
+LOG_DIR = "pytest_mutant_logs"
+
+
+def load_trampolined_modules(mutants_src=MUTANTS_SRC):
+    """导入 mutants/src 下的全部模块（只导入一次），返回 {模块名: 模块}"""
+    sys.path.insert(0, mutants_src)
+    modules = {}
+    for filename in sorted(os.listdir(mutants_src)):
+        if not filename.endswith(".py") or filename == "__init__.py":
+            continue
+        name = filename[:-3]
+        # 若 src/ 下的原始模块已被导入，替换成 trampoline 版本
+        sys.modules.pop(name, None)
+        modules[name] = importlib.import_module(name)
+    return modules
+
+
+def list_mutants(modules):
+    """
+    {mutmut 名: (原函数, mutant 函数)}，名字形如 "add_values.x_add_values__mutmut_3"，
+    取自各模块中 mutmut 生成的 x_<func>__mutmut_mutants 字典
+    """
+    mutants = {}
+    for module_name, module in modules.items():
+        for attr in sorted(dir(module)):
+            if not attr.endswith("__mutmut_mutants"):
+                continue
+            orig = getattr(module, attr[: -len("mutants")] + "orig")
+            for key, func in getattr(module, attr).items():
+                mutants[f"{module_name}.{key}"] = (orig, func)
+    return mutants
+
+
+def mutant_diff(mutant_name, orig, func):
+    """原函数与 mutant 函数的 unified diff（两边的 def 名都改回原函数名，与 mutmut show 的效果一致）"""
+    def source(f):
+        return re.sub(r"def \w+\(", f"def {orig.__name__}(", inspect.getsource(f), count=1)
+
+    orig_src = source(orig)
+    mutant_src = source(func)
+    module = mutant_name.partition(".")[0]
+    return "".join(difflib.unified_diff(
+        orig_src.splitlines(keepends=True),
+        mutant_src.splitlines(keepends=True),
+        fromfile=f"src/{module}.py",
+        tofile=f"src/{module}.py",
+    ))
+
+
+def print_verdict(mutant_name, rc):
+    if rc == 0:
+        print(f"🙁 {mutant_name} 存活（所有测试通过）")
+    else:
+        print(f"🎉 {mutant_name} 被杀死 (退出码 {rc})")
+
+
+def run(mutant_names=None, kill_mode=False, all_tests=False):
+    """在当前进程中依次运行 mutant，返回 [(mutant_name, rc, exec_seconds)]"""
+    modules = load_trampolined_modules()
+    available = list_mutants(modules)
+    names = list(mutant_names) if mutant_names else list(available)
+    unknown = [n for n in names if n not in available]
+    if unknown:
+        raise SystemExit(f"未知的 mutant: {', '.join(unknown)}")
+
+    stats = None if all_tests else load_mutmut_stats()
+    os.makedirs(LOG_DIR, exist_ok=True)
+    if kill_mode:
+        os.environ["MR_KILL_MODE"] = "1"
+
+    def activate(mutant_name, _):
+        print(f"\n>>> MUTANT_UNDER_TEST = {mutant_name}")
+        os.environ["MUTANT_UNDER_TEST"] = mutant_name
+        os.environ["MUTANT_ID"] = mutant_name
+        diff = mutant_diff(mutant_name, *available[mutant_name])
+        print(diff)
+        with open(os.path.join(LOG_DIR, f"{mutant_name}.diff.txt"), "w", encoding="utf-8") as fh:
+            fh.write(diff)
+
+    def select(mutant_name, items):
+        return select_items(items, covering_tests(stats, mutant_name.partition("__mutmut_")[0]))
+
+    session = WarmMutantSession(
+        [(name, None) for name in names], activate,
+        finish=print_verdict, select=select, stop_on_first_failure=kill_mode,
+    )
+    try:
+        session.run(TESTS_DIR)
+    finally:
+        os.environ.pop("MUTANT_UNDER_TEST", None)
+        os.environ.pop("MUTANT_ID", None)
+
+    if len(session.results) != len(names):
+        # 会话中止（收集出错等），没跑到的 mutant 不能算作存活，也不能报告 0/0
+        errors = "".join(f"\n  - {nodeid}" for nodeid, _ in session.collection_errors)
+        raise SystemExit(f"\n会话中止：只运行了 {len(session.results)}/{len(names)} 个 mutant"
+                         + (f"；收集出错的模块：{errors}" if errors else ""))
+
+    killed = sum(1 for _, rc, _ in session.results if rc != 0)
+    print(f"\n{killed}/{len(session.results)} 个 mutant 被杀死；"
+          f"启动耗时 {session.startup_seconds:.3f}s，执行耗时 {session.exec_seconds:.3f}s")
+    print(f"Done. Check logs in {os.path.abspath(LOG_DIR)}")
+    return session.results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="单进程、通过 trampoline 切换 mutant 运行 tests/")
+    parser.add_argument("mutants", nargs="*", help="mutmut 名，如 add_values.x_add_values__mutmut_3；缺省为全部")
+    parser.add_argument("--kill-mode", action="store_true", help="第一条违反的 MR 即停止该 mutant")
+    parser.add_argument("--all-tests", action="store_true", help="不按 mutmut-stats.json 选择覆盖用例")
+    args = parser.parse_args(argv)
+    run(args.mutants, kill_mode=args.kill_mode, all_tests=args.all_tests)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
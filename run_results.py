@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+每次运行的结构化结果：logs/run_*/results.parquet（装了 pyarrow 时）或 results.csv。
+
+每行一个 (mutant, 用例, MR)：
+- 通过的用例记一行，mr 为空
+- 失败的用例每条违反的 MR 记一行（原因取自 "MRx failed" 所在的那一行）；
+  不是 MR 检查失败（例如 mutant 直接抛异常）时记一行，mr 为空，原因为异常信息
+- 每个 mutant 另有一行结论：nodeid 为空，outcome 为 killed / survived / error，
+  沿用缓存结论时 reason 为 "cached"
+
+查询（不依赖 pandas）：
+    rows = load_history("logs")
+    survived_mutants(rows, run_id="run_20250924_202833")
+    mr_kill_counts(rows)
+
+命令行：python run_results.py [logs 目录]   # 打印每次运行存活的 mutant
+"""
+import csv
+import glob
+import os
+import re
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 可选，没有时写 CSV
+    pa = None
+    pq = None
+
+COLUMNS = ["run_id", "mutant", "nodeid", "mr", "outcome", "duration", "reason"]
+_mr_line_re = re.compile(r'^.*\b(MR[0-9A-Za-z_]+) failed.*$', re.MULTILINE)
+
+
+def failure_rows(report):
+    """失败报告 -> [(mr, reason)]；同一条 MR 只记一次"""
+    text = report.longreprtext
+    rows = []
+    seen = set()
+    for m in _mr_line_re.finditer(text):
+        if m.group(1) not in seen:
+            seen.add(m.group(1))
+            rows.append((m.group(1), m.group(0).strip()))
+    if not rows:
+        crash = getattr(report.longrepr, "reprcrash", None)
+        if crash is not None and crash.message:
+            reason = crash.message
+        else:
+            lines = text.strip().splitlines()
+            reason = lines[-1] if lines else ""
+        rows.append(("", reason))
+    return rows
+
+
+def verdict(rc):
+    if rc == 0:
+        return "survived"
+    if rc == 1:
+        return "killed"
+    return "error"
+
+
+class ResultsRecorder:
+    """
+    pytest 插件：按当前 mutant 记录每个用例的结果行。
+    冷启动模式每次 pytest.main 都传入同一个实例，常驻模式在 activate 时调用 set_mutant。
+    """
+
+    def __init__(self, run_id=""):
+        self.run_id = run_id
+        self.mutant = None
+        self.rows = []
+
+    def set_mutant(self, name):
+        self.mutant = name
+
+    def add_verdict(self, name, rc, reason=""):
+        self.rows.append(self._row(name, "", "", verdict(rc), 0.0, reason or f"exit code {rc}"))
+
+    def pop_rows(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def _row(self, mutant, nodeid, mr, outcome, duration, reason):
+        return {
+            "run_id": self.run_id, "mutant": mutant, "nodeid": nodeid, "mr": mr,
+            "outcome": outcome, "duration": round(duration, 6), "reason": reason,
+        }
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            for mr, reason in failure_rows(report):
+                self.rows.append(self._row(self.mutant, report.nodeid, mr, "failed", report.duration, reason))
+        elif report.skipped:
+            reason = report.longrepr[2] if isinstance(report.longrepr, tuple) else ""
+            self.rows.append(self._row(self.mutant, report.nodeid, "", "skipped", report.duration, reason))
+        elif report.when == "call":
+            self.rows.append(self._row(self.mutant, report.nodeid, "", "passed", report.duration, ""))
+
+
+def write_results(rows, run_dir, run_id=None):
+    """写出 results.parquet（有 pyarrow）或 results.csv，返回文件路径"""
+    if run_id is not None:
+        rows = [dict(row, run_id=run_id) for row in rows]
+    if pq is not None:
+        path = os.path.join(run_dir, "results.parquet")
+        table = pa.table({col: [row[col] for row in rows] for col in COLUMNS})
+        pq.write_table(table, path)
+        return path
+    path = os.path.join(run_dir, "results.csv")
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def read_results(path):
+    """读取一个 results.parquet / results.csv，返回 [dict]"""
+    if path.endswith(".parquet"):
+        if pq is None:
+            raise ImportError("reading .parquet results requires pyarrow")
+        return pq.read_table(path).to_pylist()
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    for row in rows:
+        row["duration"] = float(row["duration"] or 0.0)
+    return rows
+
+
+def iter_runs(logs_dir="logs"):
+    """按时间顺序产出 (run_id, 结果文件路径)；同一次运行优先 parquet"""
+    for run_dir in sorted(glob.glob(os.path.join(logs_dir, "run_*"))):
+        for name in ("results.parquet", "results.csv"):
+            path = os.path.join(run_dir, name)
+            if os.path.exists(path) and (pq is not None or name.endswith(".csv")):
+                yield os.path.basename(run_dir), path
+                break
+
+
+def load_history(logs_dir="logs"):
+    """logs_dir 下全部运行的结果行"""
+    rows = []
+    for run_id, path in iter_runs(logs_dir):
+        rows.extend(dict(row, run_id=run_id) for row in read_results(path))
+    return rows
+
+
+def verdicts(rows, run_id=None):
+    """{mutant: killed / survived / error}"""
+    return {
+        row["mutant"]: row["outcome"]
+        for row in rows
+        if not row["nodeid"] and (run_id is None or row["run_id"] == run_id)
+    }
+
+
+def survived_mutants(rows, run_id=None):
+    return sorted(name for name, outcome in verdicts(rows, run_id).items() if outcome == "survived")
+
+
+def mr_kill_counts(rows, run_id=None):
+    """{MR: 被它检查出的不同 mutant 数}，按数量降序"""
+    killed = {}
+    for row in rows:
+        if row["outcome"] == "failed" and row["mr"] and (run_id is None or row["run_id"] == run_id):
+            killed.setdefault(row["mr"], set()).add(row["mutant"])
+    return dict(sorted(((mr, len(ms)) for mr, ms in killed.items()), key=lambda kv: (-kv[1], kv[0])))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    logs_dir = argv[0] if argv else "logs"
+    rows = load_history(logs_dir)
+    for run_id in sorted({row["run_id"] for row in rows}):
+        survived = [name for name in survived_mutants(rows, run_id) if not name.endswith("__mutmut_orig")]
+        print(f"{run_id}: {len(survived)} survived" + (f" ({', '.join(survived)})" if survived else ""))
+
+
+if __name__ == "__main__":
+    main()
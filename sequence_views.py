@@ -0,0 +1,137 @@
+"""
+MR 变换用的惰性只读序列视图：不复制输入，按需计算元素。
+
+- SequenceView(base)：base 的只读视图（恒等变换）
+- ConcatView(*parts)：多个序列首尾相接（重复输入、追加单位元）
+- MappedView(base, fn)：访问第 i 个元素时才计算 fn(base[i])（缩放、乘 1 / 加 0）
+
+只迭代或按下标读取的被测函数（add_values、bi_SearchFromTo 及其 mutant）可以直接接受视图；
+需要原地修改的变换（打乱、排序、替换元素）仍然先复制成 list。
+视图与内容相同的 list / tuple 比较相等；需要真正的列表时用 list(view)。
+
+流式输入（生成器工厂、文件）没有长度也不能按下标读取，只能从头迭代：
+- StreamView(factory)：每次迭代调用 factory() 得到一个新的迭代器，可以反复迭代
+- stream_concat(*parts) / stream_map(base, fn)：流的拼接与逐个变换，parts / base 必须可以反复迭代
+"""
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain
+
+
+class SequenceView(Sequence):
+    __slots__ = ("_base",)
+
+    def __init__(self, base):
+        self._base = base
+
+    def __len__(self):
+        return len(self._base)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._base[index]
+
+    def __iter__(self):
+        return iter(self._base)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return ConcatView(self, other)
+
+    def __radd__(self, other):
+        return ConcatView(other, self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class ConcatView(SequenceView):
+    __slots__ = ("_parts", "_starts", "_len")
+
+    def __init__(self, *parts):
+        super().__init__(None)
+        self._parts = parts
+        self._starts = []
+        total = 0
+        for part in parts:
+            self._starts.append(total)
+            total += len(part)
+        self._len = total
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return super().__getitem__(index)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ConcatView index out of range")
+        k = bisect_right(self._starts, index) - 1
+        # 空片段与下一个片段起点相同，bisect_right 取最右边的那个，不会落在空片段上
+        return self._parts[k][index - self._starts[k]]
+
+    def __iter__(self):
+        return chain.from_iterable(self._parts)
+
+
+class MappedView(SequenceView):
+    __slots__ = ("_fn",)
+
+    def __init__(self, base, fn):
+        super().__init__(base)
+        self._fn = fn
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return super().__getitem__(index)
+        return self._fn(self._base[index])
+
+    def __iter__(self):
+        return map(self._fn, self._base)
+
+
+def scaled(base, k):
+    """每个元素乘以 k 的视图"""
+    return MappedView(base, lambda x: x * k)
+
+
+def shifted(base, delta):
+    """每个元素加 delta 的视图"""
+    return MappedView(base, lambda x: x + delta)
+
+
+class StreamView:
+    """可以反复迭代的惰性流：每次迭代都重新调用 factory()，不保存元素"""
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory):
+        self._factory = factory
+
+    def __iter__(self):
+        return iter(self._factory())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._factory!r})"
+
+
+def stream_concat(*parts):
+    """多个流首尾相接"""
+    return StreamView(lambda: chain.from_iterable(parts))
+
+
+def stream_map(base, fn):
+    """每个元素经过 fn 的流"""
+    return StreamView(lambda: map(fn, base))
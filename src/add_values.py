@@ -1,5 +1,25 @@
+import array
+
+from add_values_backend import buffer_sum, chunked_sum, exact_sum, is_ndarray, ndarray_sum
+
+
 def add_values(data):
-    sum = 0
-    for i in data:
-        sum += i
-    return sum
+    """
+    依次累加 data 中的元素（从 0 开始 +=）。
+    - list / tuple：builtins.sum 的 C 循环，结果与异常都与逐个 += 相同
+    - array.array / memoryview / bytes：整数格式同上；浮点格式用 math.fsum（精确舍入，比逐个累加更准）
+    - NumPy 数值数组：ndarray.sum 向量化求和（整数在原 dtype 内累加、溢出回绕，与逐个 += 相同；浮点末位可能不同）
+    - 其它可迭代对象（生成器、MR 变换返回的视图……）：分块求和
+    """
+    cls = type(data)
+    if cls is list or cls is tuple:
+        return exact_sum(data)
+    if isinstance(data, (memoryview, bytes, bytearray, array.array)):
+        result = buffer_sum(data)
+        if result is not NotImplemented:
+            return result
+    elif is_ndarray(data):
+        result = ndarray_sum(data)
+        if result is not NotImplemented:
+            return result
+    return chunked_sum(data)
@@ -0,0 +1,99 @@
+"""
+add_values 的求和后端：按输入类型选择的求和内核，以及 stream_sum / sharded_sum 共用的格式常量。
+
+与被测函数 add_values 分开放：mutmut 生成的 mutants/src/add_values.py 只有 add_values 本身，
+run_mutants_inprocess.py 用它替换 add_values 模块后，依赖这些内核的模块与测试仍然能正常导入。
+仓库中的 mutants/ 是基线版 add_values（即 loop_sum 的循环）的突变体快照，有意不随分派版重新生成（见 setup.cfg）。
+"""
+import math
+import sys
+from itertools import islice
+
+# 通用可迭代对象按块求和，每块最多这么多个元素
+CHUNK_SIZE = 1 << 16
+# Python 3.12 起 builtins.sum 对 float 使用补偿求和，结果可能与逐个 += 不同
+_PLAIN_FLOAT_SUM = sys.version_info < (3, 12)
+# array.array / memoryview 的整数与浮点格式（memoryview.format 可能带字节序前缀）
+INT_FORMATS = frozenset("bBhHiIlLqQnN")
+FLOAT_FORMATS = frozenset("fd")
+
+
+def loop_sum(items, start=0):
+    total = start
+    for i in items:
+        total += i
+    return total
+
+
+def exact_sum(items, start=0):
+    """
+    与 loop_sum(items, start) 结果完全相同，但尽量走 builtins.sum 的 C 循环；
+    items 必须可以重复迭代（list / tuple）。出错或结果可能不同的时候重新逐个累加，
+    异常类型与消息都和逐个 += 一致
+    """
+    try:
+        result = sum(items, start)
+    except Exception:
+        return loop_sum(items, start)
+    if type(result) is int or _PLAIN_FLOAT_SUM:
+        return result
+    return loop_sum(items, start)
+
+
+def floatbuffer_sum(items):
+    """浮点缓冲区：math.fsum（精确舍入）；遇到 inf - inf、溢出时退回逐个累加（得到 nan / inf）"""
+    try:
+        return math.fsum(items)
+    except (ValueError, OverflowError):
+        return loop_sum(items)
+
+
+def buffer_sum(data):
+    """array.array / memoryview / bytes：按元素格式分派；不支持的格式返回 NotImplemented"""
+    if isinstance(data, (bytes, bytearray)):
+        return sum(data)
+    if isinstance(data, memoryview):
+        if data.ndim != 1:
+            return NotImplemented
+        fmt = data.format.lstrip("@=<>!")
+    else:
+        fmt = data.typecode
+    if fmt in INT_FORMATS:
+        # 迭代得到的都是 Python int，builtins.sum 与逐个 += 完全相同
+        return sum(data)
+    if fmt in FLOAT_FORMATS:
+        return floatbuffer_sum(data)
+    return NotImplemented
+
+
+def ndarray_sum(data):
+    """
+    NumPy 数组：数值类型向量化求和（多维时与逐行 += 一样按第 0 维求和）；object 等类型返回 NotImplemented。
+    整数 dtype 在原 dtype 内累加：逐个 += 时 0 + int8 得到 int8，溢出即回绕，ndarray.sum 默认会先放宽到 int64 / uint64，
+    这里指定 dtype 保持与逐个 += 相同（只是不产生溢出警告）；bool 与逐个 += 一样按 int64 计数，
+    浮点为 pairwise 求和，末位可能与逐个 += 不同
+    """
+    kind = data.dtype.kind
+    if kind not in "biuf":
+        return NotImplemented
+    if data.shape[0] == 0:
+        return 0
+    if kind in "iu":
+        return data.sum(axis=0, dtype=data.dtype)
+    return data.sum(axis=0)
+
+
+def is_ndarray(data):
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(data, numpy.ndarray) and data.ndim > 0
+
+
+def chunked_sum(data):
+    """通用可迭代对象：每次取 CHUNK_SIZE 个元素成块求和，累加顺序与逐个 += 相同"""
+    total = 0
+    iterator = iter(data)
+    while True:
+        chunk = list(islice(iterator, CHUNK_SIZE))
+        if not chunk:
+            return total
+        total = exact_sum(chunk, total)
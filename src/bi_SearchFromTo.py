@@ -1,3 +1,6 @@
+import sys
+
+
 def bi_SearchFromTo(elements, key, froom, to):
 
     low = froom
@@ -17,3 +20,95 @@ def bi_SearchFromTo(elements, key, froom, to):
                 return mid
     return -(low + 1)
 
+
+def _windows(froom, to, n):
+    """froom / to 可以是标量（所有 key 共用）或与 keys 等长的序列，返回逐个 key 的 (froom, to)"""
+    froms = list(froom) if _is_seq(froom) else [froom] * n
+    tos = list(to) if _is_seq(to) else [to] * n
+    if len(froms) != n or len(tos) != n:
+        raise ValueError("per-key froom / to must have the same length as keys")
+    return froms, tos
+
+
+def _is_seq(value):
+    return not isinstance(value, (int, float)) and hasattr(value, "__len__")
+
+
+def _batch_loop(elements, keys, froms, tos):
+    return [bi_SearchFromTo(elements, k, f, t) for k, f, t in zip(keys, froms, tos)]
+
+
+def _numpy_or_none(elements, keys):
+    """
+    能向量化时返回 (numpy, 元素数组, key 数组)，否则 None（退回逐个 key 调用）。
+    只接受 元素与 key 同为整数、或同为浮点 的情况：int 与 float 混合比较在 NumPy 中会先转成 float64，
+    超过 2^53 时与 Python 的精确比较不同
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    try:
+        arr = np.asarray(elements)
+        karr = np.asarray(keys)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if arr.ndim != 1 or karr.ndim != 1:
+        return None
+    kinds = (arr.dtype.kind, karr.dtype.kind)
+    if kinds[0] in "iu" and kinds[1] in "iu":
+        if np.result_type(arr.dtype, karr.dtype).kind == "f":  # uint64 与 int64 混合
+            return None
+    elif not (kinds[0] == "f" and kinds[1] == "f"):
+        return None
+    return np, arr, karr
+
+
+def bi_SearchFromTo_batch(elements, keys, froom, to):
+    """
+    对同一个有序数组一次查找多个 key，第 i 个结果与 bi_SearchFromTo(elements, keys[i], froom_i, to_i) 完全相同
+    （命中返回下标，否则 -(插入点 + 1)；有重复元素时返回的也是同一个下标）。
+    froom / to 为标量时所有 key 共用窗口，也可以是与 keys 等长的序列（逐个 key 的窗口）。
+
+    元素与 key 同为整数或同为浮点、且装了 NumPy 时，所有 key 同步执行同一个二分循环：
+    每一轮对仍在查找的 key 一起取 mid、比较、收缩 low / high，至多 log2(窗口长度) + 1 轮；
+    否则逐个 key 调用 bi_SearchFromTo。装了 NumPy 时返回 int64 数组，否则返回 list。
+    elements 为 list 时每次调用都要转换一次，反复查找同一个数组时应先转成 NumPy 数组。
+    下标越界时与 bi_SearchFromTo 一样抛出 IndexError
+    """
+    keys = list(keys) if not hasattr(keys, "__len__") else keys
+    n = len(keys)
+    froms, tos = _windows(froom, to, n)
+    vectorized = _numpy_or_none(elements, keys)
+    if vectorized is None:
+        results = _batch_loop(elements, keys, froms, tos)
+        np = sys.modules.get("numpy")
+        return np.asarray(results, dtype=np.int64) if np is not None else results
+    np, arr, karr = vectorized
+
+    low = np.asarray(froms, dtype=np.int64)
+    high = np.asarray(tos, dtype=np.int64)
+    result = np.zeros(n, dtype=np.int64)
+    hit = np.zeros(n, dtype=bool)
+    active = np.nonzero(low <= high)[0]
+    length = len(arr)
+    while active.size:
+        lo, hi = low[active], high[active]
+        mid = (lo + hi) // 2
+        if mid.size and (mid.max() >= length or mid.min() < -length):
+            raise IndexError("list index out of range")
+        mid_val = arr[mid]
+        key = karr[active]
+        less = mid_val < key
+        greater = mid_val > key
+        found = ~(less | greater)
+        result[active[found]] = mid[found]
+        hit[active[found]] = True
+        low[active[less]] = mid[less] + 1
+        high[active[greater]] = mid[greater] - 1
+        still = ~found
+        active = active[still]
+        active = active[low[active] <= high[active]]
+    missing = ~hit
+    result[missing] = -(low[missing] + 1)
+    return result
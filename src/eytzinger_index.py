@@ -0,0 +1,174 @@
+"""
+Eytzinger（BFS）布局的有序数组查找索引：对同一个大数组反复做窗口查找时使用。
+
+有序数组按完全二叉树的层序存放（下标从 1 开始，k 的子节点为 2k、2k + 1），
+查找时从根往下走，前几层集中在数组开头、总在缓存里，每一步的下一个探测点与当前位置相邻，
+不像 bi_SearchFromTo 那样在整个数组上跳来跳去。
+
+    index = EytzingerIndex(sorted_elements)     # 构建一次，O(n)
+    index.search(key, froom, to)                 # 与 bi_SearchFromTo(sorted_elements, key, froom, to) 相同的编码
+    index.search_batch(keys, froom, to)          # NumPy 向量化，所有 key 同步下降固定层数
+
+窗口查找 = 全数组 lower_bound 后夹到 [froom, to + 1]：命中返回下标，否则 -(插入点 + 1)。
+未命中时插入点与 bi_SearchFromTo 完全相同；有重复元素时命中返回窗口内最左边的下标，
+bi_SearchFromTo 返回的是二分过程中先碰到的那一个（两者指向的元素相等）。
+EytzingerIndex.search 对超出数组的非空窗口（froom < 0 或 to >= len）抛 IndexError：bi_SearchFromTo
+只在探测到越界下标时才抛，探测不到时会返回一个结果，索引不模仿这种取决于探测路径的行为。
+
+EytzingerIndex 要求整个数组有序。eytzinger_SearchFromTo(elements, key, froom, to) 与 bi_SearchFromTo 签名相同，
+可以直接替换：elements 是 EytzingerIndex 时直接查找；否则与 bi_SearchFromTo 一样只要求窗口内有序，
+对 elements[froom:to + 1] 构建索引（window_index），按 (序列, froom, to) 缓存最近 INDEX_CACHE_SIZE 个，
+同一个序列、同一个窗口反复查找时只构建一次，之后每次 O(log n)。
+窗口超出数组、或窗口内无序（构建时检查一次）时，bi_SearchFromTo 的结果取决于探测路径，
+这时直接调用 bi_SearchFromTo，结果（或 IndexError）与它完全相同。
+缓存按对象身份识别序列（并持有它的引用），原地修改过的序列要先调用 clear_index_cache()。
+"""
+from collections import OrderedDict
+
+from bi_SearchFromTo import bi_SearchFromTo
+
+# eytzinger_SearchFromTo 为普通序列缓存的窗口索引个数
+INDEX_CACHE_SIZE = 8
+_WINDOW_INDEXES = OrderedDict()
+
+
+def _check_window(n, froom, to):
+    if froom <= to and (froom < 0 or to >= n):
+        raise IndexError(f"window [{froom}, {to}] is outside the {n}-element array")
+
+
+class EytzingerIndex:
+    def __init__(self, elements):
+        values = list(elements)
+        n = len(values)
+        self.n = n
+        self.sorted = values
+        # tree[k] 为层序第 k 个节点的值，rank[k] 为它在有序数组中的下标；下标 0 不用
+        tree = [None] * (n + 1)
+        rank = [n] * (n + 1)
+        # 中序遍历完全二叉树，依次填入有序值（迭代实现，避免深递归）
+        i = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            tree[k] = values[i]
+            rank[k] = i
+            i += 1
+            k = 2 * k + 1
+        self.tree = tree
+        self.rank = rank
+        self._arrays = None
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        return self.sorted[i]
+
+    def lower_bound(self, key):
+        """第一个 >= key 的元素下标；都小于 key 时为 n"""
+        tree = self.tree
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < key)
+        # 去掉最后连续向右走的步数，回到最后一次向左走的节点
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self.rank[k]   # rank[0] == n
+
+    def search(self, key, froom, to):
+        _check_window(self.n, froom, to)
+        p = self.lower_bound(key)
+        if p < froom:
+            p = froom
+        elif p > to + 1:
+            p = to + 1
+        if p <= to and p < self.n and self.sorted[p] == key:
+            return p
+        return -(p + 1)
+
+    # ---------------- NumPy 批量 ----------------
+    def _numpy_arrays(self, np):
+        if self._arrays is None:
+            tree = np.asarray(self.tree[1:])
+            if tree.dtype.kind not in "iuf":
+                raise TypeError("search_batch needs numeric keys")
+            # 前面补一个占位，保持 1 起始的下标
+            padded = np.empty(self.n + 1, dtype=tree.dtype)
+            padded[1:] = tree
+            padded[0] = tree[0]
+            self._arrays = (padded, np.asarray(self.rank, dtype=np.int64), np.asarray(self.sorted))
+        return self._arrays
+
+    def search_batch(self, keys, froom, to):
+        """逐个 key 的 search，结果为 int64 数组；froom / to 可以是标量或与 keys 等长的数组"""
+        import numpy as np
+        keys = np.asarray(keys)
+        out_shape = keys.shape
+        keys = keys.ravel()
+        if self.n == 0:
+            p = np.zeros(len(keys), dtype=np.int64)
+        else:
+            tree, rank, values = self._numpy_arrays(np)
+            k = np.ones(len(keys), dtype=np.int64)
+            n = self.n
+            for _ in range(n.bit_length()):
+                inside = k <= n
+                step = tree[np.minimum(k, n)] < keys
+                k = np.where(inside, 2 * k + step, k)
+            # k >>= 去掉末尾连续的 1 再多移一位（最低的 0 位的位置 + 1）
+            lowest_zero = (~k) & (k + 1)
+            k >>= np.log2(lowest_zero).astype(np.int64) + 1
+            p = rank[k]
+        froom = np.broadcast_to(np.asarray(froom, dtype=np.int64), p.shape)
+        to = np.broadcast_to(np.asarray(to, dtype=np.int64), p.shape)
+        outside = (froom <= to) & ((froom < 0) | (to >= self.n))
+        if outside.any():
+            i = int(np.argmax(outside))
+            _check_window(self.n, int(froom[i]), int(to[i]))
+        p = np.minimum(np.maximum(p, froom), to + 1)
+        hit = (p <= to) & (p < self.n)
+        if self.n:
+            values = self._numpy_arrays(np)[2]
+            hit &= values[np.minimum(p, self.n - 1)] == keys
+        return np.where(hit, p, -(p + 1)).reshape(out_shape)
+
+
+def window_index(elements, froom, to):
+    """elements[froom:to + 1] 的索引（非空窗口），窗口内无序时为 None；按 (序列, froom, to) 缓存"""
+    key = (id(elements), froom, to)
+    cached = _WINDOW_INDEXES.get(key)
+    if cached is not None and cached[0] is elements and cached[1] == len(elements):
+        _WINDOW_INDEXES.move_to_end(key)
+        return cached[2]
+    _check_window(len(elements), froom, to)
+    window = elements[froom:to + 1]
+    index = EytzingerIndex(window) if all(a <= b for a, b in zip(window, window[1:])) else None
+    _WINDOW_INDEXES[key] = (elements, len(elements), index)
+    if len(_WINDOW_INDEXES) > INDEX_CACHE_SIZE:
+        _WINDOW_INDEXES.popitem(last=False)
+    return index
+
+
+def clear_index_cache():
+    _WINDOW_INDEXES.clear()
+
+
+def eytzinger_SearchFromTo(elements, key, froom, to):
+    """bi_SearchFromTo 的替代：elements 为 EytzingerIndex 时直接查找，否则用（缓存的）窗口索引；
+    窗口超出数组或无序时退回 bi_SearchFromTo"""
+    if isinstance(elements, EytzingerIndex):
+        return elements.search(key, froom, to)
+    if froom > to:
+        return -(froom + 1)
+    if froom < 0 or to >= len(elements):
+        return bi_SearchFromTo(elements, key, froom, to)
+    window = window_index(elements, froom, to)
+    if window is None:
+        return bi_SearchFromTo(elements, key, froom, to)
+    result = window.search(key, 0, window.n - 1)
+    return result + froom if result >= 0 else result - froom
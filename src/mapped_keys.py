@@ -0,0 +1,146 @@
+"""
+磁盘上的有序定长整数 key 文件，按需映射到内存后用 bi_SearchFromTo 查找。
+
+文件就是首尾相接的定长 key（默认 'q' = 本机字节序 int64，不带文件头），例如
+numpy.ndarray.tofile() 或 write_keys() 写出的文件。MappedKeys 通过 mmap + memoryview.cast 把文件当作只读序列：
+按下标读一个元素只触及它所在的页，二分查找只会换入它探测到的 O(log n) 个页。
+
+稀疏顶层索引（index_stride=N）：预先读出全窗口二分查找前几层探测点的值放在内存里，
+层数取到相邻探测点间距约为 N 个 key 为止（约 n / N 个值）。这些位置是每次全窗口查找都会先探测的，
+命中索引时不再访问文件，冷查找只需换入最后 log2(N) 层的页。结果与不用索引时完全相同（同一个二分过程）。
+
+    with MappedKeys("keys.bin", index_stride=4096) as keys:
+        bi_SearchFromTo(keys, key, 0, len(keys) - 1)
+    search_file("keys.bin", key)                 # 一次性查找，to 缺省为最后一个下标
+
+批量查找：numpy_view() 返回零拷贝的 NumPy 数组，交给 bi_SearchFromTo_batch 同样只换入探测到的页
+（不经过稀疏索引）；关闭 MappedKeys 之前要先释放这些数组。
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from bi_SearchFromTo import bi_SearchFromTo
+
+INT_FORMATS = "bBhHiIlLqQ"
+
+
+def write_keys(path, keys, fmt="q"):
+    """把 keys 按定长格式写入 path（本机字节序）"""
+    with open(path, "wb") as fh:
+        array(fmt, keys).tofile(fh)
+
+
+class MappedKeys(Sequence):
+    """有序 key 文件的只读序列视图，可以直接作为 bi_SearchFromTo 的 elements"""
+
+    def __init__(self, path, fmt="q", index_stride=None):
+        if fmt not in INT_FORMATS:
+            raise ValueError(f"fmt must be one of {INT_FORMATS!r} (native byte order), got {fmt!r}")
+        self.path = path
+        self.fmt = fmt
+        self.itemsize = struct.calcsize(fmt)
+        self._fh = open(path, "rb")
+        size = os.fstat(self._fh.fileno()).st_size
+        if size % self.itemsize:
+            self._fh.close()
+            raise ValueError(f"{path}: size {size} is not a multiple of the {self.itemsize}-byte key width")
+        self._mmap = None
+        self._view = memoryview(b"").cast(fmt)
+        if size:
+            self._mmap = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+                # 二分查找是随机访问，关掉预读，只换入真正探测到的页
+                self._mmap.madvise(mmap.MADV_RANDOM)
+            self._view = memoryview(self._mmap).cast(fmt)
+        self._index = {}
+        self.probes = 0
+        self.index_hits = 0
+        if index_stride:
+            self.build_index(index_stride)
+
+    # ---------------- 序列 ----------------
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._view[i].tolist()
+        self.probes += 1
+        value = self._index.get(i)
+        if value is not None:
+            self.index_hits += 1
+            return value
+        return self._view[i]
+
+    def __iter__(self):
+        return iter(self._view)
+
+    # ---------------- 稀疏顶层索引 ----------------
+    def build_index(self, stride):
+        """缓存全窗口二分查找中区间长度大于 stride 的探测点，返回缓存的 key 数"""
+        self._index = {}
+        n = len(self)
+        pending = [(0, n - 1)]
+        while pending:
+            low, high = pending.pop()
+            if low > high or high - low + 1 <= stride:
+                continue
+            mid = (low + high) // 2
+            self._index[mid] = self._view[mid]
+            pending.append((low, mid - 1))
+            pending.append((mid + 1, high))
+        return len(self._index)
+
+    def numpy_view(self):
+        """文件内容的零拷贝 NumPy 数组（需要 NumPy）"""
+        import numpy as np
+        return np.frombuffer(self._view, dtype=np.dtype(self.fmt))
+
+    @property
+    def index_size(self):
+        return len(self._index)
+
+    # ---------------- 资源 ----------------
+    def close(self):
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def search_file(path, key, froom=0, to=None, fmt="q", index_stride=None):
+    """在 key 文件中查找 key，返回值与 bi_SearchFromTo 相同（命中为下标，否则 -(插入点 + 1)）"""
+    with MappedKeys(path, fmt, index_stride) as keys:
+        return bi_SearchFromTo(keys, key, froom, len(keys) - 1 if to is None else to)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: python src/mapped_keys.py <keys.bin> <key> [froom to] [--stride N]")
+        return 1
+    stride = None
+    if "--stride" in argv:
+        i = argv.index("--stride")
+        stride = int(argv[i + 1])
+        argv = argv[:i] + argv[i + 2:]
+    froom, to = (int(argv[2]), int(argv[3])) if len(argv) >= 4 else (0, None)
+    with MappedKeys(argv[0], index_stride=stride) as keys:
+        result = bi_SearchFromTo(keys, int(argv[1]), froom, len(keys) - 1 if to is None else to)
+        print(f"{result}  ({keys.probes} probes, {keys.index_hits} from the sparse index of {keys.index_size} keys)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
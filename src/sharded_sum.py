@@ -0,0 +1,219 @@
+"""
+分片并行的 add_values：把输入切成 shards 段，在进程池 / 线程池中分别求和，再按分片顺序合并。
+
+    add_values_sharded(data)                                  # 分片数默认为 CPU 个数
+    add_values_sharded(data, 8, compensated=True)             # 浮点精确舍入，与分片数无关
+    add_values_sharded(BinaryNumbers("numbers.bin", "q"), 4)  # 磁盘文件，每个 worker 自己 mmap 自己那一段
+
+输入：list / tuple / 其它可切片的序列（MR 变换返回的视图）、array.array / memoryview / bytes、
+一维 NumPy 数组（含 numpy.memmap）、以文件路径为源的 stream_sum.BinaryNumbers（按字节区间分片，不经过主进程读数据）。
+多维数组与没有长度的可迭代对象不分片，直接交给 add_values。
+
+执行方式 executor：
+- "auto"（默认）：以文件路径为源的 BinaryNumbers 用进程池（每个 worker 自己读文件，主进程不传数据）；
+  NumPy 数组用线程池（ndarray.sum 执行时释放 GIL）；其它内存中的序列在当前线程逐段求和
+- "process" / "thread" / "serial"，或者传入一个已有的 concurrent.futures.Executor（由调用方负责关闭）
+分片只有一段时总是在当前线程求和。进程池要把分片序列化后传给 worker，内存中的 list 用进程池
+比直接 add_values 慢一个数量级（100 万个 int：约 0.16s 对 0.009s），只在显式指定 "process" 时使用；
+线程池对 list 同样没有收益（逐段求和时持有 GIL）。
+
+合并顺序：分片结果按分片顺序从左到右累加，与调度顺序无关，同样的输入和分片数总是得到同样的结果。
+- 整数：逐位精确，与 add_values 完全相同（NumPy 整数数组与 add_values 一样在原 dtype 内累加、溢出回绕，
+  分片和也按这个 dtype 合并；bool 数组按 int64 计数）
+- 浮点（compensated=False）：每段内按 add_values 的方式求和（list 逐个 +=，浮点缓冲区 math.fsum，
+  NumPy 为 pairwise），分片和再依次相加；结果与分片数有关，只保证同一分片数下可复现
+- 浮点（compensated=True）：每段求出 Shewchuk 的无重叠部分和（partials，所有部分和的精确值等于该段的精确和），
+  合并时对全部 partials 做一次 math.fsum，结果是整个输入精确和的正确舍入，与 math.fsum(data) 相同、与分片数无关；
+  代价是每段内逐个元素做纯 Python 的误差分离，比普通求和慢一个数量级。
+  有 inf / nan 时与 math.fsum 的结果相同，inf 与 -inf 相加得到 nan（与 add_values 对浮点缓冲区的处理一致）；
+  整数元素单独按 Python int 精确累加（NumPy 整数数组此时不回绕），全为整数时结果就是这个精确的 int
+"""
+import array
+import math
+import mmap
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from add_values import add_values
+from add_values_backend import FLOAT_FORMATS, INT_FORMATS, exact_sum, is_ndarray, loop_sum
+from stream_sum import BinaryNumbers
+
+_NUMBER_FORMATS = INT_FORMATS | FLOAT_FORMATS
+
+
+# ---------------- 每段的求和内核（进程池中执行，必须是模块级函数） ----------------
+def _plain_shard(shard):
+    if type(shard) is list:
+        return exact_sum(shard)
+    return add_values(shard)
+
+
+def _partials(values):
+    """Shewchuk 的无重叠部分和：返回的浮点数之和（精确值）等于 values 的精确和"""
+    partials = []
+    for x in values:
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+    return partials
+
+
+def _compensated_shard(shard):
+    """(整数部分的精确和, 浮点部分的 partials)；浮点部分有 inf / nan 时 partials 只有一个特殊值"""
+    if is_ndarray(shard):
+        shard = shard.tolist()
+    ints = 0
+    floats = []
+    for x in shard:
+        if type(x) is float:
+            floats.append(x)
+        else:
+            ints += x
+    try:
+        special = math.fsum(floats)
+    except (ValueError, OverflowError):
+        return ints, [loop_sum(floats)]
+    if not math.isfinite(special):
+        return ints, [special]
+    return ints, _partials(floats)
+
+
+def _file_shard(path, fmt, start, stop, compensated):
+    """文件中 [start, stop) 个元素：只映射并读取这一段"""
+    shard = array.array(fmt)
+    if start < stop:
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            shard.frombytes(mapped[start * shard.itemsize:stop * shard.itemsize])
+    return _compensated_shard(shard) if compensated else _plain_shard(shard)
+
+
+def _run_shard(task):
+    kind, payload, compensated = task
+    if kind == "file":
+        return _file_shard(*payload, compensated)
+    return _compensated_shard(payload) if compensated else _plain_shard(payload)
+
+
+# ---------------- 分片 ----------------
+def _bounds(n, shards):
+    """把 [0, n) 切成 shards 段（前面的段多一个元素），返回 [(start, stop), ...]"""
+    shards = max(1, min(shards, n)) if n else 1
+    size, extra = divmod(n, shards)
+    bounds = []
+    start = 0
+    for i in range(shards):
+        stop = start + size + (i < extra)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _tasks(data, shards, compensated):
+    """(任务列表, 是否为 NumPy 数组)；不能分片时返回 None"""
+    if isinstance(data, BinaryNumbers) and isinstance(data.source, (str, os.PathLike)):
+        n = os.path.getsize(data.source)
+        if n % data.itemsize:
+            raise ValueError(f"{data.source}: size {n} is not a multiple of the {data.itemsize}-byte item width")
+        return [("file", (data.source, data.fmt, a, b), compensated)
+                for a, b in _bounds(n // data.itemsize, shards)], False
+    if isinstance(data, (bytes, bytearray)):
+        return [("data", bytes(data[a:b]), compensated) for a, b in _bounds(len(data), shards)], False
+    if isinstance(data, memoryview):
+        fmt = data.format.lstrip("@=<>!")
+        if data.ndim != 1 or fmt not in _NUMBER_FORMATS or fmt not in array.typecodes:
+            return None
+        # memoryview 不能序列化，每段复制成 array
+        return [("data", array.array(fmt, data[a:b]), compensated) for a, b in _bounds(len(data), shards)], False
+    if isinstance(data, array.array) and data.typecode not in _NUMBER_FORMATS:
+        return None
+    if is_ndarray(data):
+        if data.ndim != 1:
+            return None
+        return [("data", data[a:b], compensated) for a, b in _bounds(len(data), shards)], True
+    if not hasattr(data, "__len__") or not hasattr(data, "__getitem__"):
+        return None
+    # list / tuple / array.array / 视图：切片得到的是同类容器或 list
+    return [("data", data[a:b], compensated) for a, b in _bounds(len(data), shards)], False
+
+
+# ---------------- 合并 ----------------
+def _combine_plain(partials, ndarray_dtype):
+    if ndarray_dtype is not None and ndarray_dtype.kind in "biu":
+        # 按分片和实际的 dtype 合并（整数为原 dtype，bool 为计数用的 int64），溢出时与 add_values 一样回绕
+        numpy = sys.modules["numpy"]
+        partials = numpy.asarray(partials)
+        return partials.sum(dtype=partials.dtype)
+    return loop_sum(partials)
+
+
+def _combine_compensated(results):
+    ints = 0
+    floats = []
+    for shard_ints, shard_partials in results:
+        ints += shard_ints
+        floats.extend(shard_partials)
+    if not floats:
+        return ints
+    try:
+        return math.fsum(floats + [ints] if ints else floats)
+    except ValueError:       # 不同分片上的 inf 与 -inf
+        return math.nan
+    except OverflowError:    # 有限值之和超出浮点范围
+        return loop_sum(floats, float(ints))
+
+
+def _auto_executor(tasks, data_is_ndarray):
+    """executor="auto" 的选择：文件分片用进程池，NumPy 数组用线程池，其它内存中的序列串行"""
+    if tasks[0][0] == "file":
+        return "process"
+    return "thread" if data_is_ndarray else "serial"
+
+
+def _executor(kind, max_workers):
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers)
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers)
+    raise ValueError(f"executor must be 'auto', 'process', 'thread', 'serial' or an Executor, got {kind!r}")
+
+
+def add_values_sharded(data, shards=None, compensated=False, executor="auto", max_workers=None):
+    """分片求和（见模块说明）；shards 默认为 CPU 个数，max_workers 默认与分片数相同"""
+    if shards is None:
+        shards = os.cpu_count() or 1
+    if shards < 1:
+        raise ValueError(f"shards must be >= 1, got {shards}")
+    planned = _tasks(data, shards, compensated)
+    if planned is None:
+        if compensated:
+            return _combine_compensated([_compensated_shard(list(data))])
+        return add_values(data)
+    tasks, data_is_ndarray = planned
+    if executor == "auto":
+        executor = _auto_executor(tasks, data_is_ndarray)
+
+    if len(tasks) == 1 or executor == "serial":
+        results = [_run_shard(task) for task in tasks]
+    elif isinstance(executor, Executor):
+        results = list(executor.map(_run_shard, tasks))
+    else:
+        with _executor(executor, max_workers or len(tasks)) as pool:
+            # map 按提交顺序返回结果，合并顺序与调度无关
+            results = list(pool.map(_run_shard, tasks))
+
+    if compensated:
+        return _combine_compensated(results)
+    if data_is_ndarray:
+        if len(data) == 0:
+            return add_values(data)
+        return _combine_plain(results, data.dtype)
+    return _combine_plain(results, None)
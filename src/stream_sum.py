@@ -0,0 +1,131 @@
+"""
+流式 add_values：按块读取数据、维护累计和，内存占用只与块大小有关，可以处理比内存还大的输入。
+
+数据源（都可以反复迭代，MR 检查需要对同一个源迭代多次）：
+- 任意可迭代对象：列表、StreamView(生成器工厂) 等，每 chunk_size 个元素一块
+- TextNumbers(path)：每行一个数的文本文件（先按 int 解析，不行再按 float；空行跳过）
+- BinaryNumbers(path_or_buffer, fmt)：定长二进制数（本机字节序，与 array.array 相同的格式码），
+  文件或 bytes-like 缓冲区，每块是一个 array.array / memoryview
+
+    add_values_stream(TextNumbers("numbers.txt"))
+    add_values_stream(BinaryNumbers("numbers.bin", "q"), checkpoint=lambda count, total: print(count, total))
+    add_values_stream(source, resume=(count, total))      # 从上次的检查点继续，跳过前 count 个元素
+
+每块求和走 add_values 的后端：整数块与逐个 += 完全相同；浮点二进制块逐块用 math.fsum，
+再把各块的和依次累加（与对整个数组 fsum 可能差最后几位）。浮点结果因此与分块方式、源的类型有关，
+mr_registry 中 add_values_stream 的 MR 只对整数源成立。
+"""
+import array
+import os
+import struct
+from itertools import islice
+
+from add_values_backend import CHUNK_SIZE, buffer_sum, exact_sum, loop_sum
+
+
+def iter_chunks(iterable, size=CHUNK_SIZE):
+    """每次取 size 个元素成一个 list"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class TextNumbers:
+    """每行一个数的文本文件，逐行读取"""
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        with open(self.path) as fh:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    yield _parse_number(line)
+
+    def chunks(self):
+        return iter_chunks(self, self.chunk_size)
+
+
+class BinaryNumbers:
+    """定长二进制数：文件路径或 bytes-like 缓冲区，每次读 chunk_size 个元素"""
+
+    def __init__(self, source, fmt="q", chunk_size=CHUNK_SIZE):
+        self.source = source
+        self.fmt = fmt
+        self.itemsize = struct.calcsize(fmt)
+        self.chunk_size = chunk_size
+
+    def chunks(self):
+        if isinstance(self.source, (str, os.PathLike)):
+            return self._file_chunks()
+        return self._buffer_chunks()
+
+    def _file_chunks(self):
+        step = self.chunk_size * self.itemsize
+        with open(self.source, "rb") as fh:
+            while True:
+                data = fh.read(step)
+                if not data:
+                    return
+                if len(data) % self.itemsize:
+                    raise ValueError(f"{self.source}: trailing {len(data) % self.itemsize} bytes "
+                                     f"do not form a whole {self.itemsize}-byte item")
+                chunk = array.array(self.fmt)
+                chunk.frombytes(data)
+                yield chunk
+
+    def _buffer_chunks(self):
+        view = memoryview(self.source).cast("B")
+        if len(view) % self.itemsize:
+            raise ValueError(f"buffer size {len(view)} is not a multiple of the {self.itemsize}-byte item width")
+        items = view.cast(self.fmt)
+        for start in range(0, len(items), self.chunk_size):
+            yield items[start:start + self.chunk_size]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+
+def _chunk_sum(chunk, total):
+    if type(chunk) is list:
+        return exact_sum(chunk, total)
+    result = buffer_sum(chunk)
+    if result is NotImplemented:
+        return loop_sum(chunk, total)
+    return total + result
+
+
+def add_values_stream(source, checkpoint=None, resume=None, chunk_size=CHUNK_SIZE):
+    """
+    按块累加 source 的元素，返回总和。
+    checkpoint(count, total)：每处理完一块调用一次，count 为已累加的元素个数；
+    resume=(count, total)：从检查点继续，跳过前 count 个元素，从 total 开始累加
+    """
+    count, total = resume if resume is not None else (0, 0)
+    chunks = source.chunks() if hasattr(source, "chunks") else iter_chunks(source, chunk_size)
+    skip = count
+    for chunk in chunks:
+        if skip:
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            chunk = chunk[skip:]
+            skip = 0
+        total = _chunk_sum(chunk, total)
+        count += len(chunk)
+        if checkpoint is not None:
+            checkpoint(count, total)
+    return total
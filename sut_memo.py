@@ -0,0 +1,160 @@
+"""
+被测函数调用的内容寻址记忆缓存（LRU）。
+
+同一个输入上，很多 MR 变换的结果是相同的列表（MR7_1 / MR7_2 / MR22 都是原输入的副本），
+随机用例与固定用例之间也会重复；键相同的调用直接返回上次的结果。
+
+键 = (函数身份, 输入指纹)：
+- 函数身份取自函数的字节码、常量与名字，不同 mutant 的函数体不同，键自然不同（闭包另按对象区分）；
+  mutmut 的 trampoline（同一个函数对象按 MUTANT_UNDER_TEST 分派）另外带上 MUTANT_UNDER_TEST
+- 输入指纹是可哈希的元组：(容器标记, 元素类型, 元素元组)，查表时按 hash + == 比较，
+  不做逐元素的字符串编码；类型一起进键，1、1.0、True 不会互相命中
+  （0.0 与 -0.0 相等会命中同一条，两者在 MR 的各种关系下也相等）；
+  MR 变换返回的只读视图按其内容指纹化（与内容相同的 list 相同）；
+  含有无法可靠指纹化的对象（自定义类、numpy 数组、生成器……）时不缓存，直接调用
+只缓存不可变的返回值（数字、字符串、None 及其元组）；抛异常的调用不缓存，每次重新抛出。
+
+    MEMO = SUTMemo(maxsize=4096)
+    result = MEMO.call(func, (data,))
+    MEMO.stats()  # {"hits": ..., "misses": ..., "bypassed": ..., "evictions": ..., "size": ..., "hit_rate": ...}
+
+命中时的开销是把输入复制成两个元组再查表，与 add_values 这类线性 SUT 本身的耗时同一量级，
+只有 SUT 调用明显比遍历一遍输入更贵（或 MR 之间大量重复输入）时才划算，所以默认关闭：
+MR_MEMO=1 打开引擎的缓存，MR_MEMO_SIZE 设置容量（默认 4096 条）。
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+from sequence_views import SequenceView
+
+DEFAULT_MAXSIZE = 4096
+# 可以按值指纹化的元素类型（容器只认 list / tuple 与 sequence_views 的视图）
+_SCALARS = (int, float, complex, str, bytes, bool, type(None))
+
+
+_SCALAR_TYPES = frozenset(_SCALARS)
+
+
+class _Unfingerprintable(Exception):
+    pass
+
+
+def _key(obj):
+    """obj 的可哈希指纹（连同类型）；遇到不支持的类型抛 _Unfingerprintable"""
+    cls = type(obj)
+    if cls in _SCALAR_TYPES:
+        return cls, obj
+    if cls is list or cls is tuple or isinstance(obj, SequenceView):
+        # 视图对被测函数而言就是一个 list，与内容相同的 list 命中同一条缓存
+        items = tuple(obj)
+        kinds = set(map(type, items))
+        if kinds <= _SCALAR_TYPES:
+            # 元素类型只有一种（常见情况）时只记这一种类型，混合类型时逐个位置记录
+            types = kinds.pop() if len(kinds) == 1 else tuple(map(type, items))
+            return cls is tuple, types, items
+        return cls is tuple, tuple(map(_key, items))
+    raise _Unfingerprintable(cls)
+
+
+def fingerprint(args):
+    """参数的内容指纹（可哈希）；不支持的参数返回 None"""
+    try:
+        return _key(tuple(args))
+    except _Unfingerprintable:
+        return None
+
+
+def function_identity(func):
+    """函数内容的摘要：模块、限定名、字节码、常量、引用的名字、默认参数，外加当前的 MUTANT_UNDER_TEST"""
+    func = getattr(func, "__wrapped__", func)
+    code = getattr(func, "__code__", None)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}".encode("utf-8"))
+    if code is not None:
+        h.update(code.co_code)
+        h.update(repr(code.co_consts).encode("utf-8"))
+        h.update(repr(code.co_names).encode("utf-8"))
+        h.update(repr(getattr(func, "__defaults__", None)).encode("utf-8"))
+    if code is None or getattr(func, "__closure__", None):
+        # 闭包捕获的变量无法按内容比较，只能按对象区分
+        h.update(str(id(func)).encode("ascii"))
+    h.update((os.environ.get("MUTANT_UNDER_TEST") or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cacheable_result(value):
+    cls = type(value)
+    if cls in _SCALARS:
+        return True
+    return cls is tuple and all(_cacheable_result(v) for v in value)
+
+
+class SUTMemo:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self._entries = OrderedDict()
+        self._identities = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    def _identity(self, func):
+        # 按函数对象缓存身份摘要；trampoline 的身份随 MUTANT_UNDER_TEST 变化，所以环境变量也进键
+        key = (id(func), os.environ.get("MUTANT_UNDER_TEST"))
+        entry = self._identities.get(key)
+        if entry is None or entry[0] is not func:
+            entry = self._identities[key] = (func, function_identity(func))
+        return entry[1]
+
+    def call(self, func, args):
+        """func(*args)，键相同时返回缓存的结果"""
+        if not self.enabled:
+            return func(*args)
+        fp = fingerprint(args)
+        if fp is None:
+            self.bypassed += 1
+            return func(*args)
+        key = (self._identity(func), fp)
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        result = func(*args)
+        if _cacheable_result(result):
+            entries[key] = result
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._identities.clear()
+        self.hits = self.misses = self.bypassed = self.evictions = 0
+
+
+# 进程内共用一份（mr_registry 的引擎使用），MR_MEMO=1 时才打开
+MEMO = SUTMemo(
+    maxsize=int(os.environ.get("MR_MEMO_SIZE", DEFAULT_MAXSIZE)),
+    enabled=os.environ.get("MR_MEMO") == "1",
+)
@@ -1,15 +1,34 @@
 import os
+import argparse
 import importlib.util
 import inspect
+import multiprocessing
+import shutil
+import threading
+import time
 import mutants.runner as runner
+import mr_metrics
 import pytest
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import traceback
 import re
+from warm_session import WarmMutantSession
+from result_cache import ResultCache
+from run_results import ResultsRecorder, write_results
+from mutmut_stats import (
+    SelectCoveringTests,
+    covering_tests,
+    load_mutmut_stats,
+    mangled_function_name,
+    select_items,
+)
 
 # 供 tests 手动导入使用
 CURRENT_MUTANT_FUNC = None
+# 本进程内的结构化结果行（每个 worker 进程各有一份，随结果一起返回给主进程）
+RESULTS = ResultsRecorder()
 # 在脚本顶部靠近 import 的地方添加或修改这个变量：
 DEFAULT_LOG_NAME = "add_values.log"   # <- 在这里修改为你想要的默认日志名（例如 "mylog.txt"）
 
@@ -88,6 +107,103 @@ class Tee:
     def __getattr__(self, name):
         return getattr(self.primary, name)
 
+
+class AsyncLogWriter:
+    """
+    日志文件的后台写线程：
+    - write() 只把原始数据追加到待写队列，不做任何处理，立即返回
+    - 后台线程按批取出，拼接后只做一次 strip_ansi，再写入文件
+    - 待写数据超过 flush_bytes 或距上次写入超过 flush_interval 秒时写入并 flush
+    所有写入（stdout、stderr、RUNNING 分隔标记）都经过同一个队列，顺序与调用顺序一致。
+    close() 写完队列中剩余的数据再关闭文件；后台写入出错时丢弃之后的数据，由 close() 重新抛出第一个异常。
+    """
+    def __init__(self, f, flush_bytes=64 * 1024, flush_interval=0.2):
+        self.f = f
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._size = 0
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, data):
+        if not data:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append(data)
+            self._size += len(data)
+            if self._size >= self.flush_bytes:
+                self._cond.notify_all()
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        """不阻塞：只提醒后台线程尽快写出"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.f.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._pending and not self._closed:
+                    self._cond.wait(self.flush_interval)
+                if not self._pending:
+                    if self._closed:
+                        return
+                    continue
+                batch, self._pending, self._size = self._pending, [], 0
+            try:
+                if self._error is None:
+                    self.f.write(strip_ansi("".join(batch)))
+                    self.f.flush()
+            except Exception as exc:
+                self._error = exc
+
+
+class LogSink(Tee):
+    """
+    Tee 的异步版本：终端（primary）同步写入并保留颜色，日志交给 AsyncLogWriter 在后台批量写入。
+    flush() 只 flush 终端，日志文件按大小/时间自行 flush。
+    """
+    def __init__(self, primary, writer):
+        super().__init__(primary, writer)
+        self.writer = writer
+
+    def write(self, data):
+        try:
+            self.primary.write(data)
+        except Exception:
+            pass
+        self.writer.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        try:
+            self.primary.flush()
+        except Exception:
+            pass
+        self.writer.flush()
+
+
 def ensure_logs_dir(path="logs"):
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
@@ -141,9 +257,11 @@ def load_function_from_file(file_path, prefix="x_add_values__mutmut_"):
     return funcs  # 返回字典 {函数名: 函数对象}
 
 
-def run_tests_for_mutant(func_name, mutant_func):
-    """运行 tests 目录下的所有测试（保持原行为）"""
+def inject_mutant(func_name, mutant_func):
+    """把 mutant 注入 runner，并打印函数名与源码"""
     runner.CURRENT_MUTANT_FUNC = mutant_func
+    # 供 conftest / mr_metrics 按 mutant 归属记录
+    os.environ["MUTANT_ID"] = func_name
 
     print(f"\n>>> 当前使用的函数: {func_name}")
 
@@ -155,22 +273,407 @@ def run_tests_for_mutant(func_name, mutant_func):
     except OSError:
         print("⚠️ 无法获取源码")
 
-    tests_dir = os.path.join(os.path.dirname(__file__), "mutants", "tests")
-    # 运行 pytest，收集并执行 test_*.py 里的测试函数
-    rc = pytest.main([tests_dir, "-q", "-s", "--tb=short"])
+
+def print_verdict(func_name, rc):
     if rc == 0:
         print(f"✅ {func_name} 所有测试通过")
     else:
         print(f"❌ {func_name} 存在失败 (退出码 {rc})")
 
 
-def main():
+_killer_re = re.compile(r'(MR[0-9A-Za-z_]+) failed')
+
+
+def killing_relation(report):
+    """
+    从失败报告中取出杀死 mutant 的 MR 名称；
+    若不是 MR 检查失败（例如 mutant 直接抛出异常），返回异常类型
+    """
+    m = _killer_re.search(report.longreprtext)
+    if m:
+        return m.group(1)
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None and crash.message:
+        return crash.message.split(":")[0]
+    return "unknown"
+
+
+def print_kill(func_name, failures, ran, planned, elapsed):
+    """kill 模式：打印杀死 mutant 的 MR、所在用例以及跳过的用例数"""
+    if not failures:
+        return
+    rep = failures[0]
+    print(f"💀 {func_name} 被 {killing_relation(rep)} 杀死（用例 {rep.nodeid}，"
+          f"第 {ran}/{planned} 个用例，跳过其余 {planned - ran} 个，耗时 {elapsed:.3f}s）")
+
+
+class KillRecorder:
+    """pytest 插件（冷启动 kill 模式用）：记录失败报告、已运行与收集到的用例数"""
+
+    def __init__(self):
+        self.failures = []
+        self.ran = 0
+        self.planned = 0
+
+    def pytest_collection_finish(self, session):
+        self.planned = len(session.items)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            self.ran += 1
+        if report.failed:
+            self.failures.append(report)
+
+
+def print_selection(nodeids):
+    if nodeids is not None:
+        print(f"🎯 仅运行覆盖该 mutant 的 {len(nodeids)} 个用例（来自 mutmut-stats.json，最快优先）")
+
+
+def build_selection(jobs, stats):
+    """{func_name: 覆盖该 mutant 的 node ID 列表}；值为 None 表示运行全部用例"""
+    return {
+        name: covering_tests(stats, mangled_function_name(mutant_file, name))
+        for mutant_file, _, name, _ in jobs
+    }
+
+
+def run_tests_for_mutant(func_name, mutant_func, nodeids=None, kill_mode=False):
+    """
+    运行 tests 目录下的测试；nodeids 不为 None 时只运行其中覆盖该 mutant 的用例（按给定顺序）。
+    kill_mode=True 时第一条失败即停止（-x），并打印杀死它的 MR。
+    """
+    inject_mutant(func_name, mutant_func)
+    print_selection(nodeids)
+
+    tests_dir = os.path.join(os.path.dirname(__file__), "mutants", "tests")
+    plugins = [SelectCoveringTests(nodeids)] if nodeids is not None else []
+    RESULTS.set_mutant(func_name)
+    plugins.append(RESULTS)
+    args = [tests_dir, "-q", "-s", "--tb=short"]
+    if kill_mode:
+        recorder = KillRecorder()
+        plugins.append(recorder)
+        args.append("-x")
+    # 运行 pytest，收集并执行 test_*.py 里的测试函数
+    t = time.perf_counter()
+    rc = pytest.main(args, plugins=plugins)
+    if kill_mode:
+        print_kill(func_name, recorder.failures, recorder.ran, recorder.planned, time.perf_counter() - t)
+    print_verdict(func_name, rc)
+    RESULTS.add_verdict(func_name, rc)
+    return rc
+
+
+def run_tests_warm(mutants, switch_output=None, selection=None, kill_mode=False):
+    """
+    常驻模式：mutants/tests 只收集一次，之后每个 mutant 只重新注入函数并重跑已收集的用例。
+    mutants: [(func_name, func)]；switch_output(func_name) 可在每个 mutant 开始前切换输出流；
+    selection: {func_name: node ID 列表}，用于只重跑覆盖该 mutant 的用例；
+    kill_mode: 第一条失败即跳过该 mutant 的其余用例。
+    返回 WarmMutantSession（含 results / startup_seconds / exec_seconds）
+    """
+    selection = selection or {}
+
+    def activate(func_name, mutant_func):
+        if switch_output is not None:
+            switch_output(func_name)
+        inject_mutant(func_name, mutant_func)
+        print_selection(selection.get(func_name))
+        RESULTS.set_mutant(func_name)
+
+    def select(func_name, items):
+        return select_items(items, selection.get(func_name))
+
+    def finish(func_name, rc):
+        if kill_mode:
+            print_kill(func_name, session.failures, session.ran, session.planned, session.results[-1][2])
+        print_verdict(func_name, rc)
+        RESULTS.add_verdict(func_name, rc)
+
+    session = WarmMutantSession(
+        mutants, activate, finish=finish, select=select, stop_on_first_failure=kill_mode,
+    )
+    tests_dir = os.path.join(os.path.dirname(__file__), "mutants", "tests")
+    rc = session.run(tests_dir, plugins=[RESULTS])
+    if len(session.results) < len(mutants):
+        print(f"❌ 常驻 pytest 会话提前结束 (退出码 {rc})，仅完成 {len(session.results)}/{len(mutants)} 个 mutant")
+    return session
+
+
+def iter_mutant_jobs(mutants_dir):
+    """
+    按 文件名 -> 函数名 的顺序列出所有待测 mutant：[(mutant_file, mutant_path, func_name, func), ...]
+    顺序只取决于文件/函数名，串行与并行模式共用，保证日志合并结果确定。
+    """
+    jobs = []
+    for mutant_file in sorted(os.listdir(mutants_dir)):
+        if not mutant_file.endswith(".py") or mutant_file == "__init__.py":
+            continue
+        mutant_path = os.path.join(mutants_dir, mutant_file)
+        funcs = load_function_from_file(mutant_path, prefix="x_add_values__mutmut")
+        for name in sorted(funcs):
+            jobs.append((mutant_file, mutant_path, name, funcs[name]))
+    return jobs
+
+
+def write_section_marker(log_f, mutant_file, func_name):
+    """在 log 中写入不可见的分隔信息（不会影响终端）"""
+    try:
+        log_f.write("\n" + "="*80 + "\n")
+        log_f.write(f"RUNNING {mutant_file} :: {func_name}  -  {datetime.now().isoformat()}\n")
+        log_f.write("="*80 + "\n")
+        log_f.flush()
+    except Exception:
+        pass
+
+
+def _init_worker():
+    """
+    worker 初始化：先静默收集一次 mutants/tests，让测试模块的导入输出（如 "testadd执行了"）
+    不落在某个具体 mutant 的分片日志里，否则合并结果会随调度顺序变化。
+    """
+    tests_dir = os.path.join(os.path.dirname(__file__), "mutants", "tests")
+    old_stdout, old_stderr = sys.stdout, sys.stderr
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        sys.stdout = sys.stderr = devnull
+        try:
+            pytest.main([tests_dir, "-q", "--collect-only"])
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+
+
+def _run_mutant_job(mutant_path, func_name, part_log_path, nodeids, kill_mode):
+    """
+    进程池 worker 入口：
+    - 在子进程中重新加载 mutant 文件，只注入 func_name 对应的函数（每个 worker 各自持有自己的 CURRENT_MUTANT_FUNC）
+    - 该 mutant 的全部输出（含 pytest -s）写入独立的分片日志 part_log_path
+    返回 ([(func_name, rc)], None, 结构化结果行)
+    """
+    with open(part_log_path, "w", encoding="utf-8") as part_f:
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout = sys.stderr = part_f
+        try:
+            funcs = load_function_from_file(mutant_path, prefix=func_name)
+            rc = run_tests_for_mutant(func_name, funcs[func_name], nodeids, kill_mode)
+        except Exception:
+            traceback.print_exc()
+            rc = -1
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+    mr_metrics.METRICS.flush()
+    return [(func_name, rc)], None, RESULTS.pop_rows()
+
+
+def _run_warm_chunk(chunk, kill_mode):
+    """
+    常驻模式的 worker 入口：一个 worker 只启动一次 pytest，顺序跑完 chunk 中的全部 mutant。
+    chunk: [(mutant_path, func_name, part_log_path, nodeids)]，每个 mutant 的输出仍写入自己的分片日志。
+    返回 ([(func_name, rc)], (startup_seconds, exec_seconds), 结构化结果行)
+    """
+    old_stdout, old_stderr = sys.stdout, sys.stderr
+    part_paths = {name: part_path for _, name, part_path, _ in chunk}
+    selection = {name: nodeids for _, name, _, nodeids in chunk}
+    current = {}
+
+    def switch_output(func_name):
+        if current.get("f") is not None:
+            current["f"].close()
+        current["f"] = open(part_paths[func_name], "w", encoding="utf-8")
+        sys.stdout = sys.stderr = current["f"]
+
+    mutants = []
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        sys.stdout = sys.stderr = devnull
+        loaded = {}
+        for mutant_path, func_name, _, _ in chunk:
+            if mutant_path not in loaded:
+                loaded[mutant_path] = load_function_from_file(mutant_path, prefix="x_add_values__mutmut")
+            mutants.append((func_name, loaded[mutant_path][func_name]))
+        try:
+            session = run_tests_warm(
+                mutants, switch_output=switch_output, selection=selection, kill_mode=kill_mode,
+            )
+        except Exception:
+            traceback.print_exc()
+            raise
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+            if current.get("f") is not None:
+                current["f"].close()
+
+    results = [(name, rc) for name, rc, _ in session.results]
+    mr_metrics.METRICS.flush()
+    return results, (session.startup_seconds, session.exec_seconds), RESULTS.pop_rows()
+
+
+def run_jobs_parallel(jobs, run_dir, log_f, n_jobs, warm=False, selection=None, kill_mode=False):
+    """
+    把 mutant 分发到 n_jobs 个 worker 进程，再把各自的分片日志按 jobs 顺序合并回 stdout（终端 + 主日志）。
+    executor.map 按提交顺序产出结果，所以合并顺序与 worker 完成先后无关。
+    warm=True 时 jobs 被切成 n_jobs 段连续的 chunk，每个 worker 只启动一次 pytest。
+    selection: {func_name: node ID 列表}，见 build_selection。
+    返回 (results, timings)，timings 为各 worker 的 (startup_seconds, exec_seconds)，冷启动模式为 None
+    """
+    selection = selection or {}
+    parts_dir = os.path.join(run_dir, "parts")
+    os.makedirs(parts_dir, exist_ok=True)
+    part_paths = [
+        os.path.join(parts_dir, f"{i:05d}_{sanitize_filename(name)}.log")
+        for i, (_, _, name, _) in enumerate(jobs)
+    ]
+
+    if warm:
+        size = -(-len(jobs) // n_jobs)
+        specs = [
+            (path, name, part, selection.get(name))
+            for (_, path, name, _), part in zip(jobs, part_paths)
+        ]
+        chunks = [specs[i:i + size] for i in range(0, len(specs), size)]
+        task, task_args = _run_warm_chunk, [chunks, [kill_mode] * len(chunks)]
+    else:
+        task = _run_mutant_job
+        task_args = [
+            [path for _, path, _, _ in jobs],
+            [name for _, _, name, _ in jobs],
+            part_paths,
+            [selection.get(name) for _, _, name, _ in jobs],
+            [kill_mode] * len(jobs),
+        ]
+
+    # 使用 spawn：子进程不会继承父进程里被重定向的 stdout / 已打开的日志文件
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    timings = []
+    with ProcessPoolExecutor(max_workers=n_jobs, mp_context=ctx, initializer=_init_worker) as pool:
+        outcomes = []
+        for chunk_results, timing, rows in pool.map(task, *task_args):
+            outcomes.extend(chunk_results)
+            RESULTS.rows.extend(rows)
+            if timing is not None:
+                timings.append(timing)
+        for (mutant_file, _, name, _), part_path, (_, rc) in zip(jobs, part_paths, outcomes):
+            if not results or mutant_file != results[-1][0]:
+                print(f"\n=== Running tests for {mutant_file} ===")
+            write_section_marker(log_f, mutant_file, name)
+            with open(part_path, "r", encoding="utf-8") as part_f:
+                sys.stdout.write(part_f.read())
+            sys.stdout.flush()
+            results.append((mutant_file, name, rc))
+
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return results, (timings or None)
+
+
+def run_jobs_sequential(jobs, log_f, warm=False, selection=None, kill_mode=False):
+    """在当前进程中逐个运行 mutant（原有行为）；warm=True 时整个过程只启动一次 pytest"""
+    selection = selection or {}
+    results = []
+    files = {name: mutant_file for mutant_file, _, name, _ in jobs}
+
+    def switch_output(func_name):
+        # 这些 print 会同时出现在终端与 log（因为 stdout 被重定向）
+        mutant_file = files[func_name]
+        if not results or mutant_file != results[-1][0]:
+            print(f"\n=== Running tests for {mutant_file} ===")
+        write_section_marker(log_f, mutant_file, func_name)
+        results.append((mutant_file, func_name, None))
+
+    if warm:
+        session = run_tests_warm(
+            [(name, func) for _, _, name, func in jobs],
+            switch_output=switch_output,
+            selection=selection,
+            kill_mode=kill_mode,
+        )
+        rcs = {name: rc for name, rc, _ in session.results}
+        results = [(mutant_file, name, rcs.get(name)) for mutant_file, name, _ in results]
+        return results, [(session.startup_seconds, session.exec_seconds)]
+
+    for _, _, name, func in jobs:
+        switch_output(name)
+        # 运行测试（内部 print/pytest 输出被 tee 捕获）
+        rc = run_tests_for_mutant(name, func, selection.get(name), kill_mode)
+        results[-1] = (results[-1][0], name, rc)
+    return results, None
+
+
+def print_cached(cached, log_f):
+    """
+    打印直接沿用缓存结论的 mutant（源码、覆盖测试、MR 生成器都没有变化）；
+    与实际运行的 mutant 一样先写 RUNNING 分隔标记，mutmut_type.py --log 才能从 log 中读出它们的结论
+    """
+    if not cached:
+        return
+    print("\n=== Cached results (source, tests and MR generators unchanged) ===")
+    for mutant_file, name, rc in cached:
+        write_section_marker(log_f, mutant_file, name)
+        print(f"♻️ {name} 沿用上次结论")
+        print_verdict(name, rc)
+
+
+def format_timing(timings, wall_seconds, n_mutants):
+    """启动 vs 执行 的耗时拆分；timings 为 None 表示冷启动模式（每个 mutant 都重新启动 pytest）"""
+    if not timings:
+        return (f"⏱ 冷启动模式：{n_mutants} 个 mutant 总耗时 {wall_seconds:.3f}s"
+                f"（每个 mutant 都重新加载插件、导入 conftest 并收集用例）")
+    startup = sum(t[0] for t in timings)
+    execution = sum(t[1] for t in timings)
+    return (f"⏱ 常驻模式：启动耗时 {startup:.3f}s（{len(timings)} 个会话，每个只收集一次）"
+            f" + 执行耗时 {execution:.3f}s（{n_mutants} 个 mutant），总耗时 {wall_seconds:.3f}s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="对 mutants/src 中的每个 mutant 运行 mutants/tests")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="并行 worker 进程数；1 为串行（默认），0 表示使用全部 CPU 核心",
+    )
+    parser.add_argument(
+        "--warm", action="store_true",
+        help="常驻模式：每个进程只收集一次 mutants/tests，之后每个 mutant 只重新注入函数并重跑已收集的用例",
+    )
+    parser.add_argument(
+        "--all-tests", action="store_true",
+        help="不按 mutants/mutmut-stats.json 选择覆盖用例，每个 mutant 都运行 mutants/tests 下的全部用例",
+    )
+    parser.add_argument(
+        "--kill-mode", action="store_true",
+        help="kill 模式：MR 逐条检查，第一条违反的 MR 即杀死 mutant 并跳过其余用例（设置 MR_KILL_MODE=1）",
+    )
+    parser.add_argument(
+        "--mr-metrics", action="store_true",
+        help="记录每条 MR 的变换 / SUT 耗时与检查结果（run 目录下 mr_metrics.jsonl），结束时打印 MR 排名",
+    )
+    parser.add_argument(
+        "--mr-profile", default=None,
+        help="只运行 mr_profiles.json 中该档位的 MR（例如 fast，见 mr_subset.py）；缺省为完整档位",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="不使用 logs/ 下的结果缓存，重新运行全部 mutant",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     主流程（直接在脚本中通过 DEFAULT_LOG_NAME 修改日志名）：
     - 在 logs/ 下创建 run_YYYYmmdd_HHMMSS/ 文件夹
     - 在该文件夹中创建单个日志文件（名字由 DEFAULT_LOG_NAME 指定，若重名自动编号）
     - 终端输出不变，同时写入日志文件
+    - --jobs N：用 N 个进程并行运行 mutant，日志按固定顺序合并
+    - --warm：常驻 pytest 会话，最后打印 启动 vs 执行 的耗时拆分
+    - 默认按 mutants/mutmut-stats.json 只运行覆盖该 mutant 的用例（最快优先），--all-tests 关闭
+    - --kill-mode：第一条违反的 MR 即杀死 mutant，记录是哪条 MR
+    - 默认只重跑缓存失效的 mutant（见 result_cache.ResultCache），--no-cache 关闭
     """
+    args = parse_args(argv)
+    n_jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    timing_line = None
+    cache = None
+    results_path = None
+
     # 1) 创建运行目录与唯一日志文件路径
     base_logs_dir = ensure_logs_dir("logs")
     run_dir = make_run_dir(base_logs_dir, prefix="run")
@@ -182,6 +685,10 @@ def main():
             infof.write(f"start_time: {start_time}\n")
             infof.write(f"run_dir: {run_dir}\n")
             infof.write(f"default_log_name: {DEFAULT_LOG_NAME}\n")
+            infof.write(f"jobs: {n_jobs}\n")
+            infof.write(f"warm: {args.warm}\n")
+            infof.write(f"kill_mode: {args.kill_mode}\n")
+            infof.write(f"mr_profile: {args.mr_profile or 'full'}\n")
     except Exception:
         pass
 
@@ -189,45 +696,85 @@ def main():
     run_log_path = make_unique_path(run_dir, DEFAULT_LOG_NAME)
 
     # 打开日志文件（覆盖写入，每次 run 保持干净；若想追加把 "w" 改为 "a"）
-    log_f = open(run_log_path, "w", encoding="utf-8", buffering=1)
+    # 由后台线程批量写入；section 标记也写进同一个 writer，保证与测试输出的先后顺序
+    log_f = AsyncLogWriter(open(run_log_path, "w", encoding="utf-8"))
 
-    # 2) 重定向 stdout/stderr 到 Tee(orig_terminal, log_file)
+    # 2) 重定向 stdout/stderr 到 LogSink(orig_terminal, log_writer)
     orig_stdout = sys.__stdout__
     orig_stderr = sys.__stderr__
-    sys.stdout = Tee(orig_stdout, log_f)
-    sys.stderr = Tee(orig_stderr, log_f)
+    sys.stdout = LogSink(orig_stdout, log_f)
+    sys.stderr = LogSink(orig_stderr, log_f)
 
     try:
         # 3) 主逻辑：遍历 mutants/src 并运行（保持原有行为）
         mutants_dir = os.path.join(os.path.dirname(__file__), "mutants", "src")
 
-        for mutant_file in sorted(os.listdir(mutants_dir)):
-            if not mutant_file.endswith(".py") or mutant_file == "__init__.py":
-                continue
-
-            mutant_path = os.path.join(mutants_dir, mutant_file)
-            # 这些 print 会同时出现在终端与 log（因为 stdout 被重定向）
-            print(f"\n=== Running tests for {mutant_file} ===")
-
-            spec = importlib.util.spec_from_file_location("mutant_module", mutant_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            for name, func in inspect.getmembers(module, inspect.isfunction):
-                if not name.startswith("x_add_values__mutmut"):
-                    continue
-
-                # 在 log 中写入不可见的分隔信息（不会影响终端）
-                try:
-                    log_f.write("\n" + "="*80 + "\n")
-                    log_f.write(f"RUNNING {mutant_file} :: {name}  -  {datetime.now().isoformat()}\n")
-                    log_f.write("="*80 + "\n")
-                    log_f.flush()
-                except Exception:
-                    pass
-
-                # 运行测试（内部 print/pytest 输出被 tee 捕获）
-                run_tests_for_mutant(name, func)
+        jobs = iter_mutant_jobs(mutants_dir)
+        stats = None if args.all_tests else load_mutmut_stats()
+        selection = build_selection(jobs, stats)
+
+        if args.mr_profile:
+            # MREngine 通过 mr_subset.active_mrs() 读取；结果缓存键也包含档位，所以要在查缓存之前设置
+            os.environ["MR_PROFILE"] = args.mr_profile
+
+        # 源码 / 覆盖测试 / MR 生成器都没变的 mutant 直接沿用上次结论
+        keys = {}
+        cached = []
+        if not args.no_cache:
+            cache = ResultCache()
+            to_run = []
+            for job in jobs:
+                name = job[2]
+                keys[name] = cache.key(job[3], selection.get(name))
+                rc = cache.get(name, keys[name])
+                if rc is None:
+                    to_run.append(job)
+                else:
+                    cached.append((job[0], name, rc))
+                    RESULTS.add_verdict(name, rc, "cached")
+            jobs = to_run
+        print_cached(cached, log_f)
+
+        if args.kill_mode:
+            # 测试文件通过环境变量切换 kill 模式；spawn 出来的 worker 也会继承
+            os.environ["MR_KILL_MODE"] = "1"
+        if args.mr_metrics:
+            metrics_path = os.path.abspath(os.path.join(run_dir, "mr_metrics.jsonl"))
+            os.environ["MR_METRICS"] = metrics_path
+            mr_metrics.METRICS.path = metrics_path
+
+        t0 = time.perf_counter()
+        if not jobs:
+            results, timings = [], None
+        elif n_jobs > 1:
+            results, timings = run_jobs_parallel(
+                jobs, run_dir, log_f, n_jobs, warm=args.warm, selection=selection, kill_mode=args.kill_mode,
+            )
+        else:
+            results, timings = run_jobs_sequential(
+                jobs, log_f, warm=args.warm, selection=selection, kill_mode=args.kill_mode,
+            )
+        if jobs:
+            timing_line = format_timing(timings, time.perf_counter() - t0, len(jobs))
+        else:
+            timing_line = "⏱ 全部 mutant 命中结果缓存，未启动 pytest"
+        print(f"\n{timing_line}")
+
+        if cache is not None:
+            for _, name, rc in results:
+                cache.put(name, keys.get(name), rc)
+            cache.save()
+            print(f"♻️ 结果缓存：命中 {cache.hits} 个，未命中 {cache.misses} 个")
+
+        if args.mr_metrics:
+            mr_metrics.METRICS.flush()
+            if os.path.exists(metrics_path):
+                print("\n📈 MR 排名（独占杀死数 / 毫秒）：")
+                mr_metrics.print_report(mr_metrics.rank_mrs(mr_metrics.load_metrics(metrics_path)))
+
+        # 结构化结果：每行一个 (mutant, 用例, MR)，见 run_results.py
+        results_path = write_results(RESULTS.pop_rows(), run_dir, run_id=os.path.basename(run_dir))
+        print(f"📊 结构化结果已写入 {results_path}")
 
     except Exception:
         # 若主流程抛出未捕获异常，也写入日志（stderr 已被重定向）
@@ -246,13 +793,20 @@ def main():
             with open(os.path.join(run_dir, "run_info.txt"), "a", encoding="utf-8") as infof:
                 infof.write(f"end_time: {end_time}\n")
                 infof.write(f"final_log_path: {run_log_path}\n")
+                if timing_line:
+                    infof.write(f"timing: {timing_line}\n")
+                if results_path:
+                    infof.write(f"results_path: {results_path}\n")
+                if cache is not None:
+                    infof.write(f"cache_hits: {cache.hits}\n")
+                    infof.write(f"cache_misses: {cache.misses}\n")
         except Exception:
             pass
 
         try:
             log_f.close()
-        except Exception:
-            pass
+        except Exception as exc:
+            print(f"⚠️ 写日志文件失败，{run_log_path} 可能不完整：{exc}")
 
         # 恢复到原始终端后打印日志位置（仅一行，不会改变测试输出）
         print(f"All logs for this run were saved to: {run_log_path}")
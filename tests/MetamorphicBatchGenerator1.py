@@ -0,0 +1,131 @@
+import numpy as np
+
+
+# MetamorphicTestGenerator1 的批量（向量化）版本：一次变换整批输入，而不是逐个列表做推导式。
+# 每个方法接受两种批量形式，并以相同形式返回：
+# - 二维数组 batch：每一行是一个输入（所有输入等长）
+# - 不等长批量 (values, offsets)：values 为所有输入首尾相接的一维数组，
+#   第 i 个输入是 values[offsets[i]:offsets[i + 1]]（CSR 风格，len(offsets) == 输入个数 + 1）
+# 结果与 MetamorphicTestGenerator1 中对应的单列表方法逐元素一致（假设元素在 int64 范围内）。
+
+
+def to_ragged(inputs):
+    """[[...], [...], ...] -> (values, offsets)"""
+    lengths = np.fromiter((len(x) for x in inputs), dtype=np.int64, count=len(inputs))
+    offsets = np.zeros(len(inputs) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter((v for x in inputs for v in x), dtype=np.int64, count=int(offsets[-1]))
+    return values, offsets
+
+
+def from_ragged(values, offsets):
+    """(values, offsets) -> [[...], [...], ...]（Python 列表，便于与单列表方法比较）"""
+    flat = values.tolist()
+    bounds = offsets.tolist()
+    return [flat[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def _segments(offsets):
+    """每个元素所属的输入编号，以及它在该输入中的下标"""
+    lengths = np.diff(offsets)
+    seg = np.repeat(np.arange(len(lengths)), lengths)
+    pos = np.arange(int(offsets[-1])) - offsets[seg]
+    return seg, pos
+
+
+class MetamorphicBatchGenerator1:
+
+    # MR2: 数组元素常数加法 (+3)
+    @staticmethod
+    def applyMR2(batch, offsets=None):
+        if offsets is None:
+            return batch + 3
+        return batch + 3, offsets.copy()
+
+    # MR5: 数组缩放变换
+    @staticmethod
+    def applyMR5(batch, constant, offsets=None):
+        if offsets is None:
+            return batch * constant
+        return batch * constant, offsets.copy()
+
+    # MR6: 数组反转变换（每个输入各自反转）
+    @staticmethod
+    def applyMR6(batch, offsets=None):
+        if offsets is None:
+            return batch[:, ::-1].copy()
+        seg, pos = _segments(offsets)
+        return batch[offsets[seg + 1] - 1 - pos], offsets.copy()
+
+    # MR7_1: 所有元素乘以1
+    @staticmethod
+    def applyMR7_1(batch, offsets=None):
+        if offsets is None:
+            return batch * 1
+        return batch * 1, offsets.copy()
+
+    # MR7_2: 所有元素加0
+    @staticmethod
+    def applyMR7_2(batch, offsets=None):
+        if offsets is None:
+            return batch + 0
+        return batch + 0, offsets.copy()
+
+    # MR8: 重复输入数组（每个输入各自首尾相接复制一次）
+    @staticmethod
+    def applyMR8(batch, offsets=None):
+        if offsets is None:
+            return np.concatenate([batch, batch], axis=1)
+        lengths = np.diff(offsets)
+        new_offsets = offsets * 2
+        seg, pos = _segments(new_offsets)
+        src = offsets[seg] + pos % np.maximum(lengths[seg], 1)
+        return batch[src], new_offsets
+
+    # MR9: 复合转换一致性（缩放后再排序，每个输入各自排序）
+    @staticmethod
+    def applyMR9(batch, constant, offsets=None):
+        scaled = batch * constant
+        if offsets is None:
+            return np.sort(scaled, axis=1)
+        seg, _ = _segments(offsets)
+        return scaled[np.lexsort((scaled, seg))], offsets.copy()
+
+    # MR10: 单调性检验（第 i 个元素加 i）
+    @staticmethod
+    def applyMR10(batch, offsets=None):
+        if offsets is None:
+            return batch + np.arange(batch.shape[1])
+        _, pos = _segments(offsets)
+        return batch + pos, offsets.copy()
+
+    # MR12: 数值取反变换
+    @staticmethod
+    def applyMR12(batch, offsets=None):
+        if offsets is None:
+            return -batch
+        return -batch, offsets.copy()
+
+    # MR13: 微小增量调整（结果为 float64）
+    @staticmethod
+    def applyMR13(batch, offsets=None):
+        if offsets is None:
+            return batch + 1e-10
+        return batch + 1e-10, offsets.copy()
+
+    # MR20: 边界值灵敏度（每个输入中等于最小值的元素加一个极小值，结果为 float64）
+    @staticmethod
+    def applyMR20(batch, offsets=None):
+        transformed = batch.astype(np.float64)
+        if offsets is None:
+            if batch.shape[1]:
+                transformed[batch == batch.min(axis=1, keepdims=True)] += 1e-10
+            return transformed
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        mins = np.zeros(len(lengths), dtype=batch.dtype)
+        if nonempty.any():
+            mins[nonempty] = np.minimum.reduceat(batch, offsets[:-1][nonempty])
+        seg, _ = _segments(offsets)
+        transformed[batch == mins[seg]] += 1e-10
+        return transformed, offsets.copy()
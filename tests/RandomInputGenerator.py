@@ -0,0 +1,111 @@
+import math
+import random
+from itertools import count as _count, islice
+
+
+class RandomInputGenerator:
+    """
+    可复现的随机输入生成器（惰性、流式）：
+    - add_values_inputs(): 任意长度的整数列表
+    - bi_search_inputs(): 升序数组 + 合法窗口 (elements, key, froom, to)
+
+    同一个 seed 得到完全相同的用例序列；第 i 个用例只由 (seed, 种类, i) 决定，
+    所以 case_*(i) 可以单独重现某一个用例，生成器本身也不持有已产出的用例，可以产出任意多个。
+
+    size: 长度分布
+        ("fixed", n) / ("uniform", lo, hi) / ("geometric", mean) / ("loguniform", lo, hi)
+        或者 callable(rng) -> int
+    value_range: 元素取值范围 (lo, hi)，闭区间
+    duplicate_density: 0~1，元素与之前某个元素重复的概率（升序数组中表现为相邻元素相等）
+    """
+
+    def __init__(self, seed=0, size=("uniform", 5, 6), value_range=(-10, 10), duplicate_density=0.0):
+        if not 0.0 <= duplicate_density <= 1.0:
+            raise ValueError("duplicate_density must be within [0, 1]")
+        if value_range[0] > value_range[1]:
+            raise ValueError("value_range must be (lo, hi) with lo <= hi")
+        self.seed = seed
+        self.size = size
+        self.value_range = value_range
+        self.duplicate_density = duplicate_density
+
+    def _rng(self, kind, index):
+        # 字符串种子在不同进程、不同 PYTHONHASHSEED 下都稳定
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    def _draw_size(self, rng, minimum=0):
+        spec = self.size
+        if callable(spec):
+            n = spec(rng)
+        elif spec[0] == "fixed":
+            n = spec[1]
+        elif spec[0] == "uniform":
+            n = rng.randint(spec[1], spec[2])
+        elif spec[0] == "geometric":
+            # 均值为 spec[1] 的几何分布（取值 >= 0）
+            p = 1.0 / (spec[1] + 1.0)
+            n = int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) if p < 1.0 else 0
+        elif spec[0] == "loguniform":
+            n = int(round(math.exp(rng.uniform(math.log(max(spec[1], 1)), math.log(max(spec[2], 1))))))
+        else:
+            raise ValueError(f"unknown size distribution: {spec[0]!r}")
+        return max(int(n), minimum)
+
+    # ---------------- add_values ----------------
+    def case_add_values(self, index):
+        """第 index 个 add_values 输入（整数列表）"""
+        rng = self._rng("add_values", index)
+        lo, hi = self.value_range
+        data = []
+        for _ in range(self._draw_size(rng)):
+            if data and rng.random() < self.duplicate_density:
+                data.append(data[rng.randrange(len(data))])
+            else:
+                data.append(rng.randint(lo, hi))
+        return data
+
+    def add_values_inputs(self, count=None, start=0):
+        """惰性产出 add_values 输入；count=None 时无限产出"""
+        indices = _count(start) if count is None else range(start, start + count)
+        return (self.case_add_values(i) for i in indices)
+
+    # ---------------- bi_SearchFromTo ----------------
+    def case_bi_search(self, index, hit_ratio=1.0):
+        """
+        第 index 个 bi_SearchFromTo 输入：(elements, key, froom, to)
+        elements 升序；0 <= froom <= to <= len(elements) - 1；
+        以 hit_ratio 的概率 key 取自窗口内的元素（命中），否则取窗口内不存在的值（未命中）
+        """
+        rng = self._rng("bi_search", index)
+        n = self._draw_size(rng, minimum=1)
+        lo, hi = self.value_range
+        # 升序：以 duplicate_density 的概率与前一个元素相等，否则递增一个随机步长
+        step_max = max(1, (hi - lo) // max(n, 1))
+        elements = [rng.randint(lo, hi)]
+        for _ in range(n - 1):
+            if rng.random() < self.duplicate_density:
+                elements.append(elements[-1])
+            else:
+                elements.append(elements[-1] + rng.randint(1, step_max))
+
+        froom = rng.randrange(n)
+        to = rng.randrange(froom, n)
+        window = elements[froom:to + 1]
+        if rng.random() < hit_ratio:
+            key = window[rng.randrange(len(window))]
+        else:
+            present = set(window)
+            candidates = [window[0] - 1, window[-1] + 1]
+            candidates += [v + 1 for v in window if v + 1 not in present]
+            key = candidates[rng.randrange(len(candidates))]
+        return elements, key, froom, to
+
+    def bi_search_inputs(self, count=None, start=0, hit_ratio=1.0):
+        """惰性产出 bi_SearchFromTo 输入；count=None 时无限产出"""
+        indices = _count(start) if count is None else range(start, start + count)
+        return (self.case_bi_search(i, hit_ratio) for i in indices)
+
+
+def take(iterable, n):
+    """取前 n 个用例（用于 pytest.mark.parametrize 之类需要列表的地方）"""
+    return list(islice(iterable, n))
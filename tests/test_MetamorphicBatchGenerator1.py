@@ -0,0 +1,50 @@
+import random
+import pytest
+from MetamorphicTestGenerator1 import MetamorphicTestGenerator1
+
+np = pytest.importorskip("numpy")
+from MetamorphicBatchGenerator1 import MetamorphicBatchGenerator1, to_ragged, from_ragged
+
+
+# (MR 名称, 单列表变换, 批量变换)；批量变换的最后一个参数是 offsets（二维批量时为 None）
+BATCH_MRS = [
+    ("MR2", MetamorphicTestGenerator1.applyMR2, MetamorphicBatchGenerator1.applyMR2),
+    ("MR5", lambda x: MetamorphicTestGenerator1.applyMR5(x, 2),
+     lambda b, o=None: MetamorphicBatchGenerator1.applyMR5(b, 2, o)),
+    ("MR6", MetamorphicTestGenerator1.applyMR6, MetamorphicBatchGenerator1.applyMR6),
+    ("MR7_1", MetamorphicTestGenerator1.applyMR7_1, MetamorphicBatchGenerator1.applyMR7_1),
+    ("MR7_2", MetamorphicTestGenerator1.applyMR7_2, MetamorphicBatchGenerator1.applyMR7_2),
+    ("MR8", MetamorphicTestGenerator1.applyMR8, MetamorphicBatchGenerator1.applyMR8),
+    ("MR9", lambda x: MetamorphicTestGenerator1.applyMR9(x, 3),
+     lambda b, o=None: MetamorphicBatchGenerator1.applyMR9(b, 3, o)),
+    ("MR10", MetamorphicTestGenerator1.applyMR10, MetamorphicBatchGenerator1.applyMR10),
+    ("MR12", MetamorphicTestGenerator1.applyMR12, MetamorphicBatchGenerator1.applyMR12),
+    ("MR13", MetamorphicTestGenerator1.applyMR13, MetamorphicBatchGenerator1.applyMR13),
+    ("MR20", MetamorphicTestGenerator1.applyMR20, MetamorphicBatchGenerator1.applyMR20),
+]
+
+SAME_LENGTH_INPUTS = [
+    [1, 3, 2, 6, 9],
+    [2, 1, 4, 4, 2],
+    [4, -2, 4, 6, 2],
+    [-1, 9, 1, -3, -3],
+    [-2, 3, 1, 4, 7],
+]
+
+
+def ragged_inputs(seed=0, count=200):
+    rng = random.Random(seed)
+    return [[rng.randint(-20, 20) for _ in range(rng.randint(0, 12))] for _ in range(count)]
+
+
+@pytest.mark.parametrize("name, single, batched", BATCH_MRS, ids=[m[0] for m in BATCH_MRS])
+def test_batch_2d_matches_single(name, single, batched):
+    result = batched(np.array(SAME_LENGTH_INPUTS, dtype=np.int64))
+    assert result.tolist() == [single(x) for x in SAME_LENGTH_INPUTS], name
+
+
+@pytest.mark.parametrize("name, single, batched", BATCH_MRS, ids=[m[0] for m in BATCH_MRS])
+def test_batch_ragged_matches_single(name, single, batched):
+    inputs = ragged_inputs()
+    values, offsets = batched(*to_ragged(inputs))
+    assert from_ragged(values, offsets) == [single(x) for x in inputs], name
@@ -0,0 +1,31 @@
+import pytest
+from RandomInputGenerator import RandomInputGenerator, take
+
+
+def test_same_seed_same_cases():
+    a = RandomInputGenerator(seed=42, size=("geometric", 8), duplicate_density=0.5)
+    b = RandomInputGenerator(seed=42, size=("geometric", 8), duplicate_density=0.5)
+    assert take(a.add_values_inputs(), 100) == take(b.add_values_inputs(), 100)
+    assert take(a.bi_search_inputs(), 100) == take(b.bi_search_inputs(), 100)
+    # 第 i 个用例可以单独重现
+    assert a.case_add_values(57) == take(b.add_values_inputs(start=57), 1)[0]
+
+
+@pytest.mark.parametrize("hit_ratio", [0.0, 0.5, 1.0])
+def test_bi_search_windows_are_valid(hit_ratio):
+    gen = RandomInputGenerator(seed=3, size=("loguniform", 1, 500), duplicate_density=0.4)
+    for elements, key, froom, to in gen.bi_search_inputs(200, hit_ratio=hit_ratio):
+        assert elements == sorted(elements)
+        assert 0 <= froom <= to <= len(elements) - 1
+        hit = key in elements[froom:to + 1]
+        if hit_ratio == 1.0:
+            assert hit
+        elif hit_ratio == 0.0:
+            assert not hit
+
+
+def test_duplicate_density_and_sizes():
+    gen = RandomInputGenerator(seed=1, size=("fixed", 50), value_range=(0, 10 ** 9), duplicate_density=1.0)
+    for data in gen.add_values_inputs(20):
+        assert len(data) == 50
+        assert len(set(data)) == 1
@@ -0,0 +1,62 @@
+import array
+import math
+import pytest
+import add_values_backend as backend
+from add_values import add_values
+from add_values_backend import loop_sum
+from sequence_views import ConcatView
+
+
+def _outcome(fn, data):
+    try:
+        result = fn(data)
+    except Exception as exc:  # 比较异常类型与消息
+        return type(exc), str(exc)
+    return type(result), result
+
+
+@pytest.mark.parametrize("data", [
+    [], [1, 2, 3], (4, -5), [True, 2], [10 ** 30, -1], [1, 2.5, 3], [0.1] * 10, [1e308, 1e308, -1e308],
+    [1, None], [1, "a"], ["a", "b"], [[1], [2]],
+])
+def test_list_semantics_match_loop(data):
+    assert _outcome(add_values, data) == _outcome(loop_sum, data)
+
+
+def test_generic_iterables_are_chunked(monkeypatch):
+    monkeypatch.setattr(backend, "CHUNK_SIZE", 3)
+    assert add_values(iter(range(10))) == 45
+    assert add_values(ConcatView([1, 2], (3,))) == 6
+    assert add_values(x * 0.1 for x in range(7)) == loop_sum(x * 0.1 for x in range(7))
+    assert _outcome(add_values, iter([1, 2, 3, 4, "a"])) == _outcome(loop_sum, iter([1, 2, 3, 4, "a"]))
+
+
+def test_buffers():
+    assert add_values(array.array("q", [1, 2, 3])) == 6
+    assert add_values(memoryview(array.array("i", [1, -2]))) == -1
+    assert add_values(b"\x01\x02") == 3
+    assert add_values(array.array("d", [0.1] * 10)) == math.fsum([0.1] * 10) == 1.0
+    assert add_values(array.array("d", [1e308, 1e308])) == math.inf
+    assert math.isnan(add_values(array.array("d", [math.inf, -math.inf])))
+    assert _outcome(add_values, memoryview(b"ab").cast("c")) == _outcome(loop_sum, memoryview(b"ab").cast("c"))
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    assert add_values(np.arange(10)) == 45
+    assert add_values(np.ones((3, 2))).tolist() == [3.0, 3.0]
+    assert add_values(np.array([], dtype=np.float64)) == 0
+    assert add_values(np.array([1, 2], dtype=object)) == 3
+    with pytest.raises(TypeError):
+        add_values(np.array(5))
+
+
+@pytest.mark.parametrize("dtype", ["int8", "int16", "uint8", "int32", "int64", "uint64", "bool"])
+def test_numpy_integer_dtypes_match_loop(dtype):
+    np = pytest.importorskip("numpy")
+    data = np.full(1000, 120, dtype=dtype)
+    with np.errstate(over="ignore"):
+        expected = loop_sum(data)
+    result = add_values(data)
+    assert result == expected and result.dtype == expected.dtype
+    assert add_values(np.array([100, 100, 100], dtype=np.int8)) == 44
@@ -0,0 +1,41 @@
+import array
+import random
+import pytest
+from benchmarks.bench_sut import check_search, compare, iter_cases, search_keys, sorted_values, window
+
+
+def test_cases_verify_at_small_sizes():
+    containers = {"int-list": ("int", lambda xs: xs), "array-d": ("float", lambda xs: array.array("d", xs))}
+    names = []
+    for name, prepare in iter_cases([1, 10], containers):
+        verify, run, units = prepare()
+        verify()
+        names.append(name)
+    assert "add_values/array-d/n=10" in names
+    assert "bi_SearchFromTo/int-list/n=1/w64/hit=0.0" in names
+
+
+@pytest.mark.parametrize("hit, expect_hits", [(1.0, True), (0.0, False)])
+def test_search_keys_respect_hit_ratio(hit, expect_hits):
+    rng = random.Random(0)
+    froom, to = window(1000, "w64", rng)
+    assert to - froom + 1 == 64
+    keys = search_keys(1000, froom, to, hit, "int", rng, count=50)
+    assert all((k % 2 == 0) == expect_hits for k in keys)
+    assert all(2 * froom <= k <= 2 * to + 1 for k in keys)
+
+
+def test_check_search_rejects_wrong_answers():
+    elements = sorted_values(10, "int")
+    check_search(elements, 6, 0, 9, 3)
+    check_search(elements, 7, 0, 9, -5)
+    with pytest.raises(AssertionError):
+        check_search(elements, 7, 0, 9, -4)
+    with pytest.raises(AssertionError):
+        check_search(elements, 6, 0, 9, 2)
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {"a": {"seconds": 1e-3}, "b": {"seconds": 1e-3}, "tiny": {"seconds": 1e-7}, "gone": {"seconds": 1.0}}
+    results = {"a": {"seconds": 1.2e-3}, "b": {"seconds": 2e-3}, "tiny": {"seconds": 1e-6}, "new": {"seconds": 1.0}}
+    assert [r[0] for r in compare(results, baseline, threshold=0.25)] == ["b"]
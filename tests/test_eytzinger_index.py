@@ -0,0 +1,109 @@
+import pytest
+from bi_SearchFromTo import bi_SearchFromTo
+import eytzinger_index
+from eytzinger_index import EytzingerIndex, clear_index_cache, eytzinger_SearchFromTo, window_index
+from mr_registry import ENGINE, kill_mode_enabled
+from test_bi_SearchFromTo import FIXED_CASES, RANDOM_CASES, RANDOM_GENERATOR, RANDOM_SEED, window_keys
+from RandomInputGenerator import take
+
+
+def check_same_query(elements, key, froom, to, result):
+    """未命中时与 bi_SearchFromTo 完全相同；命中时是窗口内最左边的相等元素"""
+    expected = bi_SearchFromTo(elements, key, froom, to)
+    if expected < 0:
+        assert result == expected
+    else:
+        assert froom <= result <= to and elements[result] == key
+        assert result == froom or elements[result - 1] < key
+
+
+def test_layout_is_bfs_order():
+    index = EytzingerIndex([1, 2, 3, 4, 5, 6, 7])
+    assert index.tree[1:] == [4, 2, 6, 1, 3, 5, 7]
+    assert [index.rank[k] for k in range(1, 8)] == [3, 1, 5, 0, 2, 4, 6]
+    assert EytzingerIndex([]).search(3, 0, -1) == -1
+
+
+# MR 套件直接套在 eytzinger_SearchFromTo 上（签名与 bi_SearchFromTo 相同）
+@pytest.mark.parametrize("originalInput, key, from_, to", FIXED_CASES)
+def test_eytzinger_SearchFromTo(originalInput, key, from_, to):
+    check_same_query(originalInput, key, from_, to, eytzinger_SearchFromTo(originalInput, key, from_, to))
+    ENGINE.run("eytzinger_SearchFromTo", eytzinger_SearchFromTo, (originalInput, key, from_, to),
+               fail_fast=kill_mode_enabled())
+
+
+@pytest.mark.parametrize(
+    "originalInput, key, from_, to",
+    take(RANDOM_GENERATOR.bi_search_inputs(hit_ratio=1.0), RANDOM_CASES),
+    ids=[f"seed{RANDOM_SEED}-{i}" for i in range(RANDOM_CASES)],
+)
+def test_eytzinger_SearchFromTo_random(originalInput, key, from_, to):
+    test_eytzinger_SearchFromTo(originalInput, key, from_, to)
+
+
+@pytest.mark.parametrize("hit_ratio", [1.0, 0.5, 0.0])
+def test_queries_match_bi_SearchFromTo(hit_ratio):
+    for elements, key, from_, to in take(RANDOM_GENERATOR.bi_search_inputs(hit_ratio=hit_ratio), RANDOM_CASES):
+        index = EytzingerIndex(elements)
+        keys = list(range(min(elements) - 2, max(elements) + 3))
+        for k in keys:
+            check_same_query(elements, k, from_, to, index.search(k, from_, to))
+        np = pytest.importorskip("numpy")
+        assert index.search_batch(keys, from_, to).tolist() == [index.search(k, from_, to) for k in keys]
+        froms = [(from_ + i) % (to + 1) for i in range(len(keys))]
+        assert index.search_batch(np.array(keys), froms, to).tolist() == \
+            [index.search(k, f, to) for k, f in zip(keys, froms)]
+
+
+@pytest.mark.parametrize("originalInput, key, from_, to", [c for c in FIXED_CASES if c[3] < len(c[0])])
+def test_window_keys_on_fixed_cases(originalInput, key, from_, to):
+    index = EytzingerIndex(originalInput)
+    for k in window_keys(originalInput, key, from_, to):
+        check_same_query(originalInput, k, from_, to, index.search(k, from_, to))
+
+
+def test_windows_outside_the_array():
+    # 索引抛 IndexError；替换函数退回 bi_SearchFromTo，结果或异常与它相同
+    index = EytzingerIndex([1, 2, 3])
+    for froom, to in [(0, 3), (-1, 2)]:
+        with pytest.raises(IndexError):
+            index.search(2, froom, to)
+        assert eytzinger_SearchFromTo([1, 2, 3], 2, froom, to) == bi_SearchFromTo([1, 2, 3], 2, froom, to)
+    with pytest.raises(IndexError):
+        bi_SearchFromTo([1, 2, 3], 9, 0, 5)
+    with pytest.raises(IndexError):
+        eytzinger_SearchFromTo([1, 2, 3], 9, 0, 5)
+    np = pytest.importorskip("numpy")
+    with pytest.raises(IndexError):
+        index.search_batch([1, 2], [0, 1], [2, 3])
+    assert index.search_batch([1, 2], 2, 1).tolist() == [-3, -3]    # 空窗口不检查
+
+
+def test_window_index_is_cached(monkeypatch):
+    clear_index_cache()
+    monkeypatch.setattr(eytzinger_index, "INDEX_CACHE_SIZE", 2)
+    elements = list(range(0, 2000, 2))
+    first = window_index(elements, 0, 999)
+    for key in range(0, 2000, 7):
+        check_same_query(elements, key, 0, 999, eytzinger_SearchFromTo(elements, key, 0, 999))
+    assert window_index(elements, 0, 999) is first
+    assert window_index(list(elements), 0, 999) is not first        # 内容相同的另一个序列
+    window_index(elements, 1, 999)
+    latest = window_index(elements, 2, 999)
+    assert window_index(elements, 0, 999) is not first              # 超出缓存个数后被淘汰
+    elements.append(5000)
+    assert window_index(elements, 2, 999) is not latest             # 长度变了，重新构建
+    clear_index_cache()
+
+
+def test_adapter_only_needs_sorted_window():
+    elements = [9, 0, 1, 3, 3, 5, -4]          # 窗口 [1, 5] 之外无序
+    for key in range(-1, 7):
+        check_same_query(elements, key, 1, 5, eytzinger_SearchFromTo(elements, key, 1, 5))
+    assert eytzinger_SearchFromTo(elements, 3, 4, 3) == bi_SearchFromTo(elements, 3, 4, 3) == -5
+    index = EytzingerIndex(sorted(elements))
+    assert eytzinger_SearchFromTo(index, 3, 0, 6) == 3
+    # 窗口内无序：不建索引，结果与 bi_SearchFromTo 的探测路径相同
+    assert window_index(elements, 0, 3) is None
+    for key in range(-5, 11):
+        assert eytzinger_SearchFromTo(elements, key, 0, 3) == bi_SearchFromTo(elements, key, 0, 3)
@@ -0,0 +1,72 @@
+import json
+import os
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = '''\
+from mr_registry import EQUAL, MREngine, MRRegistry
+
+REGISTRY = MRRegistry()
+REGISTRY.register("MR7", lambda xs: xs + [1], EQUAL, ["s"])
+REGISTRY.register("MR8", lambda xs: xs + [2], EQUAL, ["s"])
+
+
+def test_checks():
+    MREngine(REGISTRY, memo=None).run("s", sum, ([1, 2],))
+
+
+def test_kill_mode():
+    MREngine(REGISTRY, memo=None).run("s", sum, ([1, 2],), fail_fast=True)
+
+
+def test_plain_assert():
+    assert sum([1, 2]) == 4
+
+
+def test_passes():
+    MREngine(REGISTRY, memo=None).run("s", sum, ([],), selected=set())
+'''
+
+
+@pytest.fixture
+def failure_records(pytester, monkeypatch):
+    """在临时目录中用本仓库的 conftest 运行 SAMPLE，返回 {用例名: 失败记录}"""
+    monkeypatch.setenv("MUTANT_ID", "add_values.x_add_values__mutmut_2")
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([ROOT, os.path.join(ROOT, "src")]))
+    for name in ("MR_KILL_MODE", "MR_PROFILE", "MR_METRICS", "MR_MEMO"):
+        monkeypatch.delenv(name, raising=False)
+    with open(os.path.join(ROOT, "conftest.py"), encoding="utf-8") as fh:
+        pytester.makeconftest(fh.read())
+    pytester.makepyfile(test_sample=SAMPLE)
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    result.assert_outcomes(passed=1, failed=3)
+    records = {}
+    for path in (pytester.path / "pytest_mutant_logs").glob("failures_*.jsonl"):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            record = json.loads(line)
+            records[record["nodeid"].rpartition("::")[2]] = record
+    return records
+
+
+def _def_line(name):
+    return SAMPLE.splitlines().index(f"def {name}():") + 1
+
+
+def test_records_mr_and_test_location(failure_records):
+    assert set(failure_records) == {"test_checks", "test_kill_mode", "test_plain_assert"}
+    for name, record in failure_records.items():
+        assert record["mutant_id"] == "add_values.x_add_values__mutmut_2"
+        assert (record["file"], record["line"]) == ("test_sample.py", _def_line(name))
+
+    checks = failure_records["test_checks"]
+    assert checks["mr"] == "MR7" and checks["exc_type"] == "check"
+    assert [c["mr"] for c in checks["checks"]] == ["MR7", "MR8"]
+    assert checks["checks"][0]["assert_expr"] == "3 == 4"
+    assert "MR8 failed" in checks["longrepr"] and "\n" not in checks["longrepr"]
+
+    kill = failure_records["test_kill_mode"]
+    assert kill["mr"] == "MR7" and kill["exc_type"] == "Failed" and "checks" not in kill
+
+    plain = failure_records["test_plain_assert"]
+    assert plain["mr"] is None and plain["exc_type"] == "AssertionError"
@@ -0,0 +1,70 @@
+import random
+import pytest
+from bi_SearchFromTo import bi_SearchFromTo, bi_SearchFromTo_batch
+from mapped_keys import MappedKeys, search_file, write_keys
+
+
+@pytest.fixture
+def keyfile(tmp_path):
+    rng = random.Random(0)
+    keys = sorted(rng.randint(-500, 500) for _ in range(5000))   # 含大量重复值
+    path = str(tmp_path / "keys.bin")
+    write_keys(path, keys)
+    return path, keys
+
+
+@pytest.mark.parametrize("stride", [None, 1, 64])
+def test_same_results_as_in_memory_list(keyfile, stride):
+    path, keys = keyfile
+    rng = random.Random(1)
+    with MappedKeys(path, index_stride=stride) as mapped:
+        assert len(mapped) == len(keys) and mapped[10] == keys[10] and mapped[-1] == keys[-1]
+        for _ in range(500):
+            key = rng.randint(-520, 520)
+            froom = rng.randint(0, len(keys) - 1)
+            to = rng.choice([len(keys) - 1, rng.randint(froom - 1, len(keys) - 1)])
+            assert bi_SearchFromTo(mapped, key, froom, to) == bi_SearchFromTo(keys, key, froom, to)
+
+
+def test_sparse_index_serves_top_probes(keyfile):
+    path, keys = keyfile
+    with MappedKeys(path) as plain, MappedKeys(path, index_stride=64) as indexed:
+        assert indexed.index_size < len(keys) // 32
+        for key in (-600, 0, 123, 600):
+            bi_SearchFromTo(plain, key, 0, len(keys) - 1)
+            bi_SearchFromTo(indexed, key, 0, len(keys) - 1)
+        assert indexed.probes == plain.probes
+        # 5000 / 64 约为 2^6，每次全窗口查找的前 6 层探测都来自索引
+        assert indexed.index_hits >= 4 * 6 and plain.index_hits == 0
+
+
+def test_search_file_and_formats(tmp_path):
+    path = str(tmp_path / "small.bin")
+    write_keys(path, [1, 3, 5, 7], fmt="i")
+    assert search_file(path, 5, fmt="i") == 2
+    assert search_file(path, 4, fmt="i") == -3
+    assert search_file(path, 7, 0, 2, fmt="i") == -4
+    odd = str(tmp_path / "odd.bin")
+    write_keys(odd, [1, 2, 3], fmt="i")
+    with pytest.raises(ValueError):
+        MappedKeys(odd, fmt="q")         # 12 字节不是 8 字节的整数倍
+    with pytest.raises(ValueError):
+        MappedKeys(path, fmt="d")
+
+
+def test_empty_file(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    write_keys(path, [])
+    assert search_file(path, 3) == -1
+
+
+def test_numpy_view_with_batch(keyfile):
+    pytest.importorskip("numpy")
+    path, keys = keyfile
+    mapped = MappedKeys(path)
+    arr = mapped.numpy_view()
+    probe = [keys[0], keys[2500], 501, -501]
+    assert bi_SearchFromTo_batch(arr, probe, 0, len(keys) - 1).tolist() == \
+        [bi_SearchFromTo(keys, k, 0, len(keys) - 1) for k in probe]
+    del arr
+    mapped.close()
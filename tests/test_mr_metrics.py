@@ -0,0 +1,37 @@
+from mr_metrics import MRMetrics, load_metrics, rank_mrs
+
+
+def test_attribution_and_ranking(tmp_path, monkeypatch):
+    path = str(tmp_path / "mr_metrics.jsonl")
+    metrics = MRMetrics(path)
+
+    for mutant, broken in (("m__mutmut_1", True), ("m__mutmut_2", False)):
+        monkeypatch.setenv("MUTANT_ID", mutant)
+        res = sum([1, 2])
+        metrics.record_time("original", sut_s=0.001)
+        r1 = sum([1, 2, 0])
+        metrics.record_time("MR1", transform_s=0.0001, sut_s=0.001)
+        r2 = sum([1, 2] * 2)
+        metrics.record_time("MR2", transform_s=0.0001, sut_s=0.001)
+        metrics.record_check("MR1", r1 == res)
+        metrics.record_check("MR2", r2 == res * 2 + (1 if broken else 0))
+        metrics.record_check("MR1", True)
+    metrics.flush()
+
+    merged = load_metrics(path)
+    assert merged[("m__mutmut_1", "original")]["sut_calls"] == 1
+    assert merged[("m__mutmut_1", "MR2")]["sut_calls"] == 1
+    assert merged[("m__mutmut_1", "MR2")]["failed"] == 1
+    assert merged[("m__mutmut_2", "MR1")]["passed"] == 2
+
+    rows = {mr: (kills, unique) for mr, _, kills, unique, _ in rank_mrs(merged)}
+    assert rows == {"MR1": (0, 0), "MR2": (1, 1)}
+    assert rank_mrs(merged)[0][0] == "MR2"
+
+
+def test_disabled_records_nothing():
+    metrics = MRMetrics(None)
+    metrics.record_time("MR1", transform_s=1.0, sut_s=1.0)
+    metrics.record_check("MR1", False)
+    metrics.flush()
+    assert metrics.stats == {}
@@ -0,0 +1,126 @@
+import pytest
+import mr_registry
+from mr_metrics import MRMetrics, load_metrics
+from mr_registry import ENGINE, EQUAL, GE, LE, NEGATED, REGISTRY, MREngine, MRRegistry, UNCHECKED, offset, scaled
+
+
+def test_relations():
+    assert EQUAL.holds([1], 3, 3) and not EQUAL.holds([1], 3, 4)
+    assert LE.holds([1], 3, 4) and not LE.holds([1], 4, 3)
+    assert GE.holds([1], 4, 3) and not GE.holds([1], 3, 4)
+    assert scaled(2).holds([1], 3, 6) and not scaled(2).holds([1], 3, 5)
+    assert NEGATED.holds([1], 3, -3)
+    assert offset(len).holds([1, 2], 3, 5)
+    assert not UNCHECKED.checked
+
+
+def test_registry_order_and_duplicates():
+    names = REGISTRY.names("add_values")
+    assert names[:3] == ["MR2", "MR3_1", "MR3_2"] and names[-1] == "MR22"
+    assert "MR2" not in REGISTRY.names("bi_SearchFromTo")
+    assert [m.name for m in REGISTRY.for_sut("add_values", {"MR5", "MR2"})] == ["MR2", "MR5"]
+    with pytest.raises(ValueError):
+        REGISTRY.register("MR2", lambda x: x, EQUAL, ["add_values"])
+
+
+def test_engine_passes_extra_args():
+    registry = MRRegistry()
+    registry.register("MR1", lambda xs: xs + [100], EQUAL, ["find"])
+    seen = []
+
+    def find(xs, key, lo, hi):
+        seen.append(len(xs))
+        return xs.index(key, lo, hi)
+
+    assert MREngine(registry).run("find", find, ([5, 6, 7], 6, 0, 3)) == 1
+    assert seen == [3, 4]
+
+
+def test_fail_fast_stops_at_first_violation():
+    calls = []
+
+    def broken(xs):
+        calls.append(list(xs))
+        return sum(xs) + (1 if max(xs) > 3 else 0)
+
+    with pytest.raises(pytest.fail.Exception, match="MR2 failed"):
+        ENGINE.run("add_values", broken, ([1, 2, 3],), fail_fast=True)
+    assert len(calls) == 2
+
+
+def test_fail_fast_skips_unchecked(monkeypatch):
+    registry = MRRegistry()
+    registry.register("MR1", lambda xs: 1 / 0, UNCHECKED, ["s"])
+    registry.register("MR2", lambda xs: xs, EQUAL, ["s"])
+    assert MREngine(registry).run("s", sum, ([1, 2],), fail_fast=True) == 3
+    with pytest.raises(ZeroDivisionError):
+        MREngine(registry).run("s", sum, ([1, 2],))
+
+
+def test_exceptions_are_attributed_to_the_running_mr():
+    registry = MRRegistry()
+    registry.register("MR1", lambda xs: xs, EQUAL, ["s"])
+    registry.register("MR2", lambda xs: xs + [None], EQUAL, ["s"])
+    for fail_fast in (False, True):
+        with pytest.raises(pytest.fail.Exception, match="MR2 failed: TypeError"):
+            MREngine(registry, memo=None).run("s", sum, ([1, 2],), fail_fast=fail_fast)
+    # 原输入上就抛出的异常不归属任何 MR
+    with pytest.raises(TypeError):
+        MREngine(registry, memo=None).run("s", sum, ([1, None],))
+
+
+def test_engine_records_metrics(tmp_path, monkeypatch):
+    path = str(tmp_path / "mr_metrics.jsonl")
+    monkeypatch.setattr(mr_registry, "METRICS", MRMetrics(path))
+    monkeypatch.setenv("MUTANT_ID", "add_values.x_add_values__mutmut_1")
+    ENGINE.run("add_values", sum, ([1, 2, 3],), selected={"MR2", "MR16"})
+    mr_registry.METRICS.flush()
+
+    merged = load_metrics(path)
+    key = "add_values.x_add_values__mutmut_1"
+    assert merged[(key, "original")]["sut_calls"] == 1
+    assert merged[(key, "MR2")]["passed"] == 1
+    assert merged[(key, "MR16")]["sut_calls"] == 1
+    assert merged[(key, "MR16")]["passed"] == 0
+
+
+def test_metrics_bypass_memo(tmp_path, monkeypatch):
+    from sut_memo import SUTMemo
+    registry = MRRegistry()
+    registry.register("MR1", lambda xs: xs, EQUAL, ["s"])    # 变换后输入与原输入指纹相同
+    calls = []
+
+    def sut(xs):
+        calls.append(1)
+        return sum(xs)
+
+    engine = MREngine(registry, memo=SUTMemo())
+    engine.run("s", sut, ([1, 2],))
+    assert len(calls) == 1
+    monkeypatch.setattr(mr_registry, "METRICS", MRMetrics(str(tmp_path / "m.jsonl")))
+    engine.run("s", sut, ([3, 4],))
+    assert len(calls) == 3
+
+
+def test_engine_applies_profile_to_every_sut(tmp_path, monkeypatch):
+    path = tmp_path / "profiles.json"
+    path.write_text('{"fast": {"find": ["MR2"]}}')
+    registry = MRRegistry()
+    registry.register("MR1", lambda xs: xs + [100], EQUAL, ["find", "other"])
+    registry.register("MR2", lambda xs: xs + [200], EQUAL, ["find", "other"])
+    engine = MREngine(registry, memo=None, profiles_path=str(path))
+    seen = []
+
+    def find(xs, key):
+        seen.append(xs[-1])
+        return xs.index(key)
+
+    monkeypatch.setenv("MR_PROFILE", "fast")
+    engine.run("find", find, ([5, 6], 6))
+    assert seen == [6, 200]
+    seen.clear()
+    engine.run("other", find, ([5, 6], 6))             # 档位中没有该 SUT：全部 MR
+    assert seen == [6, 100, 200]
+    seen.clear()
+    engine.run("find", find, ([5, 6], 6), selected={"MR1"})
+    assert seen == [6, 100]
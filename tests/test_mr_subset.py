@@ -0,0 +1,78 @@
+import pytest
+from mr_subset import active_mrs, exact_cover, greedy_cover, matrix_from_results, minimal_subset
+
+MATRIX = {
+    "m__mutmut_1": {"MR5", "MR8", "MR9", "MR12"},
+    "m__mutmut_2": {"MR2", "MR4", "MR6", "MR8", "MR9", "MR3_1", "MR3_2"},
+    "m__mutmut_3": {"MR2", "MR4", "MR10", "MR11", "MR13", "MR14", "MR3_2"},
+}
+
+
+def _covers(subset):
+    return all(set(subset) & mrs for mrs in MATRIX.values())
+
+
+def test_greedy_and_exact_cover_keep_every_kill():
+    assert _covers(greedy_cover(MATRIX))
+    exact = exact_cover(MATRIX)
+    assert _covers(exact) and len(exact) == 2
+    assert len(minimal_subset(MATRIX)) <= len(greedy_cover(MATRIX))
+
+
+def test_matrix_from_results_skips_orig_and_unattributed():
+    rows = [
+        {"mutant": "m__mutmut_1", "nodeid": "t::a", "mr": "", "outcome": "failed"},
+        {"mutant": "m__mutmut_1", "nodeid": "", "mr": "", "outcome": "killed"},
+        {"mutant": "m__mutmut_2", "nodeid": "t::a", "mr": "MR5", "outcome": "failed"},
+        {"mutant": "m__mutmut_2", "nodeid": "", "mr": "", "outcome": "killed"},
+        {"mutant": "m__mutmut_orig", "nodeid": "t::a", "mr": "MR5", "outcome": "failed"},
+    ]
+    matrix, killed = matrix_from_results(rows)
+    assert matrix == {"m__mutmut_2": {"MR5"}}
+    assert killed == {"m__mutmut_1", "m__mutmut_2"}
+
+
+def test_crash_on_transformed_input_is_attributed(tmp_path):
+    # 只在 MR5 的变换后输入上崩溃的 mutant：归属到 MR5，不算作 "任何档位都能杀死"
+    from run_results import failure_rows
+    from mr_registry import MREngine, MRRegistry, EQUAL
+    registry = MRRegistry()
+    registry.register("MR5", lambda xs: xs + ["x"], EQUAL, ["s"])
+
+    class Report:
+        pass
+
+    with pytest.raises(pytest.fail.Exception) as info:
+        MREngine(registry, memo=None).run("s", sum, ([1, 2],))
+    report = Report()
+    report.longreprtext = str(info.value)
+    [(mr, _)] = failure_rows(report)
+    rows = [
+        {"mutant": "m__mutmut_1", "nodeid": "t::a", "mr": mr, "outcome": "failed"},
+        {"mutant": "m__mutmut_1", "nodeid": "", "mr": "", "outcome": "killed"},
+    ]
+    assert matrix_from_results(rows) == ({"m__mutmut_1": {"MR5"}}, {"m__mutmut_1"})
+
+
+@pytest.mark.parametrize("profile, expected", [(None, None), ("full", None), ("fast", {"MR2"}), ("other", None)])
+def test_active_mrs(tmp_path, monkeypatch, profile, expected):
+    path = tmp_path / "profiles.json"
+    path.write_text('{"fast": {"add_values": ["MR2"]}}')
+    if profile is None:
+        monkeypatch.delenv("MR_PROFILE", raising=False)
+    else:
+        monkeypatch.setenv("MR_PROFILE", profile)
+    assert active_mrs("add_values", str(path)) == expected
+
+
+def test_cli_fails_when_subset_loses_kills(tmp_path, monkeypatch, capsys):
+    import mr_subset
+    from run_results import write_results
+    rows = [{"run_id": "", "mutant": "m__mutmut_1", "nodeid": "t::a", "mr": "MR5", "outcome": "failed",
+             "duration": 0.001, "reason": "MR5 failed"}]
+    results = write_results(rows, str(tmp_path), run_id="run_1")
+    output = tmp_path / "profiles.json"
+    monkeypatch.setattr(mr_subset, "minimal_subset", lambda matrix, order, greedy=False: [])
+    assert mr_subset.main(["--results", results, "--output", str(output)]) == 1
+    assert "does not preserve the mutation score" in capsys.readouterr().err
+    assert not output.exists()
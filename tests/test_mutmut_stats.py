@@ -0,0 +1,62 @@
+import pytest
+from mutmut_stats import covering_tests, mangled_function_name, select_items, selection_key
+
+STATS = {
+    "tests_by_mangled_function_name": {
+        "add_values.x_add_values": [
+            "tests/test_add_values.py::test_add_values[originalInput2]",
+            "tests/test_add_values.py::test_add_values[originalInput0]",
+            "tests/test_add_values.py::test_plain",
+        ],
+    },
+    "duration_by_test": {
+        "tests/test_add_values.py::test_add_values[originalInput2]": 0.001,
+        "tests/test_add_values.py::test_add_values[originalInput0]": 0.003,
+    },
+}
+
+
+class _Item:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+    def __repr__(self):
+        return self.nodeid
+
+
+def _items(prefix, func):
+    return [_Item(f"{prefix}tests/test_add_values.py::{func}[originalInput{i}]") for i in range(4)] + \
+        [_Item(f"{prefix}tests/test_add_values.py::test_plain"), _Item(f"{prefix}tests/test_other.py::test_x")]
+
+
+def test_mangled_name_and_covering_order():
+    assert mangled_function_name("add_values.py", "x_add_values__mutmut_3") == "add_values.x_add_values"
+    assert covering_tests(STATS, "add_values.x_add_values") == [
+        "tests/test_add_values.py::test_add_values[originalInput2]",     # 最快优先，没有耗时的排最后
+        "tests/test_add_values.py::test_add_values[originalInput0]",
+        "tests/test_add_values.py::test_plain",
+    ]
+    assert covering_tests(STATS, "bi_SearchFromTo.x_bi_SearchFromTo") is None
+    assert covering_tests(None, "add_values.x_add_values") is None
+
+
+@pytest.mark.parametrize("prefix, func", [
+    ("", "test_add_values"),                     # tests/（仓库根为 rootdir，run_mutants_inprocess.py）
+    ("", "test_add_values_with_func"),           # mutants/tests，以 mutants/ 为 rootdir
+    ("mutants/", "test_add_values_with_func"),   # mutants/tests，以仓库根为 rootdir（test_mutants_runner.py）
+], ids=["repo-tests", "mutants-rootdir", "repo-rootdir"])
+def test_select_items_in_both_layouts(prefix, func):
+    items = _items(prefix, func)
+    chosen = select_items(items, covering_tests(STATS, "add_values.x_add_values"))
+    assert [item.nodeid for item in chosen] == [
+        f"{prefix}tests/test_add_values.py::{func}[originalInput2]",
+        f"{prefix}tests/test_add_values.py::{func}[originalInput0]",
+        f"{prefix}tests/test_add_values.py::test_plain",
+    ]
+    assert selection_key(chosen[0].nodeid) == ("tests/test_add_values.py", "[originalInput2]")
+
+
+def test_select_items_falls_back_to_all():
+    items = _items("", "test_add_values")
+    assert select_items(items, None) is items
+    assert select_items(items, ["tests/test_gone.py::test_removed[originalInput0]"]) is items   # 统计文件过期
@@ -0,0 +1,57 @@
+import io
+import sys
+import pytest
+from mutmut_type import classify_mutant, classify_diff, kill_rate_table, statuses_from_runner_log
+
+ORIG = """def x_f__mutmut_orig(low, high, data):
+    total = 0
+    mid = (low + high) // 2
+    while low <= high and data:
+        total += data[mid]
+    return total
+"""
+
+
+@pytest.mark.parametrize("old, new, expected", [
+    ("total = 0", "total = None", "None Assignment"),
+    ("total = 0", "total = 1", "Number Replacement"),
+    ("total += data[mid]", "total = data[mid]", "Assignment Replacement"),
+    ("total += data[mid]", "total -= data[mid]", "Arithmetic Operator Replacement"),
+    ("(low + high) // 2", "(low + high) / 2", "Division Replacement"),
+    ("low <= high", "low < high", "Boundary Change"),
+    ("low <= high", "low == high", "Comparison Replacement"),
+    ("and data", "or data", "Boolean Replacement"),
+])
+def test_classify_mutant(old, new, expected):
+    mutant = ORIG.replace(old, new).replace("mutmut_orig", "mutmut_1")
+    assert classify_mutant(ORIG, mutant) == expected
+
+
+def test_classify_diff_ignores_headers():
+    diff = "--- src/a.py\n+++ src/a.py\n@@ -1,2 +1,2 @@\n-    mid = (low + high) // 2\n+    mid = (low + high) / 2\n"
+    assert classify_diff(diff) == "Division Replacement"
+
+
+def test_kill_rate_table():
+    entries = {"m.a": {"type": "X"}, "m.b": {"type": "X"}, "m.c": {"type": "Y"}, "m.d": {"type": "Y"}}
+    statuses = {"m.a": "killed", "m.b": "survived", "m.c": "timeout"}
+    assert kill_rate_table(entries, statuses) == [("X", 2, 1, 0.5), ("Y", 1, 1, 1.0)]
+
+
+def test_runner_log_statuses_include_cached_results(tmp_path, monkeypatch):
+    # 全部沿用缓存结论的运行（夜间的常见情况）：log 中同样有 RUNNING 标记，能读出每个 mutant 的结论
+    from test_mutants_runner import AsyncLogWriter, LogSink, print_cached
+    path = tmp_path / "add_values.log"
+    writer = AsyncLogWriter(open(path, "w", encoding="utf-8"))
+    monkeypatch.setattr(sys, "stdout", LogSink(io.StringIO(), writer))
+    print_cached([
+        ("add_values.py", "x_add_values__mutmut_1", 1),
+        ("add_values.py", "x_add_values__mutmut_2", 0),
+        ("add_values.py", "x_add_values__mutmut_orig", 0),
+    ], writer)
+    monkeypatch.undo()
+    writer.close()
+    assert statuses_from_runner_log(str(path)) == {
+        "add_values.x_add_values__mutmut_1": "killed",
+        "add_values.x_add_values__mutmut_2": "survived",
+    }
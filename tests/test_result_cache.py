@@ -0,0 +1,41 @@
+import os
+from result_cache import MR_GENERATOR_GLOBS, ResultCache, mr_generator_hash
+
+
+def _mutant(x):
+    return x + 1
+
+
+def test_cache_hits_until_tests_change(tmp_path):
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    test_file = tests_dir / "test_a.py"
+    test_file.write_text("def test_a():\n    pass\n")
+    cache_path = str(tmp_path / "cache.json")
+
+    cache = ResultCache(cache_path, tests_dir=str(tests_dir))
+    key = cache.key(_mutant)
+    assert cache.get("m", key) is None
+    cache.put("m", key, 1)
+    cache.put("crashed", key, 2)  # 非确定结论不缓存
+    cache.save()
+
+    cache = ResultCache(cache_path, tests_dir=str(tests_dir))
+    assert cache.get("m", cache.key(_mutant)) == 1
+    assert cache.get("crashed", cache.key(_mutant)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    test_file.write_text("def test_a():\n    assert False\n")
+    cache = ResultCache(cache_path, tests_dir=str(tests_dir))
+    assert cache.get("m", cache.key(_mutant)) is None
+
+
+def test_mr_generator_hash_covers_engine_files(tmp_path):
+    names = {os.path.basename(p) for p in MR_GENERATOR_GLOBS}
+    assert {"mr_registry.py", "sequence_views.py", "sut_memo.py", "conftest.py"} <= names
+    view = tmp_path / "sequence_views.py"
+    view.write_text("A = 1\n")
+    patterns = [str(tmp_path / "*.py")]
+    before = mr_generator_hash(patterns)
+    view.write_text("A = 2\n")
+    assert mr_generator_hash(patterns) != before
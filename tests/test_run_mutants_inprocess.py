@@ -0,0 +1,34 @@
+import os
+import re
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.skipif("MUTANT_UNDER_TEST" in os.environ, reason="驱动自身运行 tests/ 时不再嵌套启动")
+def test_driver_runs_checked_in_mutants(tmp_path):
+    # 在临时目录中运行，日志不写进仓库；tests/ 中任何模块导入失败都会使 mutant 数为 0
+    proc = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "run_mutants_inprocess.py")],
+        cwd=tmp_path, capture_output=True, text=True, timeout=300,
+    )
+    match = re.search(r"(\d+)/(\d+) 个 mutant 被杀死", proc.stdout)
+    assert match, proc.stdout + proc.stderr
+    killed, total = map(int, match.groups())
+    assert total > 0 and killed == total, proc.stdout
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+
+def test_checked_in_mutants_are_the_frozen_baseline():
+    # mutants/ 是基线循环版 add_values 的快照（见 setup.cfg）；分派版的结果必须与它相同，杀死率才有意义
+    from add_values import add_values
+    from mutmut_type import read_mutant_sources
+    origs = {orig for orig, _ in read_mutant_sources(os.path.join(ROOT, "mutants", "src")).values()}
+    assert len(origs) == 1
+    namespace = {}
+    exec(origs.pop(), namespace)
+    baseline = namespace["x_add_values__mutmut_orig"]
+    for data in ([], [1, -2, 3], (5, 7), [1.5, 2.25, -0.5], range(10), [True, 2]):
+        assert add_values(data) == baseline(data)
@@ -0,0 +1,35 @@
+import run_results
+from run_results import load_history, mr_kill_counts, survived_mutants, write_results
+
+
+def _row(mutant, nodeid, mr, outcome, reason=""):
+    return {"run_id": "", "mutant": mutant, "nodeid": nodeid, "mr": mr,
+            "outcome": outcome, "duration": 0.001, "reason": reason}
+
+
+def test_write_and_query_history(tmp_path, monkeypatch):
+    # 固定走 CSV 回退，与是否安装 pyarrow 无关
+    monkeypatch.setattr(run_results, "pq", None)
+    runs = {
+        "run_1": [
+            _row("m_1", "t.py::a", "MR2", "failed", "MR2 failed"),
+            _row("m_1", "t.py::a", "MR5", "failed", "MR5 failed"),
+            _row("m_1", "", "", "killed"),
+            _row("m_2", "t.py::a", "", "passed"),
+            _row("m_2", "", "", "survived"),
+        ],
+        "run_2": [
+            _row("m_2", "t.py::a", "MR5", "failed", "MR5 failed"),
+            _row("m_2", "", "", "killed"),
+        ],
+    }
+    for run_id, rows in runs.items():
+        run_dir = tmp_path / run_id
+        run_dir.mkdir()
+        assert write_results(rows, str(run_dir), run_id=run_id).endswith("results.csv")
+
+    rows = load_history(str(tmp_path))
+    assert len(rows) == 7
+    assert survived_mutants(rows, run_id="run_1") == ["m_2"]
+    assert survived_mutants(rows, run_id="run_2") == []
+    assert mr_kill_counts(rows) == {"MR5": 2, "MR2": 1}
@@ -0,0 +1,72 @@
+import io
+import threading
+import time
+import pytest
+from test_mutants_runner import AsyncLogWriter, LogSink
+
+
+class _Failing:
+    def __init__(self):
+        self.closed = False
+
+    def write(self, data):
+        raise OSError("disk full")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_writes_keep_call_order_and_close_flushes(tmp_path):
+    path = tmp_path / "run.log"
+    writer = AsyncLogWriter(open(path, "w", encoding="utf-8"), flush_bytes=16, flush_interval=60)
+    expected = []
+    for i in range(500):
+        line = f"\x1b[32mline {i}\x1b[0m\n" if i % 2 else f"line {i}\n"
+        writer.write(line)
+        expected.append(f"line {i}\n")
+    writer.writelines(["tail 1\n", "tail 2\n"])
+    writer.close()
+    assert path.read_text(encoding="utf-8") == "".join(expected) + "tail 1\ntail 2\n"   # ANSI 颜色已去掉
+    writer.write("after close\n")                                                      # 关闭后的写入被忽略
+
+
+def test_background_thread_flushes_by_interval(tmp_path):
+    path = tmp_path / "run.log"
+    writer = AsyncLogWriter(open(path, "w", encoding="utf-8"), flush_interval=0.01)
+    try:
+        writer.write("RUNNING add_values.py :: x_add_values__mutmut_1\n")
+        deadline = time.monotonic() + 5
+        while not path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_text(encoding="utf-8") == "RUNNING add_values.py :: x_add_values__mutmut_1\n"
+    finally:
+        writer.close()
+
+
+def test_write_errors_are_raised_on_close():
+    target = _Failing()
+    writer = AsyncLogWriter(target, flush_interval=0.01)
+    writer.write("lost\n")
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+    assert target.closed
+
+
+def test_log_sink_writes_terminal_and_log_from_threads(tmp_path):
+    path = tmp_path / "run.log"
+    terminal = io.StringIO()
+    writer = AsyncLogWriter(open(path, "w", encoding="utf-8"))
+    sink = LogSink(terminal, writer)
+    threads = [threading.Thread(target=lambda n=n: [sink.write(f"{n}:{i}\n") for i in range(100)]) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+    logged = path.read_text(encoding="utf-8").splitlines()
+    assert sorted(logged) == sorted(terminal.getvalue().splitlines()) and len(logged) == 400
+    for n in range(4):
+        assert [line for line in logged if line.startswith(f"{n}:")] == [f"{n}:{i}" for i in range(100)]
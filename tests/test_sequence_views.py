@@ -0,0 +1,52 @@
+import pytest
+from sequence_views import ConcatView, MappedView, SequenceView, scaled
+from MetamorphicTestGenerator1 import MetamorphicTestGenerator1 as MG1
+from MetamorphicTestGenerator4 import MetamorphicTestGenerator4 as MG4
+from add_values import add_values
+from bi_SearchFromTo import bi_SearchFromTo
+
+
+def test_views_do_not_copy():
+    data = [1, 2, 3]
+    view = SequenceView(data)
+    data[0] = 10
+    assert view[0] == 10 and list(view) == [10, 2, 3]
+    with pytest.raises(TypeError):
+        view[0] = 1
+
+
+def test_concat_indexing_with_empty_parts():
+    view = ConcatView([], [1, 2], (), (3,), [])
+    assert len(view) == 3
+    assert [view[i] for i in range(3)] == [1, 2, 3]
+    assert view[-1] == 3 and view[1:] == [2, 3]
+    with pytest.raises(IndexError):
+        view[3]
+
+
+def test_mapped_view_computes_on_access():
+    calls = []
+    view = MappedView([1, 2, 3], lambda x: calls.append(x) or x * 2)
+    assert view[1] == 4 and calls == [2]
+    assert scaled([1, 2], 3) == [3, 6]
+    assert scaled([1, 2], 3) != (3, 7)
+
+
+@pytest.mark.parametrize("data", [[], [1, 3, 2, 6, 9], [-1, 9, 1, -3, -3]])
+def test_generator1_views_match_eager_lists(data):
+    assert MG1.applyMR3_1(data) == data + [0]
+    assert MG1.applyMR3_2(data) == data + [1]
+    assert MG1.applyMR5(data, 2) == [x * 2 for x in data]
+    assert MG1.applyMR7_1(data) == data and MG1.applyMR7_2(data) == data
+    assert MG1.applyMR8(data) == data + data
+    assert MG1.applyMR22(data) == data
+    assert MG1.applyMR19(data, 2) == (data + [data[0]] * 2 if data else [])
+    assert add_values(MG1.applyMR8(data)) == 2 * add_values(data)
+
+
+def test_generator4_views_with_binary_search():
+    data = [-3, -3, -1, 1, 9]
+    for transform in (MG4.applyMR3_1, MG4.applyMR7_1, MG4.applyMR8, MG4.applyMR22):
+        assert bi_SearchFromTo(transform(data), 1, 0, 4) == bi_SearchFromTo(data, 1, 0, 4)
+    copied = MG4.applyMR11(data)
+    assert copied is not data and data == [-3, -3, -1, 1, 9]
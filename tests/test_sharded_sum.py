@@ -0,0 +1,103 @@
+import array
+import math
+import random
+import pytest
+from add_values import add_values
+from mr_registry import ENGINE, kill_mode_enabled
+import sharded_sum
+from sharded_sum import _bounds, _partials, add_values_sharded
+from stream_sum import BinaryNumbers
+
+SHARD_COUNTS = [1, 2, 3, 4, 7]
+_rng = random.Random(0)
+INTS = [_rng.randint(-10 ** 12, 10 ** 12) for _ in range(1001)]
+FLOATS = [_rng.uniform(-1, 1) * 10 ** _rng.randint(-12, 12) for _ in range(1001)]
+
+
+def test_bounds_cover_input_in_order():
+    assert _bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert _bounds(2, 5) == [(0, 1), (1, 2)]
+    assert _bounds(0, 4) == [(0, 0)]
+
+
+def test_partials_are_exact():
+    values = [1e100, 1.0, -1e100, 1e-100, 0.1]
+    assert math.fsum(_partials(values)) == math.fsum(values)
+
+
+@pytest.mark.parametrize("shards", SHARD_COUNTS)
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_matches_add_values(shards, executor):
+    assert add_values_sharded(INTS, shards, executor=executor) == add_values(INTS)
+    assert add_values_sharded(tuple(INTS), shards, executor=executor) == add_values(INTS)
+    assert add_values_sharded(array.array("q", INTS), shards, executor=executor) == add_values(INTS)
+    assert add_values_sharded(bytes(range(256)), shards, executor=executor) == add_values(bytes(range(256)))
+    assert add_values_sharded(FLOATS, shards, compensated=True, executor=executor) == math.fsum(FLOATS)
+    assert add_values_sharded(INTS + [0.5], shards, compensated=True, executor=executor) == \
+        math.fsum(INTS + [0.5])
+
+
+@pytest.mark.parametrize("dtype", ["int8", "int16", "uint8", "int32", "int64", "bool"])
+def test_numpy_integer_dtypes(dtype):
+    np = pytest.importorskip("numpy")
+    for data in (np.full(1000, 120, dtype=dtype), np.array([100, 100, 100], dtype=dtype),
+                 np.array(INTS).astype(dtype)):
+        expected = add_values(data)
+        for shards in SHARD_COUNTS:
+            result = add_values_sharded(data, shards)
+            assert result == expected and result.dtype == expected.dtype
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    wrapping = np.array([2 ** 62] * 9, dtype=np.int64)
+    for shards in SHARD_COUNTS:
+        assert add_values_sharded(wrapping, shards) == add_values(wrapping)
+        assert add_values_sharded(np.array(FLOATS), shards, compensated=True) == math.fsum(FLOATS)
+    assert add_values_sharded(np.ones((3, 2)), 2).tolist() == [3.0, 3.0]
+    assert add_values_sharded(np.array([], dtype=np.int64), 3) == 0
+
+
+def test_file_and_process_pool(tmp_path):
+    path = tmp_path / "numbers.bin"
+    path.write_bytes(array.array("q", INTS).tobytes())
+    assert add_values_sharded(BinaryNumbers(str(path), "q"), 3, executor="serial") == sum(INTS)
+    assert add_values_sharded(BinaryNumbers(str(path), "q"), 2, executor="process", max_workers=2) == sum(INTS)
+
+
+def test_auto_executor_keeps_in_memory_data_out_of_processes(tmp_path, monkeypatch):
+    # auto：内存中的序列不启动进程池（序列化开销远大于求和本身），文件分片才用进程池
+    started = []
+
+    class Recording(sharded_sum.ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            started.append(max_workers)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(sharded_sum, "ProcessPoolExecutor", Recording)
+    assert add_values_sharded(INTS, 4) == add_values(INTS)
+    assert add_values_sharded(array.array("q", INTS), 4) == add_values(INTS)
+    assert started == []
+    path = tmp_path / "numbers.bin"
+    path.write_bytes(array.array("q", INTS).tobytes())
+    assert add_values_sharded(BinaryNumbers(str(path), "q"), 3) == sum(INTS)
+    assert started == [3]
+
+
+def test_special_values_and_errors():
+    assert math.isnan(add_values_sharded([math.inf, 1.0, -math.inf], 3, compensated=True, executor="serial"))
+    assert add_values_sharded([1e308, 1e308], 2, compensated=True, executor="serial") == math.inf
+    assert add_values_sharded([], 4) == 0
+    assert add_values_sharded(iter([1, 2, 3]), 2) == 6
+    with pytest.raises(ValueError):
+        add_values_sharded([1, 2], 0)
+    with pytest.raises(ValueError):
+        add_values_sharded([1, 2], 2, executor="gpu")
+
+
+# MR5（缩放）/ MR6（反转）/ MR8（重复）在每个分片数下都成立
+@pytest.mark.parametrize("shards", SHARD_COUNTS)
+@pytest.mark.parametrize("data, compensated", [(INTS[:200], False), (FLOATS[:200], True)], ids=["int", "float"])
+def test_add_values_sharded_mrs(data, compensated, shards):
+    ENGINE.run("add_values_sharded", add_values_sharded, (data, shards, compensated, "thread"),
+               fail_fast=kill_mode_enabled())
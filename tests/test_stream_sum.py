@@ -0,0 +1,80 @@
+import array
+import math
+import random
+import tracemalloc
+import pytest
+from add_values import add_values
+from mr_registry import ENGINE, kill_mode_enabled
+from sequence_views import StreamView
+from stream_sum import BinaryNumbers, TextNumbers, add_values_stream, iter_chunks
+
+
+def test_sources(tmp_path):
+    text = tmp_path / "numbers.txt"
+    text.write_text("1\n  2\n\n-3\n2.5\n")
+    assert list(TextNumbers(str(text))) == [1, 2, -3, 2.5]
+    assert add_values_stream(TextNumbers(str(text), chunk_size=2)) == add_values([1, 2, -3, 2.5])
+
+    binary = tmp_path / "numbers.bin"
+    binary.write_bytes(array.array("q", range(10)).tobytes())
+    assert add_values_stream(BinaryNumbers(str(binary), "q", chunk_size=3)) == 45
+    assert add_values_stream(BinaryNumbers(binary, "q")) == 45
+    assert add_values_stream(BinaryNumbers(array.array("i", [5, -7]).tobytes(), "i", chunk_size=1)) == -2
+    assert add_values_stream(BinaryNumbers(array.array("d", [0.1] * 10), "d")) == 1.0
+    with pytest.raises(ValueError):
+        add_values_stream(BinaryNumbers(b"\x00" * 5, "i"))
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_checkpoint_and_resume():
+    source = StreamView(lambda: range(1, 11))
+    seen = []
+    assert add_values_stream(source, checkpoint=lambda count, total: seen.append((count, total)), chunk_size=4) == 55
+    assert seen == [(4, 10), (8, 36), (10, 55)]
+    assert add_values_stream(source, resume=(4, 10), chunk_size=4) == 55
+    assert add_values_stream(source, resume=(6, 21), chunk_size=4) == 55   # 检查点落在块中间
+    assert add_values_stream(source, resume=(10, 55)) == 55
+
+
+def test_memory_is_bounded_by_chunk_size():
+    source = StreamView(lambda: (i % 1000 for i in range(10 ** 6)))
+    tracemalloc.start()
+    try:
+        total = add_values_stream(source, chunk_size=1 << 12)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert total == 499500 * 1000
+    assert peak < 1 << 20          # 整个输入展开成列表约 8 MB
+
+
+# 流式 MR（追加 0 / 追加 1 / 缩放 / 拼接两遍）直接在流上检查，不展开成列表；只对整数源成立
+@pytest.mark.parametrize("make_source", [
+    lambda tmp: StreamView(lambda: (i * 7 % 13 - 6 for i in range(5000))),
+    lambda tmp: _text_file(tmp, [3, -1, 4, 1, -5, 9]),
+    lambda tmp: BinaryNumbers(array.array("q", range(-50, 300)).tobytes(), "q", chunk_size=64),
+], ids=["generator", "text", "binary"])
+def test_add_values_stream_mrs(make_source, tmp_path):
+    ENGINE.run("add_values_stream", add_values_stream, (make_source(tmp_path),), fail_fast=kill_mode_enabled())
+
+
+def test_float_binary_source(tmp_path):
+    # 浮点二进制源：每块 math.fsum 后依次累加，文件与缓冲区结果相同；流式 MR 不适用（见 mr_registry）
+    rng = random.Random(0)
+    values = array.array("d", (rng.uniform(-1e4, 1e4) for _ in range(3000)))
+    path = tmp_path / "floats.bin"
+    path.write_bytes(values.tobytes())
+    expected = 0
+    for start in range(0, len(values), 64):
+        expected += math.fsum(values[start:start + 64])
+    from_file = add_values_stream(BinaryNumbers(str(path), "d", chunk_size=64))
+    from_buffer = add_values_stream(BinaryNumbers(values.tobytes(), "d", chunk_size=64))
+    assert from_file == from_buffer == expected
+    assert math.isclose(from_file, math.fsum(values), rel_tol=1e-12)
+    assert add_values_stream(BinaryNumbers(values, "d", chunk_size=len(values))) == math.fsum(values)
+
+
+def _text_file(tmp_path, values):
+    path = tmp_path / "values.txt"
+    path.write_text("".join(f"{v}\n" for v in values))
+    return TextNumbers(str(path))
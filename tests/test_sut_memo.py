@@ -0,0 +1,80 @@
+from sut_memo import SUTMemo, fingerprint, function_identity
+
+
+def _sum(xs):
+    return sum(xs)
+
+
+def _sum_plus_one(xs):
+    return sum(xs) + 1
+
+
+def test_fingerprint_is_typed_and_content_addressed():
+    assert fingerprint(([1, 2, 3],)) == fingerprint((list((1, 2, 3)),))
+    assert fingerprint(([1, 2],)) != fingerprint(([1.0, 2],))
+    assert fingerprint(([1],)) != fingerprint(([True],))
+    assert fingerprint(([1, 2],)) != fingerprint(((1, 2),))
+    assert fingerprint(([object()],)) is None
+
+
+def test_identity_distinguishes_bodies_and_trampoline(monkeypatch):
+    assert function_identity(_sum) != function_identity(_sum_plus_one)
+    monkeypatch.setenv("MUTANT_UNDER_TEST", "add_values.x_add_values__mutmut_1")
+    first = function_identity(_sum)
+    monkeypatch.setenv("MUTANT_UNDER_TEST", "add_values.x_add_values__mutmut_2")
+    assert function_identity(_sum) != first
+
+
+def test_hits_and_lru_eviction():
+    calls = []
+
+    def sut(xs):
+        calls.append(xs)
+        return sum(xs)
+
+    memo = SUTMemo(maxsize=2)
+    assert memo.call(sut, ([1, 2],)) == 3
+    assert memo.call(sut, ([1, 2],)) == 3
+    memo.call(sut, ([3],))
+    memo.call(sut, ([1, 2],))      # [1, 2] 变为最近使用
+    memo.call(sut, ([4],))         # 淘汰 [3]
+    memo.call(sut, ([3],))
+    assert len(calls) == 4
+    assert memo.stats()["hits"] == 2 and memo.stats()["evictions"] == 2
+    assert memo.hit_rate == 2 / 6
+
+
+def test_mutable_results_and_errors_not_cached():
+    memo = SUTMemo()
+    first = memo.call(lambda xs: list(xs), ([1],))
+    assert memo.call(lambda xs: list(xs), ([1],)) is not first
+    memo.call(lambda *a: [], (object(),))
+    assert memo.stats()["bypassed"] == 1
+
+    def failing(xs):
+        raise ValueError(xs)
+
+    for _ in range(2):
+        try:
+            memo.call(failing, ([1],))
+        except ValueError:
+            pass
+    assert memo.stats()["size"] == 0
+
+
+def test_disabled_calls_through():
+    memo = SUTMemo(enabled=False)
+    memo.call(_sum, ([1],))
+    memo.call(_sum, ([1],))
+    assert memo.stats()["hits"] == 0 and memo.stats()["misses"] == 0
+
+
+
+def test_nested_arguments_and_views():
+    from sequence_views import MappedView
+    assert fingerprint((MappedView([1, 2], lambda x: x * 2),)) == fingerprint(([2, 4],))
+    assert fingerprint(([1, [2, 3]], 4)) == fingerprint(([1, [2, 3]], 4))
+    assert fingerprint(([1, [2, 3]], 4)) != fingerprint(([1, [2.0, 3]], 4))
+    assert fingerprint(([1, [object()]],)) is None
+    hash(fingerprint(([1, 2], 0, 1)))
+
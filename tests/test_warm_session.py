@@ -0,0 +1,50 @@
+import os
+from warm_session import WarmMutantSession
+
+SAMPLE = '''\
+import os
+import pytest
+
+EVENTS = os.path.join(os.path.dirname(__file__), "events.txt")
+
+
+def log(event):
+    with open(EVENTS, "a") as fh:
+        fh.write(event + "\\n")
+
+
+@pytest.fixture(scope="module")
+def res():
+    log("up")
+    yield
+    log("down")
+
+
+def test_a(res):
+    log("a")
+    assert os.environ["WARM_MUTANT"] != "bad"
+
+
+def test_b(res):
+    log("b")
+
+
+def test_c(res):
+    log("c")
+'''
+
+
+def test_kill_mode_tears_down_fixtures_before_next_mutant(pytester, monkeypatch):
+    pytester.makepyfile(test_warm_sample=SAMPLE)
+    session = WarmMutantSession(
+        [("bad", None), ("good", None)],
+        activate=lambda name, func: monkeypatch.setenv("WARM_MUTANT", name),
+        stop_on_first_failure=True,
+    )
+    session.run(str(pytester.path), extra_args=["-p", "no:cacheprovider"])
+
+    assert [(name, rc) for name, rc, _ in session.results] == [("bad", 1), ("good", 0)]
+    assert (session.ran, session.planned) == (3, 3)
+    # bad：test_a 失败后只再跑 test_b，由它拆掉 module fixture；good 重新建立 fixture
+    events = (pytester.path / "events.txt").read_text().split()
+    assert events == ["up", "a", "b", "down", "up", "a", "b", "c", "down"]
@@ -0,0 +1,130 @@
+import time
+import pytest
+
+
+class WarmMutantSession:
+    """
+    常驻 pytest 会话（作为插件传给 pytest.main）：
+    - 测试目录只收集一次：插件加载、conftest 导入、parametrize 展开都只发生一次
+    - 之后对每个 mutant 只调用 activate(name, func) 重新绑定被测函数，再重跑已收集的 items
+    - 记录 启动耗时（pytest.main 开始 -> 收集完成）与每个 mutant 的执行耗时
+
+    activate(name, func) 由调用方提供，例如设置 runner.CURRENT_MUTANT_FUNC，或切换 MUTANT_UNDER_TEST；
+    finish(name, rc) 可选，在每个 mutant 跑完、汇总输出之后调用；
+    select(name, items) 可选，返回该 mutant 需要运行的 items 子集（及顺序）；
+    stop_on_first_failure=True 时（kill 模式）出现第一条失败后，只再运行下一个用例（用来拆掉 fixture），
+    该 mutant 的其余用例不再运行。
+    每个 mutant 跑完后可通过 failures / ran / planned 查看它的失败报告、已运行与计划运行的用例数。
+    collection_errors: [(nodeid, 报告文本)]，收集出错时会话中止，results 里的 mutant 会少于请求的个数。
+    results: [(name, rc, exec_seconds)]，rc 与 pytest 退出码一致（0 通过 / 1 存在失败 / 5 没有用例）
+    """
+
+    def __init__(self, mutants, activate, finish=None, select=None, stop_on_first_failure=False):
+        self.mutants = mutants
+        self.activate = activate
+        self.finish = finish
+        self.select = select
+        self.stop_on_first_failure = stop_on_first_failure
+        self.results = []
+        self.collection_errors = []
+        self.startup_seconds = 0.0
+        self._t0 = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self._letters = []
+        self.failures = []
+        self.ran = 0
+        self.planned = 0
+        self._passed = 0
+        self._failed = 0
+
+    def run(self, tests_dir, extra_args=(), plugins=()):
+        """启动会话并跑完全部 mutant；plugins 为额外注册的 pytest 插件；返回 pytest.main 的退出码"""
+        self._t0 = time.perf_counter()
+        args = [tests_dir, "-q", "-s", "--tb=short", *extra_args]
+        return pytest.main(args, plugins=[self, *plugins])
+
+    @property
+    def exec_seconds(self):
+        return sum(r[2] for r in self.results)
+
+    # ---------------- pytest hooks ----------------
+    @pytest.hookimpl(trylast=True)
+    def pytest_configure(self, config):
+        # terminal reporter 的进度/汇总是按整个会话统计的，这里改为按 mutant 输出，所以把它摘掉；
+        # 只摘掉 reporter 实例，terminal 插件本身的钩子（如 pytest_report_teststatus）其他插件仍在用
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            config.pluginmanager.unregister(reporter)
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            print(f"ERROR collecting {report.nodeid}")
+            print(report.longreprtext)
+            self.collection_errors.append((report.nodeid, report.longreprtext))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        self.startup_seconds = time.perf_counter() - self._t0
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(f"{session.testsfailed} error(s) during collection")
+        if session.config.option.collectonly:
+            return True
+
+        for name, func in self.mutants:
+            items = self.select(name, session.items) if self.select else session.items
+            self.activate(name, func)
+            self._reset_counters()
+            self.planned = len(items)
+            t = time.perf_counter()
+            for i, item in enumerate(items):
+                # kill 模式下已经出现失败时，当前用例作为最后一个运行：
+                # nextitem=None 让 pytest 在它的 teardown 中拆掉已建立的全部 fixture
+                last = i + 1 == len(items) or (self.stop_on_first_failure and self._failed)
+                item.ihook.pytest_runtest_protocol(item=item, nextitem=None if last else items[i + 1])
+                self.ran += 1
+                if last:
+                    break
+            elapsed = time.perf_counter() - t
+
+            if not items:
+                rc = 5
+            elif self._failed:
+                rc = 1
+            else:
+                rc = 0
+            self._print_mutant_summary(elapsed)
+            self.results.append((name, rc, elapsed))
+            if self.finish is not None:
+                self.finish(name, rc)
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self._failed += 1
+            self._letters.append("F" if report.when == "call" else "E")
+            self.failures.append(report)
+        elif report.when == "call":
+            if report.skipped:
+                self._letters.append("s")
+            else:
+                self._passed += 1
+                self._letters.append(".")
+        elif report.skipped:
+            self._letters.append("s")
+
+    # ---------------- 输出 ----------------
+    def _print_mutant_summary(self, elapsed):
+        print("".join(self._letters))
+        for rep in self.failures:
+            print(f"_____ {rep.nodeid} [{rep.when}] _____")
+            print(rep.longreprtext)
+        parts = []
+        if self._failed:
+            parts.append(f"{self._failed} failed")
+        if self._passed:
+            parts.append(f"{self._passed} passed")
+        if self.ran < self.planned:
+            parts.append(f"{self.planned - self.ran} skipped (kill mode)")
+        print(f"{', '.join(parts) or 'no tests ran'} in {elapsed:.2f}s")